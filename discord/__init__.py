@@ -25,7 +25,7 @@ from ._version import *
 # isort: on
 
 
-from . import abc, opus, sinks, ui, utils
+from . import abc, ui, utils
 from .activity import *
 from .appinfo import *
 from .application_role_connection import *
@@ -33,6 +33,7 @@ from .asset import *
 from .audit_logs import *
 from .automod import *
 from .bot import *
+from .broadcast import *
 from .channel import *
 from .client import *
 from .cog import *
@@ -60,7 +61,6 @@ from .object import *
 from .onboarding import *
 from .partial_emoji import *
 from .permissions import *
-from .player import *
 from .poll import *
 from .primary_guild import *
 from .raw_models import *
@@ -71,7 +71,6 @@ from .shard import *
 from .soundboard import *
 from .stage_instance import *
 from .sticker import *
-from .team import *
 from .template import *
 from .threads import *
 from .user import *
@@ -84,8 +83,11 @@ if TYPE_CHECKING:
 
     from typing_extensions import deprecated
 
-    from discord.voice import VoiceClient as VoiceClientC
-    from discord.voice import VoiceProtocol as VoiceProtocolC
+    from . import opus, sinks, voice
+    from .player import *
+    from .team import *
+    from .voice import VoiceClient as VoiceClientC
+    from .voice import VoiceProtocol as VoiceProtocolC
 
     C = TypeVar("C", bound=Client)
 
@@ -100,9 +102,38 @@ if TYPE_CHECKING:
     class VoiceProtocol(VoiceProtocolC[C], Generic[C]): ...
 
 else:
+    from importlib import import_module as _import_module
+
     from .utils import warn_deprecated
 
+    # the voice stack is only imported once it is used, it pulls in
+    # the opus and DAVE bindings as well as numpy if they are installed
+    _LAZY_MODULES = ("opus", "sinks", "voice")
+    _LAZY_ATTRIBUTES = {
+        "AudioSource": "player",
+        "PCMAudio": "player",
+        "FFmpegAudio": "player",
+        "FFmpegProcessPool": "player",
+        "FFmpegPCMAudio": "player",
+        "FFmpegOpusAudio": "player",
+        "OggOpusAudio": "player",
+        "OpusCache": "player",
+        "PCMVolumeTransformer": "player",
+        "PCMMixer": "player",
+        "MixerInput": "player",
+        "AudioQueue": "player",
+        "QueueEntry": "player",
+        "Team": "team",
+        "TeamMember": "team",
+    }
+
     def __getattr__(name: str) -> object:
+        if name in _LAZY_ATTRIBUTES:
+            module = _import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+            globals()[name] = value = getattr(module, name)
+            return value
+        if name in _LAZY_MODULES:
+            return _import_module(f".{name}", __name__)
         if name == "VoiceClient":
             warn_deprecated(
                 "discord.VoiceClient", "discord.voice.VoiceClient", "2.7", "3.0"
@@ -119,5 +150,15 @@ else:
             return VoiceProtocol
         raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+    def __dir__() -> list[str]:
+        return sorted({*globals(), *_LAZY_MODULES, *_LAZY_ATTRIBUTES})
+
+    # ``from discord import *`` keeps exporting everything it used to
+    __all__ = [
+        name
+        for name in (*globals(), "opus", "sinks", *_LAZY_ATTRIBUTES)
+        if not name.startswith("_")
+    ]
+
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
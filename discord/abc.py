@@ -28,6 +28,7 @@ from __future__ import annotations
 import asyncio
 import copy
 import time
+from collections import deque
 from collections.abc import Callable, Iterable, Sequence
 from typing import (
     TYPE_CHECKING,
@@ -47,7 +48,7 @@ from .errors import ClientException, InvalidArgument
 from .file import File, VoiceMessage
 from .flags import ChannelFlags, MessageFlags
 from .invite import Invite
-from .iterators import HistoryIterator, MessagePinIterator
+from .iterators import HistoryIterator, HistoryScanIterator, MessagePinIterator
 from .mentions import AllowedMentions
 from .object import Object
 from .partial_emoji import PartialEmoji, _EmojiTag
@@ -76,6 +77,7 @@ if TYPE_CHECKING:
         DMChannel,
         GroupChannel,
         PartialMessageable,
+        PurgeProgress,
         StageChannel,
         TextChannel,
         VoiceChannel,
@@ -114,11 +116,12 @@ if TYPE_CHECKING:
 MISSING = utils.MISSING
 
 
-async def _single_delete_strategy(
-    messages: Iterable[Message], *, reason: str | None = None
-):
-    for m in messages:
-        await m.delete(reason=reason)
+class _PurgeJob:
+    __slots__ = ("last_id", "finished")
+
+    def __init__(self, last_id: int) -> None:
+        self.last_id = last_id
+        self.finished = False
 
 
 async def _purge_messages_helper(
@@ -132,56 +135,123 @@ async def _purge_messages_helper(
     oldest_first: bool | None = False,
     bulk: bool = True,
     reason: str | None = None,
+    concurrency: int = 5,
+    progress: Callable[[PurgeProgress], Any] | None = None,
+    resume: PurgeProgress | None = None,
 ) -> list[Message]:
+    from .channel import PurgeProgress
+
     if check is MISSING:
         check = lambda m: True
+    if concurrency <= 0:
+        raise ValueError("concurrency must be greater than 0.")
+
+    if resume is None:
+        state = PurgeProgress(oldest_first=bool(oldest_first))
+    else:
+        state = resume
+        oldest_first = state.oldest_first
+        if state.checkpoint is not None:
+            if oldest_first:
+                after = Object(id=state.checkpoint)
+            else:
+                before = Object(id=state.checkpoint)
+        if limit is not None:
+            limit = max(limit - state.scanned, 0)
+    state._start()
 
+    # the history is fetched one page ahead while the previous one is deleted
     iterator = channel.history(
         limit=limit,
         before=before,
         after=after,
         oldest_first=oldest_first,
         around=around,
+        prefetch=1,
     )
     ret: list[Message] = []
-    count = 0
+    batch: list[Message] = []
+    jobs: deque[_PurgeJob] = deque()
+    tasks: list[asyncio.Task[None]] = []
+    failures: list[BaseException] = []
+    semaphore = asyncio.Semaphore(concurrency)
 
     minimum_time = int((time.time() - 14 * 24 * 60 * 60) * 1000.0 - 1420070400000) << 22
-    strategy = channel.delete_messages if bulk else _single_delete_strategy
-
-    async for message in iterator:
-        if count == 100:
-            to_delete = ret[-100:]
-            await strategy(to_delete, reason=reason)
-            count = 0
-            await asyncio.sleep(1)
-
-        if not check(message):
-            continue
-
-        if message.id < minimum_time:
-            # older than 14 days old
-            if count == 1:
-                await ret[-1].delete(reason=reason)
-            elif count >= 2:
-                to_delete = ret[-count:]
-                await strategy(to_delete, reason=reason)
-
-            count = 0
-            strategy = _single_delete_strategy
-
-        count += 1
-        ret.append(message)
-
-    # Some messages remaining to poll
-    if count >= 2:
-        # more than 2 messages -> bulk delete
-        to_delete = ret[-count:]
-        await strategy(to_delete, reason=reason)
-    elif count == 1:
-        # delete a single message
-        await ret[-1].delete(reason=reason)
 
+    async def run(coro, job: _PurgeJob, count: int) -> None:
+        try:
+            await coro
+        except BaseException as exc:
+            failures.append(exc)
+            return
+        finally:
+            semaphore.release()
+
+        state.deleted += count
+        if count > 1:
+            state.bulk_requests += 1
+        else:
+            state.single_requests += 1
+
+        # the checkpoint only moves past requests that finished in order
+        job.finished = True
+        while jobs and jobs[0].finished:
+            state.checkpoint = jobs.popleft().last_id
+
+        if progress is not None:
+            await utils.maybe_coroutine(progress, state)
+
+    async def submit(messages: list[Message]) -> None:
+        await semaphore.acquire()
+        if len(messages) > 1:
+            coro = channel.delete_messages(messages, reason=reason)
+        else:
+            coro = messages[0].delete(reason=reason)
+        job = _PurgeJob(messages[-1].id)
+        jobs.append(job)
+        tasks.append(asyncio.ensure_future(run(coro, job, len(messages))))
+
+    last_id: int | None = None
+    try:
+        async for message in iterator:
+            state.scanned += 1
+            last_id = message.id
+            if failures:
+                break
+
+            if not check(message):
+                if not batch and not jobs:
+                    state.checkpoint = message.id
+                continue
+
+            ret.append(message)
+            if not bulk or message.id < minimum_time:
+                # older than 14 days old, these can't be bulk deleted
+                if batch:
+                    await submit(batch)
+                    batch = []
+                await submit([message])
+                continue
+
+            batch.append(message)
+            if len(batch) == 100:
+                await submit(batch)
+                batch = []
+
+        if batch and not failures:
+            await submit(batch)
+
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        if iterator._prefetcher is not None:
+            iterator._prefetcher.cancel()
+
+    if failures:
+        raise failures[0]
+    if last_id is not None:
+        state.checkpoint = last_id
     return ret
 
 
@@ -1927,6 +1997,7 @@ class Messageable:
         after: SnowflakeTime | None = None,
         around: SnowflakeTime | None = None,
         oldest_first: bool | None = None,
+        prefetch: int = 0,
     ) -> HistoryIterator:
         """Returns an :class:`~discord.AsyncIterator` that enables receiving the destination's message history.
 
@@ -1955,6 +2026,12 @@ class Messageable:
         oldest_first: Optional[:class:`bool`]
             If set to ``True``, return messages in oldest->newest order. Defaults to ``True`` if
             ``after`` is specified, otherwise ``False``.
+        prefetch: :class:`int`
+            The number of pages of 100 messages to request in the background while
+            the current page is consumed. Pages are only requested ahead while the
+            rate limit bucket has requests left. Defaults to ``0``.
+
+            .. versionadded:: 2.9
 
         Yields
         ------
@@ -1992,6 +2069,74 @@ class Messageable:
             after=after,
             around=around,
             oldest_first=oldest_first,
+            prefetch=prefetch,
+        )
+
+    def scan_history(
+        self,
+        *,
+        after: SnowflakeTime,
+        before: SnowflakeTime | None = None,
+        windows: int = 4,
+        prefetch: int = 1,
+        oldest_first: bool = True,
+    ) -> HistoryScanIterator:
+        """Returns an :class:`~discord.AsyncIterator` that scans a range of the destination's
+        message history, e.g. for bulk exports.
+
+        The range is split into ``windows`` equally long time windows that are paginated
+        independently. All requests share the channel's rate limit bucket, so they are
+        still sent one after the other, but every window keeps ``prefetch`` pages
+        buffered while the messages before it are consumed. Messages are still yielded
+        in order.
+
+        You must have :attr:`~discord.Permissions.read_message_history` permissions to use this.
+
+        .. versionadded:: 2.9
+
+        Parameters
+        ----------
+        after: Union[:class:`~discord.abc.Snowflake`, :class:`datetime.datetime`]
+            Retrieve messages after this date or message.
+            If a datetime is provided, it is recommended to use a UTC aware datetime.
+            If the datetime is naive, it is assumed to be local time.
+        before: Optional[Union[:class:`~discord.abc.Snowflake`, :class:`datetime.datetime`]]
+            Retrieve messages before this date or message. Defaults to now.
+        windows: :class:`int`
+            The number of windows to split the range into.
+        prefetch: :class:`int`
+            The number of pages of 100 messages buffered for each window.
+        oldest_first: :class:`bool`
+            Whether to return messages in oldest->newest order. Defaults to ``True``.
+
+        Yields
+        ------
+        :class:`~discord.Message`
+            The message with the message data parsed.
+
+        Raises
+        ------
+        ~discord.Forbidden
+            You do not have permissions to get channel message history.
+        ~discord.HTTPException
+            The request to get message history failed.
+
+        Examples
+        --------
+
+        Usage ::
+
+            week_ago = discord.utils.utcnow() - datetime.timedelta(days=7)
+            async for message in channel.scan_history(after=week_ago, windows=8):
+                export(message)
+        """
+        return HistoryScanIterator(
+            self,
+            after=after,
+            before=before,
+            windows=windows,
+            prefetch=prefetch,
+            oldest_first=oldest_first,
         )
 
 
@@ -87,6 +87,12 @@ class AssetMixin:
 
         Saves this asset into a file-like object.
 
+        The asset is streamed into the file instead of being read into memory
+        first, and served from the client's CDN cache if it has one.
+
+        .. versionchanged:: 2.9
+            The asset is streamed into the file.
+
         Parameters
         ----------
         fp: Union[:class:`io.BufferedIOBase`, :class:`os.PathLike`]
@@ -111,16 +117,13 @@ class AssetMixin:
         NotFound
             The asset was deleted.
         """
+        if self._state is None:
+            raise DiscordException("Invalid state (no ConnectionState provided)")
 
-        data = await self.read()
-        if isinstance(fp, io.BufferedIOBase):
-            written = fp.write(data)
-            if seek_begin:
-                fp.seek(0)
-            return written
-        else:
-            with open(fp, "wb") as f:
-                return f.write(data)
+        written = await self._state.http.save_from_cdn(self.url, fp)
+        if seek_begin and isinstance(fp, io.BufferedIOBase):
+            fp.seek(0)
+        return written
 
 
 class Asset(AssetMixin):
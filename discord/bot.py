@@ -29,9 +29,13 @@ import asyncio
 import collections
 import collections.abc
 import copy
+import hashlib
 import inspect
+import json
 import logging
+import os
 import sys
+import tempfile
 import traceback
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Coroutine, Generator, Mapping
@@ -77,6 +81,7 @@ CFT = TypeVar("CFT", bound=CoroFunc)
 
 __all__ = (
     "ApplicationCommandMixin",
+    "CommandSyncCache",
     "Bot",
     "AutoShardedBot",
 )
@@ -84,6 +89,273 @@ __all__ = (
 _log = logging.getLogger(__name__)
 
 
+class CommandSyncCache:
+    """A store of fingerprints of the command payloads that were last synced.
+
+    :meth:`.Bot.sync_commands` compares the canonical payloads of every command
+    set, either global or for a single guild, against the fingerprint stored
+    here. Sets that did not change since the last sync are not fetched from the
+    API at all, the ids of their commands are restored from the cache instead.
+
+    .. versionadded:: 2.9
+
+    Parameters
+    ----------
+    path: Optional[Union[:class:`str`, :class:`os.PathLike`]]
+        The JSON file the fingerprints are persisted to, so that they survive
+        restarts. If this is ``None``, the fingerprints are only kept in memory
+        and only reconnects of the same process benefit from them.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        self.path: str | None = os.fspath(path) if path is not None else None
+        self._entries: dict[str, dict[str, dict[str, Any]]] = {}
+        self._dirty: bool = False
+        if self.path is not None:
+            self.load()
+
+    @staticmethod
+    def _scope(guild_id: int | None) -> str:
+        return "global" if guild_id is None else str(guild_id)
+
+    @staticmethod
+    def fingerprint(payloads: list[dict[str, Any]]) -> str:
+        """Computes the fingerprint of a set of command payloads.
+
+        The payloads are serialized with sorted keys and then sorted themselves,
+        so the fingerprint does not depend on registration order.
+
+        Parameters
+        ----------
+        payloads: List[Dict[:class:`str`, Any]]
+            The payloads, as returned by :meth:`.ApplicationCommand.to_dict`.
+
+        Returns
+        -------
+        :class:`str`
+            The hex digest of the payloads.
+        """
+        canonical = sorted(
+            (
+                json.dumps(payload, sort_keys=True, separators=(",", ":"))
+                for payload in payloads
+            ),
+        )
+        digest = hashlib.sha256()
+        for item in canonical:
+            digest.update(item.encode("utf-8"))
+            digest.update(b"\n")
+        return digest.hexdigest()
+
+    def get(
+        self, application_id: int, guild_id: int | None, fingerprint: str
+    ) -> list[interactions.ApplicationCommand] | None:
+        """Gets the commands stored for a command set if its fingerprint still matches.
+
+        Parameters
+        ----------
+        application_id: :class:`int`
+            The id of the application the commands belong to.
+        guild_id: Optional[:class:`int`]
+            The guild of the command set, or ``None`` for global commands.
+        fingerprint: :class:`str`
+            The current fingerprint of the command set.
+
+        Returns
+        -------
+        Optional[List[Dict[:class:`str`, Any]]]
+            The partial command payloads, holding at least ``id``, ``name`` and
+            ``type``, or ``None`` if the command set changed or is unknown.
+        """
+        entry = self._entries.get(str(application_id), {}).get(self._scope(guild_id))
+        if entry is None or entry.get("fingerprint") != fingerprint:
+            return None
+        return [dict(cmd) for cmd in entry["commands"]]  # type: ignore
+
+    def set(
+        self,
+        application_id: int,
+        guild_id: int | None,
+        fingerprint: str,
+        commands: list[interactions.ApplicationCommand],
+    ) -> None:
+        """Stores the fingerprint of a command set and the commands registered for it.
+
+        Parameters
+        ----------
+        application_id: :class:`int`
+            The id of the application the commands belong to.
+        guild_id: Optional[:class:`int`]
+            The guild of the command set, or ``None`` for global commands.
+        fingerprint: :class:`str`
+            The fingerprint of the payloads that were synced.
+        commands: List[Dict[:class:`str`, Any]]
+            The commands as returned by the API.
+        """
+        stored = []
+        for cmd in commands:
+            partial = {"id": cmd["id"], "name": cmd["name"], "type": cmd.get("type", 1)}
+            if cmd.get("guild_id") is not None:
+                partial["guild_id"] = cmd["guild_id"]
+            stored.append(partial)
+        self._entries.setdefault(str(application_id), {})[self._scope(guild_id)] = {
+            "fingerprint": fingerprint,
+            "commands": stored,
+        }
+        self._dirty = True
+
+    def discard(self, application_id: int, guild_id: int | None = MISSING) -> None:
+        """Forgets the fingerprint of a command set, forcing it to be diffed on the next sync.
+
+        Parameters
+        ----------
+        application_id: :class:`int`
+            The id of the application the commands belong to.
+        guild_id: Optional[:class:`int`]
+            The guild of the command set, or ``None`` for global commands.
+            If this is not passed, every command set of the application is discarded.
+        """
+        entries = self._entries.get(str(application_id))
+        if entries is None:
+            return
+        if guild_id is MISSING:
+            del self._entries[str(application_id)]
+            self._dirty = True
+        elif entries.pop(self._scope(guild_id), None) is not None:
+            self._dirty = True
+
+    def clear(self) -> None:
+        """Forgets every stored fingerprint."""
+        self._entries.clear()
+        self._dirty = True
+
+    def load(self) -> None:
+        """Reads the fingerprints from :attr:`path`.
+
+        A missing, unreadable or outdated file is treated as an empty cache.
+        """
+        if self.path is None:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as fp:
+                data = json.load(fp)
+        except FileNotFoundError:
+            data = {}
+        except (OSError, ValueError) as exc:
+            _log.warning(
+                "Ignoring unreadable command sync cache %s: %s", self.path, exc
+            )
+            data = {}
+
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            data = {}
+        self._entries = data.get("applications", {})
+        self._dirty = False
+
+    def save(self) -> None:
+        """Writes the fingerprints to :attr:`path` if they changed.
+
+        The file is replaced atomically, so a crash while saving never leaves a
+        truncated cache behind.
+        """
+        if self.path is None or not self._dirty:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".commands-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                json.dump(
+                    {"version": self.VERSION, "applications": self._entries},
+                    fp,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        self._dirty = False
+
+
+class _CommandIndex:
+    """Maps ``(name, type, guild_id)`` to the top level command it belongs to.
+
+    Guild commands have one entry per guild, global commands use ``None`` as
+    their guild. Qualified names of subcommands are resolved through the root
+    command once and remembered afterwards.
+    """
+
+    __slots__ = ("_commands", "_paths")
+
+    def __init__(self) -> None:
+        self._commands: dict[tuple[str, int, int | None], ApplicationCommand] = {}
+        self._paths: dict[tuple[str, int, int | None], ApplicationCommand] = {}
+
+    @staticmethod
+    def _keys(command: ApplicationCommand) -> list[tuple[str, int, int | None]]:
+        if command.guild_ids is None:
+            return [(command.name, command.type, None)]
+        return [
+            (command.name, command.type, guild_id) for guild_id in command.guild_ids
+        ]
+
+    def add(self, command: ApplicationCommand) -> None:
+        for key in self._keys(command):
+            self._commands[key] = command
+
+    def remove(self, command: ApplicationCommand) -> None:
+        for key in self._keys(command):
+            if self._commands.get(key) is command:
+                del self._commands[key]
+        self._paths.clear()
+
+    def rebuild(self, commands: list[ApplicationCommand]) -> None:
+        self._commands.clear()
+        self._paths.clear()
+        for command in commands:
+            self.add(command)
+
+    def get(
+        self, name: str, type: int, guild_id: int | None
+    ) -> ApplicationCommand | None:
+        names = name.split()
+        if not names:
+            return None
+        root = self._commands.get((names[0], type, guild_id))
+        if root is None or root.name != names[0]:
+            return None
+        if (root.guild_ids is None) is not (guild_id is None) or (
+            guild_id is not None and guild_id not in root.guild_ids
+        ):
+            # the guild ids were changed after the command was added
+            return None
+        if len(names) == 1:
+            return root
+
+        key = (name, type, guild_id)
+        command = self._paths.get(key)
+        if command is not None and command.qualified_name == name:
+            parent = command
+            while parent.parent is not None:
+                parent = parent.parent
+            if parent is root:
+                return command
+
+        command = root
+        for part in names[1:]:
+            if not isinstance(command, SlashCommandGroup):
+                return None
+            command = get(command.subcommands, name=part)
+            if command is None:
+                return None
+        self._paths[key] = command
+        return command
+
+
 class ApplicationCommandMixin(ABC):
     """A mixin that implements common functionality for classes that need
     application command compatibility.
@@ -101,6 +373,7 @@ class ApplicationCommandMixin(ABC):
         super().__init__(*args, **kwargs)
         self._pending_application_commands = []
         self._application_commands = {}
+        self._command_index = _CommandIndex()
 
     @property
     def all_commands(self):
@@ -155,6 +428,7 @@ class ApplicationCommandMixin(ABC):
                 self._application_commands[command.id] = command
                 break
         self._pending_application_commands.append(command)
+        self._command_index.add(command)
 
     def remove_application_command(
         self, command: ApplicationCommand
@@ -180,6 +454,7 @@ class ApplicationCommandMixin(ABC):
 
         if command in self._pending_application_commands:
             self._pending_application_commands.remove(command)
+            self._command_index.remove(command)
             return command
 
     @property
@@ -219,6 +494,19 @@ class ApplicationCommandMixin(ABC):
         Optional[:class:`.ApplicationCommand`]
             The command that was requested. If not found, returns ``None``.
         """
+        guild_id = guild_ids[0] if guild_ids else None
+        for command_type in (1, 2, 3):
+            command = self._command_index.get(name, command_type, guild_id)
+            if command is None or not isinstance(command, type):
+                continue
+            if guild_ids is not None and command.guild_ids != guild_ids:
+                continue
+            root = command
+            while root.parent is not None:
+                root = root.parent
+            if root.id is not None and self._application_commands.get(root.id) is root:
+                return command
+
         commands = self._application_commands.values()
         for command in commands:
             if command.name == name and isinstance(command, type):
@@ -699,6 +987,7 @@ class ApplicationCommandMixin(ABC):
         register_guild_commands: bool = True,
         check_guilds: list[int] | None = [],
         delete_existing: bool = True,
+        max_concurrency: int = 5,
     ) -> None:
         """|coro|
 
@@ -724,6 +1013,9 @@ class ApplicationCommandMixin(ABC):
             the commands accordingly, as it would have to individually check for each guild. To force the library to
             unregister a guild's commands, call this function with ``commands=[]`` and ``guild_ids=[guild_id]``.
 
+        If :attr:`~.Bot.command_sync_cache` is set, command sets whose payloads did not change since the last sync
+        are not fetched from the API at all. Changed guilds are synced concurrently, see ``max_concurrency``.
+
         .. versionadded:: 2.0
 
         Parameters
@@ -749,6 +1041,10 @@ class ApplicationCommandMixin(ABC):
             ``register_guild_commands`` is set to False, then this parameter is ignored.
         delete_existing: :class:`bool`
             Whether to delete existing commands that are not in the list of commands to register. Defaults to True.
+        max_concurrency: :class:`int`
+            The maximum number of guilds to sync at the same time. Defaults to 5.
+
+            .. versionadded:: 2.9
         """
 
         check_guilds = list(set((check_guilds or []) + (self._bot.debug_guilds or [])))
@@ -759,35 +1055,81 @@ class ApplicationCommandMixin(ABC):
         if guild_ids is not None:
             for cmd in commands:
                 cmd.guild_ids = guild_ids
+            self._command_index.rebuild(self._pending_application_commands)
+
+        cache: CommandSyncCache | None = getattr(self._bot, "command_sync_cache", None)
+        if force or not delete_existing or not self._bot.user:
+            # forced syncs and partial syncs say nothing about the full command set
+            cache = None
+
+        async def sync_scope(
+            scope_commands: list[ApplicationCommand], guild_id: int | None
+        ) -> list[interactions.ApplicationCommand]:
+            fingerprint = None
+            if cache is not None:
+                fingerprint = cache.fingerprint(
+                    [cmd.to_dict() for cmd in scope_commands]
+                )
+                cached = cache.get(self._bot.user.id, guild_id, fingerprint)
+                if cached is not None:
+                    _log.debug(
+                        "Skipping command sync for guild %s: Fingerprint is unchanged",
+                        guild_id,
+                    )
+                    return cached
+
+            registered = await self.register_commands(
+                scope_commands,
+                guild_id=guild_id,
+                method=method,
+                force=force,
+                delete_existing=delete_existing,
+            )
+            if cache is not None:
+                cache.set(self._bot.user.id, guild_id, fingerprint, registered)
+            return registered
 
         global_commands = [cmd for cmd in commands if cmd.guild_ids is None]
-        registered_commands = await self.register_commands(
-            global_commands, method=method, force=force, delete_existing=delete_existing
-        )
-
-        registered_guild_commands: dict[int, list[interactions.ApplicationCommand]] = {}
+        try:
+            registered_commands = await sync_scope(global_commands, None)
+
+            registered_guild_commands: dict[
+                int, list[interactions.ApplicationCommand]
+            ] = {}
+
+            if register_guild_commands:
+                cmd_guild_ids: list[int] = []
+                for cmd in commands:
+                    if cmd.guild_ids is not None:
+                        cmd_guild_ids.extend(cmd.guild_ids)
+                if check_guilds is not None:
+                    cmd_guild_ids.extend(check_guilds)
+
+                # guild command routes are rate limited per guild, the semaphore only
+                # keeps a bot with many guilds from flooding the global limit
+                semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+                async def sync_guild(guild_id: int) -> None:
+                    guild_commands = [
+                        cmd
+                        for cmd in commands
+                        if cmd.guild_ids is not None and guild_id in cmd.guild_ids
+                    ]
+                    async with semaphore:
+                        registered_guild_commands[guild_id] = await sync_scope(
+                            guild_commands, guild_id
+                        )
 
-        if register_guild_commands:
-            cmd_guild_ids: list[int] = []
-            for cmd in commands:
-                if cmd.guild_ids is not None:
-                    cmd_guild_ids.extend(cmd.guild_ids)
-            if check_guilds is not None:
-                cmd_guild_ids.extend(check_guilds)
-            for guild_id in set(cmd_guild_ids):
-                guild_commands = [
-                    cmd
-                    for cmd in commands
-                    if cmd.guild_ids is not None and guild_id in cmd.guild_ids
-                ]
-                app_cmds = await self.register_commands(
-                    guild_commands,
-                    guild_id=guild_id,
-                    method=method,
-                    force=force,
-                    delete_existing=delete_existing,
+                results = await asyncio.gather(
+                    *(sync_guild(guild_id) for guild_id in set(cmd_guild_ids)),
+                    return_exceptions=True,
                 )
-                registered_guild_commands[guild_id] = app_cmds
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+        finally:
+            if cache is not None:
+                cache.save()
 
         for i in registered_commands:
             cmd = get(
@@ -807,7 +1149,6 @@ class ApplicationCommandMixin(ABC):
                         lambda cmd: cmd.name == i["name"]
                         and cmd.type == i.get("type")
                         and cmd.guild_ids is not None
-                        and (guild_id := i.get("guild_id"))
                         and guild_id in cmd.guild_ids,
                         self.pending_application_commands,
                     )
@@ -859,23 +1200,26 @@ class ApplicationCommandMixin(ABC):
             if interaction.data:
                 command = self._application_commands[interaction.data["id"]]  # type: ignore
         except KeyError:
-            for cmd in self.application_commands + self.pending_application_commands:
-                if interaction.data:
-                    guild_id = interaction.data.get("guild_id")
-                    if guild_id:
-                        guild_id = int(guild_id)
-                    if cmd.name == interaction.data["name"] and (  # type: ignore
-                        guild_id == cmd.guild_ids
-                        or (
-                            isinstance(cmd.guild_ids, list)
-                            and guild_id in cmd.guild_ids
+            guild_id = interaction.data.get("guild_id")
+            key = (
+                interaction.data["name"],  # type: ignore
+                interaction.data.get("type", 1),
+                int(guild_id) if guild_id else None,
+            )
+            command = self._command_index.get(*key)
+            if command is None:
+                # commands may have been renamed or moved to other guilds in place
+                self._command_index.rebuild(self._pending_application_commands)
+                command = self._command_index.get(*key)
+            if command is None:
+                if auto_sync:
+                    cache = getattr(self._bot, "command_sync_cache", None)
+                    if cache is not None and self._bot.user:
+                        # the stored fingerprint is evidently stale
+                        cache.discard(
+                            self._bot.user.id,
+                            int(guild_id) if guild_id is not None else None,
                         )
-                    ):
-                        command = cmd
-                        break
-            else:
-                if auto_sync and interaction.data:
-                    guild_id = interaction.data.get("guild_id")
                     if guild_id is None:
                         await self.sync_commands()
                     else:
@@ -1328,6 +1672,12 @@ class BotBase(ApplicationCommandMixin, CogMixin, ABC):
         self.owner_id = options.get("owner_id")
         self.owner_ids = options.get("owner_ids", set())
         self.auto_sync_commands = options.get("auto_sync_commands", True)
+        command_sync_cache = options.pop("command_sync_cache", None)
+        if command_sync_cache is not None and not isinstance(
+            command_sync_cache, CommandSyncCache
+        ):
+            command_sync_cache = CommandSyncCache(command_sync_cache)
+        self.command_sync_cache: CommandSyncCache | None = command_sync_cache
 
         self.debug_guilds = options.pop("debug_guilds", None)
         self.default_command_contexts = options.pop(
@@ -1653,6 +2003,12 @@ class Bot(BotBase, Client):
         :attr:`.process_application_commands` if the command is not found. Defaults to ``True``.
 
         .. versionadded:: 2.0
+    command_sync_cache: Optional[:class:`CommandSyncCache`]
+        The fingerprints of the last synced command sets, used by :meth:`~.Bot.sync_commands` to skip fetching
+        command sets that did not change. A path can be passed instead to persist the fingerprints to that JSON file.
+        Defaults to ``None``, which always diffs the commands against the API.
+
+        .. versionadded:: 2.9
     default_command_contexts: Collection[:class:`InteractionContextType`]
         The default context types that the bot will use for commands.
         Defaults to a set containing :attr:`InteractionContextType.guild`, :attr:`InteractionContextType.bot_dm`, and
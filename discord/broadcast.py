@@ -0,0 +1,344 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from .errors import DiscordServerError
+
+if TYPE_CHECKING:
+    from .abc import Snowflake
+    from .http import HTTPClient
+
+__all__ = ("Broadcast",)
+
+_log = logging.getLogger(__name__)
+
+_RETRYABLE = (DiscordServerError, OSError, aiohttp.ClientError, asyncio.TimeoutError)
+
+
+class Broadcast:
+    """Represents a message being sent to many channels, see :meth:`Client.broadcast`.
+
+    The broadcast can be awaited to wait until every channel was either sent
+    to, failed or got skipped by :meth:`cancel`.
+
+    .. versionadded:: 2.9
+
+    Attributes
+    ----------
+    id: :class:`int`
+        The ID of the broadcast, unique for the lifetime of the client.
+    priority: :class:`int`
+        The priority of the broadcast. Broadcasts with a higher priority are
+        sent first.
+    total: :class:`int`
+        The number of channels the broadcast is sent to.
+    sent: Dict[:class:`int`, :class:`int`]
+        A mapping of channel IDs to the IDs of the messages sent to them.
+    failed: Dict[:class:`int`, :class:`Exception`]
+        A mapping of channel IDs to the exception that prevented sending to them.
+    retries: :class:`int`
+        The number of times a send is retried if Discord is having issues.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(
+        self,
+        scheduler: _BroadcastScheduler,
+        channel_ids: list[int],
+        body: bytes,
+        *,
+        priority: int = 0,
+        retries: int = 3,
+    ) -> None:
+        self.id: int = next(self._ids)
+        self.priority: int = priority
+        self.total: int = len(channel_ids)
+        self.sent: dict[int, int] = {}
+        self.failed: dict[int, Exception] = {}
+        self.retries: int = retries
+        self._scheduler = scheduler
+        self._channel_ids = channel_ids
+        self._body = body
+        self._skipped: int = 0
+        self._cancelled: bool = False
+        self._future: asyncio.Future[None] = scheduler.loop.create_future()
+        if not channel_ids:
+            self._future.set_result(None)
+        else:
+            scheduler._active.add(self)
+
+    def __repr__(self) -> str:
+        return (
+            f"<Broadcast id={self.id} priority={self.priority} total={self.total}"
+            f" sent={len(self.sent)} failed={len(self.failed)}>"
+        )
+
+    def __await__(self):
+        return self.wait().__await__()
+
+    @property
+    def pending(self) -> int:
+        """The number of channels that were neither sent to, failed nor skipped yet."""
+        return self.total - len(self.sent) - len(self.failed) - self._skipped
+
+    @property
+    def progress(self) -> float:
+        """The fraction of channels that are not pending anymore, between 0 and 1."""
+        if not self.total:
+            return 1.0
+        return 1 - self.pending / self.total
+
+    def done(self) -> bool:
+        """Whether every channel was sent to, failed or skipped."""
+        return self._future.done()
+
+    def cancelled(self) -> bool:
+        """Whether the broadcast was cancelled."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancels the broadcast.
+
+        Channels that were not sent to yet are skipped, sends that already
+        started are allowed to finish.
+        """
+        if self._cancelled or self.done():
+            return
+        self._cancelled = True
+        self._skipped += self._scheduler._discard(self)
+        self._check_done()
+
+    def _abort(self) -> None:
+        # the scheduler is closing, nothing that is pending will be sent
+        self._cancelled = True
+        self._skipped += self.pending
+        self._check_done()
+
+    async def wait(self) -> Broadcast:
+        """|coro|
+
+        Waits until the broadcast is done.
+
+        Returns
+        -------
+        :class:`Broadcast`
+            This broadcast.
+        """
+        await asyncio.shield(self._future)
+        return self
+
+    def _settle(self, channel_id: int, message_id: int | None, error=None) -> None:
+        if error is not None:
+            self.failed[channel_id] = error
+        elif message_id is not None:
+            self.sent[channel_id] = message_id
+        else:
+            self._skipped += 1
+        self._scheduler.dispatch("broadcast_progress", self)
+        self._check_done()
+
+    def _check_done(self) -> None:
+        if not self.pending and not self._future.done():
+            self._future.set_result(None)
+            self._scheduler._active.discard(self)
+            self._scheduler.dispatch("broadcast_complete", self)
+
+
+class _BroadcastScheduler:
+    """Sends the messages of every :class:`Broadcast` of a client.
+
+    Sends are started in order of priority at no more than ``rate`` per second
+    and with at most ``concurrency`` in flight, so the rest of the global rate
+    limit is left to other requests like interaction responses. Every channel
+    only has one send in flight at a time, the others wait without taking up
+    a slot.
+    """
+
+    def __init__(
+        self,
+        http: HTTPClient,
+        dispatch: Callable[..., Any],
+        *,
+        rate: float = 25.0,
+        concurrency: int = 10,
+    ) -> None:
+        self.http = http
+        self.loop = http.loop
+        self.dispatch = dispatch
+        self.rate = rate
+        self._semaphore = asyncio.Semaphore(concurrency)
+        # (-priority, sequence, broadcast, channel_id, attempt)
+        self._queue: list[tuple[int, int, Broadcast, int, int]] = []
+        self._blocked: dict[int, list[tuple[int, int, Broadcast, int, int]]] = {}
+        self._busy: set[int] = set()
+        self._sequence = itertools.count()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._runner: asyncio.Task[None] | None = None
+        self._retries: dict[tuple[int, int], asyncio.TimerHandle] = {}
+        self._active: set[Broadcast] = set()
+        self._closed: bool = False
+        self._next_send: float = 0.0
+        self.retry_delay: float = 1.0
+
+    def create(
+        self,
+        destinations: Iterable[Snowflake | int],
+        body: bytes,
+        *,
+        priority: int,
+        retries: int,
+    ) -> Broadcast:
+        channel_ids = list(
+            dict.fromkeys(
+                d if isinstance(d, int) else d.id for d in destinations  # type: ignore
+            )
+        )
+        broadcast = Broadcast(
+            self, channel_ids, body, priority=priority, retries=retries
+        )
+        for channel_id in channel_ids:
+            self._push(broadcast, channel_id, 0)
+        return broadcast
+
+    async def close(self) -> None:
+        """Stops sending and cancels every broadcast that is not done yet."""
+        self._closed = True
+        tasks = list(self._tasks)
+        if self._runner is not None:
+            tasks.append(self._runner)
+        for task in tasks:
+            task.cancel()
+        for handle in self._retries.values():
+            handle.cancel()
+        self._retries.clear()
+        self._queue.clear()
+        self._blocked.clear()
+
+        for broadcast in list(self._active):
+            broadcast._abort()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _push(self, broadcast: Broadcast, channel_id: int, attempt: int) -> None:
+        entry = (
+            -broadcast.priority,
+            next(self._sequence),
+            broadcast,
+            channel_id,
+            attempt,
+        )
+        heapq.heappush(self._queue, entry)
+        if self._runner is None or self._runner.done():
+            self._runner = self.loop.create_task(self._run())
+
+    def _discard(self, broadcast: Broadcast) -> int:
+        removed = len(self._queue)
+        self._queue = [e for e in self._queue if e[2] is not broadcast]
+        heapq.heapify(self._queue)
+        removed -= len(self._queue)
+        for channel_id, entries in list(self._blocked.items()):
+            kept = [e for e in entries if e[2] is not broadcast]
+            removed += len(entries) - len(kept)
+            self._blocked[channel_id] = kept
+        return removed
+
+    async def _throttle(self) -> None:
+        now = self.loop.time()
+        delay = self._next_send - now
+        self._next_send = max(now, self._next_send) + 1 / self.rate
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _run(self) -> None:
+        while self._queue:
+            await self._semaphore.acquire()
+            if not self._queue:
+                # a cancelled broadcast emptied the queue while waiting
+                self._semaphore.release()
+                break
+
+            entry = heapq.heappop(self._queue)
+            channel_id = entry[3]
+            if channel_id in self._busy:
+                self._blocked.setdefault(channel_id, []).append(entry)
+                self._semaphore.release()
+                continue
+
+            self._busy.add(channel_id)
+            await self._throttle()
+            task = self.loop.create_task(self._send(entry))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, entry: tuple[int, int, Broadcast, int, int]) -> None:
+        _, _, broadcast, channel_id, attempt = entry
+        try:
+            if broadcast.cancelled():
+                broadcast._settle(channel_id, None)
+                return
+            data = await self.http.send_serialized_message(channel_id, broadcast._body)
+        except _RETRYABLE as exc:
+            if attempt < broadcast.retries and not broadcast.cancelled():
+                delay = self.retry_delay * (1 + attempt * 2)
+                _log.debug(
+                    "Broadcast %s to channel %s failed, retrying in %s seconds.",
+                    broadcast.id,
+                    channel_id,
+                    delay,
+                )
+                self._retries[broadcast.id, channel_id] = self.loop.call_later(
+                    delay, self._retry, broadcast, channel_id, attempt
+                )
+            else:
+                broadcast._settle(channel_id, None, exc)
+        except Exception as exc:
+            broadcast._settle(channel_id, None, exc)
+        else:
+            broadcast._settle(channel_id, int(data["id"]))
+        finally:
+            self._busy.discard(channel_id)
+            self._semaphore.release()
+            blocked = self._blocked.pop(channel_id, None)
+            if blocked and not self._closed:
+                for e in blocked:
+                    heapq.heappush(self._queue, e)
+                if self._runner is None or self._runner.done():
+                    self._runner = self.loop.create_task(self._run())
+
+    def _retry(self, broadcast: Broadcast, channel_id: int, attempt: int) -> None:
+        del self._retries[broadcast.id, channel_id]
+        if broadcast.cancelled():
+            broadcast._settle(channel_id, None)
+        else:
+            self._push(broadcast, channel_id, attempt + 1)
@@ -26,6 +26,7 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import datetime
+import time
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from typing import (
     TYPE_CHECKING,
@@ -82,6 +83,7 @@ __all__ = (
     "MediaChannel",
     "ForumTag",
     "VoiceChannelEffectSendEvent",
+    "PurgeProgress",
 )
 
 if TYPE_CHECKING:
@@ -111,6 +113,87 @@ if TYPE_CHECKING:
     from .webhook import Webhook
 
 
+class PurgeProgress:
+    """Tracks the progress of a purge, see :meth:`TextChannel.purge`.
+
+    The purge passes it to its ``progress`` callback every time a delete
+    request finishes. An interrupted purge can be continued by passing it
+    back as ``resume``, or by constructing a new one from a stored
+    :attr:`checkpoint`.
+
+    .. versionadded:: 2.9
+
+    Parameters
+    ----------
+    checkpoint: Optional[:class:`int`]
+        The ID of the message to continue purging from.
+    oldest_first: :class:`bool`
+        Whether the purge the checkpoint belongs to went from oldest to newest.
+
+    Attributes
+    ----------
+    checkpoint: Optional[:class:`int`]
+        The ID of the last message that was handled. Every message up to and
+        including it was either deleted or skipped by ``check``.
+    oldest_first: :class:`bool`
+        Whether the purge goes from oldest to newest.
+    scanned: :class:`int`
+        The number of messages retrieved from the history so far.
+    deleted: :class:`int`
+        The number of messages deleted so far.
+    bulk_requests: :class:`int`
+        The number of bulk delete requests that finished.
+    single_requests: :class:`int`
+        The number of single delete requests that finished.
+    """
+
+    __slots__ = (
+        "checkpoint",
+        "oldest_first",
+        "scanned",
+        "deleted",
+        "bulk_requests",
+        "single_requests",
+        "_started_at",
+        "_deleted_at_start",
+    )
+
+    def __init__(
+        self, *, checkpoint: int | None = None, oldest_first: bool = False
+    ) -> None:
+        self.checkpoint: int | None = checkpoint
+        self.oldest_first: bool = oldest_first
+        self.scanned: int = 0
+        self.deleted: int = 0
+        self.bulk_requests: int = 0
+        self.single_requests: int = 0
+        self._started_at: float = time.perf_counter()
+        self._deleted_at_start: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<PurgeProgress checkpoint={self.checkpoint} scanned={self.scanned}"
+            f" deleted={self.deleted} rate={self.rate:.2f}>"
+        )
+
+    def _start(self) -> None:
+        self._started_at = time.perf_counter()
+        self._deleted_at_start = self.deleted
+
+    @property
+    def elapsed(self) -> float:
+        """The number of seconds since the purge (re)started."""
+        return time.perf_counter() - self._started_at
+
+    @property
+    def rate(self) -> float:
+        """The number of messages deleted per second since the purge (re)started."""
+        elapsed = self.elapsed
+        if elapsed <= 0:
+            return 0.0
+        return (self.deleted - self._deleted_at_start) / elapsed
+
+
 class ForumTag(Hashable):
     """Represents a forum tag that can be added to a thread inside a :class:`ForumChannel`
     .
@@ -424,6 +507,9 @@ class _TextChannel(discord.abc.GuildChannel, Hashable):
         oldest_first: bool | None = False,
         bulk: bool = True,
         reason: str | None = None,
+        concurrency: int = 5,
+        progress: Callable[[PurgeProgress], Any] | None = None,
+        resume: PurgeProgress | None = None,
     ) -> list[Message]:
         """|coro|
 
@@ -458,6 +544,21 @@ class _TextChannel(discord.abc.GuildChannel, Hashable):
             fall back to single delete if messages are older than two weeks.
         reason: Optional[:class:`str`]
             The reason for deleting the messages. Shows up on the audit log.
+        concurrency: :class:`int`
+            The maximum number of delete requests in flight. The next page of the
+            history is fetched while the previous one is being deleted.
+
+            .. versionadded:: 2.9
+        progress: Optional[Callable[[:class:`.PurgeProgress`], Any]]
+            A function called with the progress of the purge every time a delete
+            request finishes. Could be a |coroutine_link|_.
+
+            .. versionadded:: 2.9
+        resume: Optional[:class:`.PurgeProgress`]
+            The progress of an interrupted purge to continue from. ``oldest_first``
+            is taken from it and ``limit`` includes the messages it already scanned.
+
+            .. versionadded:: 2.9
 
         Returns
         -------
@@ -492,6 +593,9 @@ class _TextChannel(discord.abc.GuildChannel, Hashable):
             oldest_first=oldest_first,
             bulk=bulk,
             reason=reason,
+            concurrency=concurrency,
+            progress=progress,
+            resume=resume,
         )
 
     async def webhooks(self) -> list[Webhook]:
@@ -1927,6 +2031,9 @@ class VoiceChannel(discord.abc.Messageable, VocalGuildChannel):
         oldest_first: bool | None = False,
         bulk: bool = True,
         reason: str | None = None,
+        concurrency: int = 5,
+        progress: Callable[[PurgeProgress], Any] | None = None,
+        resume: PurgeProgress | None = None,
     ) -> list[Message]:
         """|coro|
 
@@ -1961,6 +2068,21 @@ class VoiceChannel(discord.abc.Messageable, VocalGuildChannel):
             fall back to single delete if messages are older than two weeks.
         reason: Optional[:class:`str`]
             The reason for deleting the messages. Shows up on the audit log.
+        concurrency: :class:`int`
+            The maximum number of delete requests in flight. The next page of the
+            history is fetched while the previous one is being deleted.
+
+            .. versionadded:: 2.9
+        progress: Optional[Callable[[:class:`.PurgeProgress`], Any]]
+            A function called with the progress of the purge every time a delete
+            request finishes. Could be a |coroutine_link|_.
+
+            .. versionadded:: 2.9
+        resume: Optional[:class:`.PurgeProgress`]
+            The progress of an interrupted purge to continue from. ``oldest_first``
+            is taken from it and ``limit`` includes the messages it already scanned.
+
+            .. versionadded:: 2.9
 
         Returns
         -------
@@ -1995,6 +2117,9 @@ class VoiceChannel(discord.abc.Messageable, VocalGuildChannel):
             oldest_first=oldest_first,
             bulk=bulk,
             reason=reason,
+            concurrency=concurrency,
+            progress=progress,
+            resume=resume,
         )
 
     async def webhooks(self) -> list[Webhook]:
@@ -2515,6 +2640,9 @@ class StageChannel(discord.abc.Messageable, VocalGuildChannel):
         oldest_first: bool | None = False,
         bulk: bool = True,
         reason: str | None = None,
+        concurrency: int = 5,
+        progress: Callable[[PurgeProgress], Any] | None = None,
+        resume: PurgeProgress | None = None,
     ) -> list[Message]:
         """|coro|
 
@@ -2549,6 +2677,21 @@ class StageChannel(discord.abc.Messageable, VocalGuildChannel):
             fall back to single delete if messages are older than two weeks.
         reason: Optional[:class:`str`]
             The reason for deleting the messages. Shows up on the audit log.
+        concurrency: :class:`int`
+            The maximum number of delete requests in flight. The next page of the
+            history is fetched while the previous one is being deleted.
+
+            .. versionadded:: 2.9
+        progress: Optional[Callable[[:class:`.PurgeProgress`], Any]]
+            A function called with the progress of the purge every time a delete
+            request finishes. Could be a |coroutine_link|_.
+
+            .. versionadded:: 2.9
+        resume: Optional[:class:`.PurgeProgress`]
+            The progress of an interrupted purge to continue from. ``oldest_first``
+            is taken from it and ``limit`` includes the messages it already scanned.
+
+            .. versionadded:: 2.9
 
         Returns
         -------
@@ -2583,6 +2726,9 @@ class StageChannel(discord.abc.Messageable, VocalGuildChannel):
             oldest_first=oldest_first,
             bulk=bulk,
             reason=reason,
+            concurrency=concurrency,
+            progress=progress,
+            resume=resume,
         )
 
     async def webhooks(self) -> list[Webhook]:
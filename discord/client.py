@@ -27,10 +27,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import signal
 import sys
 import traceback
-from collections.abc import Callable, Coroutine, Generator, Sequence
+from collections.abc import Callable, Coroutine, Generator, Iterable, Sequence
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
@@ -46,14 +47,15 @@ from .activity import ActivityTypes, BaseActivity, create_activity
 from .appinfo import AppInfo, PartialAppInfo
 from .application_role_connection import ApplicationRoleConnectionMetadata
 from .backoff import ExponentialBackoff
+from .broadcast import Broadcast, _BroadcastScheduler
 from .channel import PartialMessageable, _threaded_channel_factory
 from .emoji import AppEmoji, GuildEmoji
 from .enums import ChannelType, Status
 from .errors import *
-from .flags import ApplicationFlags, Intents
+from .flags import ApplicationFlags, Intents, MessageFlags
 from .gateway import *
 from .guild import Guild
-from .http import HTTPClient
+from .http import CDNCache, HTTPClient, ResponseCache
 from .invite import Invite
 from .iterators import EntitlementIterator, GuildIterator
 from .mentions import AllowedMentions
@@ -82,6 +84,7 @@ if TYPE_CHECKING:
     from .channel import (
         DMChannel,
     )
+    from .embeds import Embed
     from .interactions import Interaction
     from .member import Member
     from .message import Message
@@ -212,6 +215,32 @@ class Client:
         sync your system clock to Google's NTP server.
 
         .. versionadded:: 1.3
+    cached_routes: Optional[Dict[:class:`str`, :class:`float`]]
+        A mapping of API route path templates, like ``"/guilds/{guild_id}/roles"``, to the amount of
+        seconds their GET responses are served from memory. Requests that modify the same resource
+        drop the cached responses. Concurrent identical GET requests are always merged into one,
+        regardless of this option. The cache and its counters are available through
+        ``Client.http.response_cache``.
+
+        .. versionadded:: 2.9
+    cdn_cache: Optional[Union[:class:`str`, :class:`os.PathLike`, :class:`~discord.http.CDNCache`]]
+        A directory to cache files downloaded from the CDN in, like attachments and assets saved
+        with ``save()``. Files are keyed by their URL, ignoring the expiring signature of attachment
+        URLs, and the least recently used ones are evicted once the directory grows beyond 512 MiB.
+        Pass a ``discord.http.CDNCache`` to use a different limit. Concurrent downloads of the same
+        file are always merged into one, regardless of this option.
+
+        .. versionadded:: 2.9
+    max_cdn_downloads: :class:`int`
+        The maximum number of CDN downloads running at the same time. Defaults to ``8``.
+
+        .. versionadded:: 2.9
+    broadcast_rate: :class:`float`
+        The maximum number of messages per second :meth:`broadcast` starts sending, across
+        all broadcasts. The rest of the global rate limit is left to other requests, like
+        interaction responses. Defaults to ``25``.
+
+        .. versionadded:: 2.9
     enable_debug_events: :class:`bool`
         Whether to enable events that are useful only for debugging gateway related information.
 
@@ -264,12 +293,19 @@ class Client:
         proxy: str | None = options.pop("proxy", None)
         proxy_auth: aiohttp.BasicAuth | None = options.pop("proxy_auth", None)
         unsync_clock: bool = options.pop("assume_unsync_clock", True)
+        cached_routes: dict[str, float] | None = options.pop("cached_routes", None)
+        cdn_cache: str | os.PathLike | CDNCache | None = options.pop("cdn_cache", None)
+        if cdn_cache is not None and not isinstance(cdn_cache, CDNCache):
+            cdn_cache = CDNCache(os.fspath(cdn_cache))
         self.http: HTTPClient = HTTPClient(
             connector,
             proxy=proxy,
             proxy_auth=proxy_auth,
             unsync_clock=unsync_clock,
             loop=self.loop,
+            response_cache=ResponseCache(cached_routes),
+            cdn_cache=cdn_cache,
+            max_cdn_downloads=options.pop("max_cdn_downloads", 8),
         )
 
         self._handlers: dict[str, Callable] = {"ready": self._handle_ready}
@@ -278,6 +314,9 @@ class Client:
             "before_identify": self._call_before_identify_hook
         }
 
+        self._broadcast_rate: float = options.pop("broadcast_rate", 25.0)
+        self._broadcasts: _BroadcastScheduler | None = None
+
         self._enable_debug_events: bool = options.pop("enable_debug_events", False)
         self._connection: ConnectionState = self._get_state(**options)
         self._connection.shard_count = self.shard_count
@@ -786,6 +825,11 @@ class Client:
         if self._closed:
             return
 
+        if self._broadcasts is not None:
+            # nothing that is still queued can be sent once the session is gone
+            await self._broadcasts.close()
+            self._broadcasts = None
+
         await self.http.close()
         self._closed = True
 
@@ -1044,6 +1088,120 @@ class Client:
         """
         return PartialMessageable(state=self._connection, id=id, type=type)
 
+    def broadcast(
+        self,
+        destinations: Iterable[Snowflake | int],
+        content: Any = None,
+        *,
+        embed: Embed | None = None,
+        embeds: list[Embed] | None = None,
+        allowed_mentions: AllowedMentions | None = None,
+        silent: bool = False,
+        suppress_embeds: bool = False,
+        priority: int = 0,
+        retries: int = 3,
+    ) -> Broadcast:
+        """Sends the same message to many channels in the background.
+
+        The message is serialized once and sent with a bounded rate and concurrency,
+        see the ``broadcast_rate`` option, so other requests like interaction
+        responses are not starved of the global rate limit. Broadcasts with a higher
+        ``priority`` are sent first. Sends that fail because Discord is having issues
+        are retried.
+
+        Progress is reported through :func:`on_broadcast_progress` and
+        :func:`on_broadcast_complete`. Closing the client cancels every broadcast
+        that is not done yet.
+
+        .. versionadded:: 2.9
+
+        Parameters
+        ----------
+        destinations: Iterable[Union[:class:`abc.Snowflake`, :class:`int`]]
+            The channels, or their IDs, to send the message to.
+        content: Optional[:class:`str`]
+            The content of the message to send.
+        embed: Optional[:class:`.Embed`]
+            The rich embed for the content.
+        embeds: Optional[List[:class:`.Embed`]]
+            A list of embeds to send with the content. Maximum of 10.
+        allowed_mentions: Optional[:class:`.AllowedMentions`]
+            Controls the mentions being processed in this message, merged with
+            :attr:`allowed_mentions`.
+        silent: :class:`bool`
+            Whether to suppress push and desktop notifications for the message.
+        suppress_embeds: :class:`bool`
+            Whether to suppress embeds for the message.
+        priority: :class:`int`
+            The priority of this broadcast relative to other broadcasts.
+        retries: :class:`int`
+            How many times a send is retried when Discord returns a server error
+            or the connection fails.
+
+        Returns
+        -------
+        :class:`.Broadcast`
+            A handle to follow or cancel the broadcast. It can be awaited to wait
+            until it is done.
+
+        Raises
+        ------
+        InvalidArgument
+            You specified both ``embed`` and ``embeds``, or more than 10 embeds.
+
+        Example
+        -------
+
+        .. code-block:: python3
+
+            broadcast = client.broadcast(announcement_channels, "We're back online!")
+            await broadcast
+            print(f"Sent {len(broadcast.sent)} messages, {len(broadcast.failed)} failed")
+        """
+        if embed is not None and embeds is not None:
+            raise InvalidArgument(
+                "cannot pass both embed and embeds parameter to broadcast()"
+            )
+        if embed is not None:
+            embeds = [embed]
+        if embeds is not None and len(embeds) > 10:
+            raise InvalidArgument(
+                "embeds parameter must be a list of up to 10 elements"
+            )
+
+        payload: dict[str, Any] = {}
+        if content is not None:
+            payload["content"] = str(content)
+        if embeds:
+            payload["embeds"] = [e.to_dict() for e in embeds]
+
+        state_mentions = self._connection.allowed_mentions
+        if allowed_mentions is None:
+            mentions = state_mentions and state_mentions.to_dict()
+        elif state_mentions is not None:
+            mentions = state_mentions.merge(allowed_mentions).to_dict()
+        else:
+            mentions = allowed_mentions.to_dict()
+        if mentions:
+            payload["allowed_mentions"] = mentions
+
+        flags = MessageFlags(
+            suppress_embeds=suppress_embeds, suppress_notifications=silent
+        )
+        if flags.value:
+            payload["flags"] = flags.value
+
+        if self._broadcasts is None:
+            self._broadcasts = _BroadcastScheduler(
+                self.http, self.dispatch, rate=self._broadcast_rate
+            )
+        return self._broadcasts.create(
+            destinations,
+            utils._to_json_bytes(payload),
+            priority=priority,
+            retries=retries,
+        )
+
     def get_stage_instance(self, id: int, /) -> StageInstance | None:
         """Returns a stage instance with the given stage channel ID.
 
@@ -184,7 +184,11 @@ class ApplicationCommand(_BaseCommand, Generic[CogT, P, T]):
     cog = None
 
     def __init__(self, func: Callable, **kwargs) -> None:
-        from ..ext.commands.cooldowns import BucketType, CooldownMapping
+        from ..ext.commands.cooldowns import (
+            BucketType,
+            CooldownMapping,
+            _namespace_of,
+        )
 
         cooldown = getattr(func, "__commands_cooldown__", kwargs.get("cooldown"))
 
@@ -196,12 +200,15 @@ class ApplicationCommand(_BaseCommand, Generic[CogT, P, T]):
             raise TypeError("Cooldown must be an instance of CooldownMapping or None.")
 
         self._buckets: CooldownMapping = buckets
+        buckets._bind(_namespace_of(func))
 
         max_concurrency = getattr(
             func, "__commands_max_concurrency__", kwargs.get("max_concurrency")
         )
 
         self._max_concurrency: MaxConcurrency | None = max_concurrency
+        if max_concurrency is not None:
+            max_concurrency._bind(_namespace_of(func))
 
         self._callback = None
         self.module = None
@@ -1326,6 +1333,8 @@ class SlashCommandGroup(ApplicationCommand):
             raise TypeError("Cooldown must be an instance of CooldownMapping or None.")
 
         self._buckets: CooldownMapping = buckets
+        # groups have no callback, so stored cooldowns are shared by name
+        buckets._bind(f"{self.__class__.__qualname__}.{self.name}")
 
         # no need to getattr, since slash cmds groups can't be created using a decorator
 
@@ -1337,6 +1346,8 @@ class SlashCommandGroup(ApplicationCommand):
             )
 
         self._max_concurrency: MaxConcurrency | None = max_concurrency
+        if max_concurrency is not None:
+            max_concurrency._bind(f"{self.__class__.__qualname__}.{self.name}")
 
     @property
     def module(self) -> str | None:
@@ -24,11 +24,16 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import inspect
+import itertools
 import logging
 import sys
+import time
 import types
-from collections.abc import Awaitable, Callable, Iterable
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Iterator
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
@@ -112,6 +117,7 @@ __all__ = (
     "ThreadOption",
     "Option",
     "OptionChoice",
+    "AutocompleteCache",
     "option",
 )
 
@@ -531,6 +537,218 @@ class OptionChoice:
         return as_dict
 
 
+def _flatten_options(
+    options: list[dict[str, Any]], path: tuple[str, ...] = ()
+) -> Iterator[tuple[tuple[str, ...], Any]]:
+    # subcommands and groups wrap their options instead of having a value
+    for option in options:
+        name = (*path, option["name"])
+        if "options" in option:
+            yield from _flatten_options(option["options"], name)
+        else:
+            yield name, option.get("value")
+
+
+class AutocompleteCache:
+    """Caches the results of autocomplete functions.
+
+    Autocomplete interactions are sent on every keystroke, so the same partial
+    value is often completed several times within a few seconds. Wrapping an
+    autocomplete function with this cache serves those repeats from memory,
+    shares a single call between identical requests that are in flight at the
+    same time, and drops requests of a user as soon as a newer keystroke of
+    theirs arrives for the same function.
+
+    Results are keyed by the wrapped function, the command, the values of all
+    options sent with the interaction, including the options of subcommands,
+    and the ``scope``. At most 25 choices are
+    stored per entry, as no more can be sent.
+
+    .. versionadded:: 2.9
+
+    Parameters
+    ----------
+    ttl: :class:`float`
+        The amount of seconds a result is served from the cache.
+    maxsize: :class:`int`
+        The maximum number of results kept, the least recently used ones are
+        evicted first.
+    scope: Literal[``"user"``, ``"guild"``, ``"global"``]
+        Who a cached result is shared with. ``"user"`` only serves it to the
+        user that caused it, ``"guild"`` to every user of the same guild and
+        ``"global"`` to everyone. Defaults to ``"user"``.
+    drop_stale: :class:`bool`
+        Whether to stop handling a request of a user once a newer one for the
+        same function arrives. The stale interaction is not responded to.
+
+    Attributes
+    ----------
+    hits: :class:`int`
+        The amount of requests that were served from the cache.
+    misses: :class:`int`
+        The amount of requests that called the autocomplete function.
+    coalesced: :class:`int`
+        The amount of requests that waited for an identical request in flight.
+    dropped: :class:`int`
+        The amount of requests that were dropped for a newer keystroke.
+
+    Example
+    -------
+
+    .. code-block:: python3
+
+        tags = discord.AutocompleteCache(ttl=30, scope="guild")
+
+        @tags
+        async def search_tags(ctx: discord.AutocompleteContext):
+            return await db.search_tags(ctx.interaction.guild_id, ctx.value)
+
+        @bot.slash_command()
+        async def tag(ctx, name: discord.Option(str, autocomplete=search_tags)):
+            ...
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 10.0,
+        maxsize: int = 1024,
+        scope: Literal["user", "guild", "global"] = "user",
+        drop_stale: bool = True,
+    ) -> None:
+        if scope not in ("user", "guild", "global"):
+            raise ValueError("scope must be one of 'user', 'guild' or 'global'")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+
+        self.ttl: float = ttl
+        self.maxsize: int = maxsize
+        self.scope: str = scope
+        self.drop_stale: bool = drop_stale
+        self.hits: int = 0
+        self.misses: int = 0
+        self.coalesced: int = 0
+        self.dropped: int = 0
+
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, list[Any]]] = (
+            OrderedDict()
+        )
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[list[Any]]] = {}
+        self._waiters: dict[tuple[Any, ...], int] = {}
+        self._latest: dict[tuple[Any, int], asyncio.Future[None]] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"<AutocompleteCache scope={self.scope!r} ttl={self.ttl} size={len(self)}"
+            f" hit_rate={self.hit_rate:.2f}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of requests that did not have to call the autocomplete function."""
+        total = self.hits + self.misses + self.coalesced
+        if not total:
+            return 0.0
+        return (self.hits + self.coalesced) / total
+
+    def clear(self) -> None:
+        """Removes every cached result. Requests in flight are not affected."""
+        self._entries.clear()
+
+    def _key(self, func: Callable[..., Any], ctx: AutocompleteContext) -> tuple:
+        interaction = ctx.interaction
+        if self.scope == "user":
+            scope = getattr(interaction.user, "id", None)
+        elif self.scope == "guild":
+            scope = interaction.guild_id
+        else:
+            scope = None
+        values = tuple(_flatten_options((interaction.data or {}).get("options", [])))
+        command = ctx.command.qualified_name if ctx.command else None
+        return func, command, values, scope
+
+    async def _compute(self, key: tuple, func: Callable[..., Any], args) -> list[Any]:
+        try:
+            result = func(*args)
+            if inspect.isawaitable(result):
+                result = await result
+            choices = list(itertools.islice(result, 25))
+            self._entries[key] = (time.monotonic() + self.ttl, choices)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return choices
+        finally:
+            self._inflight.pop(key, None)
+
+    def _supersede(self, func: Callable[..., Any], ctx: AutocompleteContext):
+        user_id = getattr(ctx.interaction.user, "id", None)
+        if not self.drop_stale or user_id is None:
+            return None
+        previous = self._latest.get((func, user_id))
+        if previous is not None and not previous.done():
+            previous.set_result(None)
+        superseded = asyncio.get_running_loop().create_future()
+        self._latest[(func, user_id)] = superseded
+        return superseded
+
+    def _release(self, func: Callable[..., Any], ctx: AutocompleteContext, superseded):
+        if superseded is None:
+            return
+        user_id = getattr(ctx.interaction.user, "id", None)
+        if self._latest.get((func, user_id)) is superseded:
+            del self._latest[(func, user_id)]
+
+    def __call__(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        async def wrapped(*args: Any) -> list[Any]:
+            ctx: AutocompleteContext = args[-1]
+            key = self._key(func, ctx)
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+
+            superseded = self._supersede(func, ctx)
+            future = self._inflight.get(key)
+            if future is None:
+                self.misses += 1
+                future = self._inflight[key] = asyncio.ensure_future(
+                    self._compute(key, func, args)
+                )
+            else:
+                self.coalesced += 1
+
+            self._waiters[key] = self._waiters.get(key, 0) + 1
+            try:
+                if superseded is None:
+                    return await asyncio.shield(future)
+                await asyncio.wait(
+                    (future, superseded), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not future.done():
+                    self.dropped += 1
+                    if self._waiters[key] == 1:
+                        # nobody else is waiting for this result anymore
+                        future.cancel()
+                    raise asyncio.CancelledError
+                return future.result()
+            finally:
+                self._waiters[key] -= 1
+                if not self._waiters[key]:
+                    del self._waiters[key]
+                self._release(func, ctx, superseded)
+
+        return wrapped
+
+
 def option(name, input_type=None, **kwargs):
     """A decorator that can be used instead of typehinting :class:`.Option`.
 
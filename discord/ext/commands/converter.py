@@ -40,7 +40,6 @@ from typing import (
 )
 
 import discord
-from discord.utils import UNICODE_EMOJIS
 
 from .errors import *
 
@@ -189,6 +188,10 @@ class MemberConverter(IDConverter[discord.Member]):
     .. versionchanged:: 1.5.1
         This converter now lazily fetches members from the gateway and HTTP APIs,
         optionally caching the result if :attr:`.MemberCacheFlags.joined` is enabled.
+
+    .. versionchanged:: 2.9
+        Names are looked up in the member name index of the guild, and the gateway
+        is no longer queried for names in guilds that are fully chunked.
     """
 
     async def query_member_named(self, guild, argument):
@@ -220,11 +223,9 @@ class MemberConverter(IDConverter[discord.Member]):
                 guild._add_member(member)
             return member
 
-        # If we're not being rate limited then we can use the websocket to actually query
-        members = await guild.query_members(limit=1, user_ids=[user_id], cache=cache)
-        if not members:
-            return None
-        return members[0]
+        # If we're not being rate limited then we can use the websocket to actually query,
+        # lookups of concurrent invocations share the same request
+        return await guild.load_member(user_id, cache=cache)
 
     async def convert(self, ctx: Context, argument: str) -> discord.Member:
         bot = ctx.bot
@@ -255,7 +256,8 @@ class MemberConverter(IDConverter[discord.Member]):
 
             if user_id is not None:
                 result = await self.query_member_by_id(bot, guild, user_id)
-            else:
+            elif not guild.chunked:
+                # every member of a chunked guild is already in the name index
                 result = await self.query_member_named(guild, argument)
 
             if not result:
@@ -873,7 +875,7 @@ class PartialEmojiConverter(Converter[discord.PartialEmoji]):
                 id=emoji_id,
             )
 
-        if argument in UNICODE_EMOJIS:
+        if argument in discord.utils.UNICODE_EMOJIS:
             return discord.PartialEmoji.with_state(
                 ctx.bot._connection,
                 animated=False,
@@ -26,9 +26,19 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import heapq
+import itertools
+import os
+import struct
+import sys
+import tempfile
+import threading
 import time
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from contextlib import contextmanager
+from multiprocessing import shared_memory
 from typing import TYPE_CHECKING, Any, Deque, TypeVar
 
 import discord.abc
@@ -47,6 +57,9 @@ __all__ = (
     "CooldownMapping",
     "DynamicCooldownMapping",
     "MaxConcurrency",
+    "CooldownStore",
+    "MemoryCooldownStore",
+    "SharedMemoryCooldownStore",
 )
 
 C = TypeVar("C", bound="CooldownMapping")
@@ -206,24 +219,497 @@ class Cooldown:
         )
 
 
+def _namespace_of(func: Any) -> str:
+    # stored buckets are addressed by this, so it has to be the same in every process
+    func = getattr(func, "callback", func)
+    name = getattr(func, "__qualname__", None) or getattr(func, "__name__", "")
+    return f"{func.__module__}.{name}"
+
+
+class CooldownStore:
+    """The protocol for the storage of cooldowns and max concurrency.
+
+    By default, every :class:`CooldownMapping` and :class:`MaxConcurrency`
+    keeps its state in the process it runs in. Passing a store to them moves
+    their state into the store instead, e.g. to share cooldowns between the
+    processes of a clustered bot.
+
+    Buckets are addressed by a namespace, which is unique per command, and
+    the bucket key returned by the :class:`BucketType`. Keys must have a
+    :func:`repr` that is stable across processes, like the built-in bucket
+    types do.
+
+    Every method must be atomic. Implementations subclass this and implement
+    every method.
+
+    .. versionadded:: 2.9
+    """
+
+    def update_rate_limit(
+        self, namespace: str, key: Any, rate: int, per: float, current: float
+    ) -> float | None:
+        """Takes a token from a bucket, creating it if needed.
+
+        This follows the same rules as :meth:`Cooldown.update_rate_limit`.
+
+        Returns
+        -------
+        Optional[:class:`float`]
+            The retry-after time in seconds if rate limited.
+        """
+        raise NotImplementedError
+
+    def get_tokens(
+        self, namespace: str, key: Any, rate: int, per: float, current: float
+    ) -> int:
+        """Returns the number of tokens left in a bucket without taking one."""
+        raise NotImplementedError
+
+    def get_retry_after_many(
+        self, namespace: str, keys: Iterable[Any], current: float
+    ) -> dict[Any, float]:
+        """Returns the retry-after of many buckets in a single operation,
+        ``0.0`` for buckets that do not exist.
+        """
+        raise NotImplementedError
+
+    def reset(self, namespace: str, key: Any) -> None:
+        """Resets a bucket to its initial state."""
+        raise NotImplementedError
+
+    def acquire(self, namespace: str, key: Any, number: int) -> bool:
+        """Tries to take one of ``number`` concurrency slots, returning
+        whether it succeeded. This must not wait.
+        """
+        raise NotImplementedError
+
+    def release(self, namespace: str, key: Any) -> None:
+        """Gives back a concurrency slot taken by :meth:`acquire`."""
+        raise NotImplementedError
+
+
+class MemoryCooldownStore(CooldownStore):
+    """A :class:`CooldownStore` that keeps the state in the current process.
+
+    This behaves the same as using no store at all, but a single instance can
+    be shared by several commands.
+
+    .. versionadded:: 2.9
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[tuple[str, Any], Cooldown] = {}
+        self._expiry: list[tuple[float, int, tuple[str, Any], Cooldown]] = []
+        self._counter = itertools.count()
+        self._concurrency: dict[tuple[str, Any], int] = {}
+
+    def _expire(self, current: float) -> None:
+        expiry = self._expiry
+        buckets = self._buckets
+        while expiry and expiry[0][0] < current:
+            _, _, key, bucket = heapq.heappop(expiry)
+            if buckets.get(key) is not bucket:
+                continue
+            if current > bucket._last + bucket.per:
+                del buckets[key]
+            else:
+                heapq.heappush(
+                    expiry,
+                    (bucket._last + bucket.per, next(self._counter), key, bucket),
+                )
+
+    def _bucket(
+        self, namespace: str, key: Any, rate: int, per: float, current: float
+    ) -> Cooldown:
+        self._expire(current)
+        full_key = (namespace, key)
+        bucket = self._buckets.get(full_key)
+        if bucket is None or bucket.rate != rate or bucket.per != per:
+            bucket = self._buckets[full_key] = Cooldown(rate, per)
+            heapq.heappush(
+                self._expiry, (current + per, next(self._counter), full_key, bucket)
+            )
+        return bucket
+
+    def update_rate_limit(self, namespace, key, rate, per, current):
+        return self._bucket(namespace, key, rate, per, current).update_rate_limit(
+            current
+        )
+
+    def get_tokens(self, namespace, key, rate, per, current):
+        self._expire(current)
+        bucket = self._buckets.get((namespace, key))
+        return rate if bucket is None else bucket.get_tokens(current)
+
+    def get_retry_after_many(self, namespace, keys, current):
+        self._expire(current)
+        result = {}
+        for key in keys:
+            bucket = self._buckets.get((namespace, key))
+            result[key] = 0.0 if bucket is None else bucket.get_retry_after(current)
+        return result
+
+    def reset(self, namespace, key):
+        bucket = self._buckets.get((namespace, key))
+        if bucket is not None:
+            bucket.reset()
+
+    def acquire(self, namespace, key, number):
+        full_key = (namespace, key)
+        value = self._concurrency.get(full_key, 0)
+        if value >= number:
+            return False
+        self._concurrency[full_key] = value + 1
+        return True
+
+    def release(self, namespace, key):
+        full_key = (namespace, key)
+        value = self._concurrency.get(full_key, 0) - 1
+        if value > 0:
+            self._concurrency[full_key] = value
+        else:
+            self._concurrency.pop(full_key, None)
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class SharedMemoryCooldownStore(CooldownStore):
+    """A :class:`CooldownStore` that keeps the state in shared memory, so
+    that every process on the same machine that opens a store with the same
+    ``name`` shares the same cooldowns and concurrency limits.
+
+    The buckets live in a fixed size hash table, and every operation,
+    including batched lookups, holds a file lock for a few microseconds. When
+    the table is full, the least recently used bucket close to the new one is
+    replaced.
+
+    .. versionadded:: 2.9
+
+    .. note::
+
+        Concurrency slots of a process that crashed while running a command
+        are not given back until :meth:`clear` is called.
+
+    .. note::
+
+        Slots of running invocations are never replaced. If every slot close
+        to a new bucket is held by one, the operation raises
+        :exc:`RuntimeError` instead of bypassing the concurrency limit.
+
+    Parameters
+    ----------
+    name: :class:`str`
+        The name of the shared memory block. It is created by the first process
+        that opens the store.
+    capacity: :class:`int`
+        The amount of buckets the table holds, only used by the process that
+        creates it.
+    max_probes: :class:`int`
+        How many neighbouring slots are looked at to find a bucket.
+    """
+
+    _HEADER = struct.Struct("<4sII")
+    # key hash, window, last use, per, rate, tokens or running invocations
+    _SLOT = struct.Struct("<Qdddii")
+    _MAGIC = b"PCCD"
+    _VERSION = 1
+
+    def __init__(
+        self,
+        name: str = "pycord-cooldowns",
+        *,
+        capacity: int = 65536,
+        max_probes: int = 32,
+    ) -> None:
+        self.name: str = name
+        self.max_probes: int = max_probes
+        self._thread_lock = threading.Lock()
+        self._lock_fd: int = os.open(
+            os.path.join(tempfile.gettempdir(), f"{name}.lock"),
+            os.O_RDWR | os.O_CREAT,
+            0o600,
+        )
+
+        kwargs = {"track": False} if sys.version_info >= (3, 13) else {}
+        with self._locked():
+            try:
+                shm = shared_memory.SharedMemory(
+                    name,
+                    create=True,
+                    size=self._HEADER.size + capacity * self._SLOT.size,
+                    **kwargs,
+                )
+            except FileExistsError:
+                shm = shared_memory.SharedMemory(name, **kwargs)
+                magic, version, capacity = self._HEADER.unpack_from(shm.buf)
+                if magic != self._MAGIC or version != self._VERSION:
+                    shm.close()
+                    raise ValueError(f"{name!r} is not a cooldown store")
+            else:
+                self._HEADER.pack_into(shm.buf, 0, self._MAGIC, self._VERSION, capacity)
+
+            if not kwargs and os.name == "posix":
+                from multiprocessing import resource_tracker
+
+                # the block has to outlive this process, see python/cpython#82300
+                resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore
+
+        self.capacity: int = capacity
+        self._shm = shm
+        self._buf = shm.buf
+
+    @contextmanager
+    def _locked(self):
+        with self._thread_lock:
+            _lock_file(self._lock_fd)
+            try:
+                yield
+            finally:
+                _unlock_file(self._lock_fd)
+
+    @staticmethod
+    def _hash(namespace: str, key: Any) -> int:
+        digest = hashlib.blake2b(repr((namespace, key)).encode(), digest_size=8)
+        # 0 marks a slot that was never used
+        return int.from_bytes(digest.digest(), "little") or 1
+
+    def _offset(self, index: int) -> int:
+        return self._HEADER.size + index * self._SLOT.size
+
+    def _find(
+        self, key_hash: int, current: float, *, create: bool
+    ) -> tuple[int, tuple[Any, ...] | None]:
+        """Returns the offset of the slot of a bucket together with its
+        contents, or ``None`` as the contents if the bucket does not exist.
+
+        The offset is -1 if the bucket does not exist and either ``create``
+        is not set or every slot close to it is held by a running invocation.
+        """
+        slot = self._SLOT
+        buf = self._buf
+        start = key_hash % self.capacity
+        reusable = -1
+        oldest = -1
+        oldest_use = float("inf")
+        for i in range(min(self.max_probes, self.capacity)):
+            offset = self._offset((start + i) % self.capacity)
+            data = slot.unpack_from(buf, offset)
+            if data[0] == key_hash:
+                return offset, data
+            if data[0] == 0:
+                return (offset if reusable == -1 else reusable), None
+            if reusable == -1:
+                _, _, last, per, _, value = data
+                if per < 0:
+                    # concurrency slots are only free once nothing runs anymore
+                    if value == 0:
+                        reusable = offset
+                elif current > last + per:
+                    reusable = offset
+                elif last < oldest_use:
+                    oldest, oldest_use = offset, last
+
+        if not create:
+            return -1, None
+        return (oldest if reusable == -1 else reusable), None
+
+    def _find_free(self, key_hash: int, current: float) -> tuple[int, tuple | None]:
+        offset, data = self._find(key_hash, current, create=True)
+        if offset == -1:
+            raise RuntimeError(
+                f"The cooldown store {self.name!r} has no free slot for a new bucket."
+            )
+        return offset, data
+
+    def update_rate_limit(self, namespace, key, rate, per, current):
+        key_hash = self._hash(namespace, key)
+        with self._locked():
+            offset, data = self._find_free(key_hash, current)
+            if data is None:
+                window, tokens = 0.0, rate
+            else:
+                _, window, _, _, _, tokens = data
+
+            if current > window + per:
+                tokens = rate
+            if tokens == rate:
+                window = current
+
+            retry_after = None
+            if tokens == 0:
+                retry_after = per - (current - window)
+            else:
+                tokens -= 1
+
+            self._SLOT.pack_into(
+                self._buf, offset, key_hash, window, current, per, rate, tokens
+            )
+            return retry_after
+
+    def get_tokens(self, namespace, key, rate, per, current):
+        key_hash = self._hash(namespace, key)
+        with self._locked():
+            _, data = self._find(key_hash, current, create=False)
+        if data is None:
+            return rate
+        _, window, _, _, _, tokens = data
+        return rate if current > window + per else tokens
+
+    def get_retry_after_many(self, namespace, keys, current):
+        hashes = {key: self._hash(namespace, key) for key in keys}
+        result = {}
+        with self._locked():
+            for key, key_hash in hashes.items():
+                _, data = self._find(key_hash, current, create=False)
+                retry_after = 0.0
+                if data is not None:
+                    _, window, _, per, _, tokens = data
+                    if tokens == 0 and current <= window + per:
+                        retry_after = per - (current - window)
+                result[key] = retry_after
+        return result
+
+    def reset(self, namespace, key):
+        key_hash = self._hash(namespace, key)
+        with self._locked():
+            offset, data = self._find(key_hash, time.time(), create=False)
+            if data is not None:
+                _, window, _, per, rate, _ = data
+                self._SLOT.pack_into(
+                    self._buf, offset, key_hash, window, 0.0, per, rate, rate
+                )
+
+    def acquire(self, namespace, key, number):
+        key_hash = self._hash(namespace, key)
+        with self._locked():
+            offset, data = self._find_free(key_hash, time.time())
+            value = 0 if data is None else data[5]
+            if value >= number:
+                return False
+            self._SLOT.pack_into(
+                self._buf, offset, key_hash, 0.0, 0.0, -1.0, number, value + 1
+            )
+            return True
+
+    def release(self, namespace, key):
+        key_hash = self._hash(namespace, key)
+        with self._locked():
+            offset, data = self._find(key_hash, time.time(), create=False)
+            if data is not None and data[5] > 0:
+                self._SLOT.pack_into(
+                    self._buf, offset, key_hash, 0.0, 0.0, -1.0, data[4], data[5] - 1
+                )
+
+    def clear(self) -> None:
+        """Removes every bucket and concurrency slot from the store."""
+        with self._locked():
+            size = self.capacity * self._SLOT.size
+            self._buf[self._HEADER.size : self._HEADER.size + size] = bytes(size)
+
+    def close(self) -> None:
+        """Detaches this process from the store, keeping it for the others."""
+        self._buf = None
+        self._shm.close()
+        os.close(self._lock_fd)
+
+    def unlink(self) -> None:
+        """Destroys the shared memory block once every process closed it."""
+        if sys.version_info < (3, 13) and os.name == "posix":
+            from multiprocessing import resource_tracker
+
+            # unlink() unregisters the block again, which was already done on open
+            resource_tracker.register(self._shm._name, "shared_memory")  # type: ignore
+        self._shm.unlink()
+
+
+class _StoredCooldown(Cooldown):
+    # a bucket whose state lives in a CooldownStore
+    __slots__ = ("_store", "_namespace", "_key")
+
+    def __init__(
+        self, store: CooldownStore, namespace: str, key: Any, rate: int, per: float
+    ) -> None:
+        super().__init__(rate, per)
+        self._store = store
+        self._namespace = namespace
+        self._key = key
+
+    def get_tokens(self, current: float | None = None) -> int:
+        return self._store.get_tokens(
+            self._namespace, self._key, self.rate, self.per, current or time.time()
+        )
+
+    def get_retry_after(self, current: float | None = None) -> float:
+        current = current or time.time()
+        return self._store.get_retry_after_many(self._namespace, [self._key], current)[
+            self._key
+        ]
+
+    def update_rate_limit(self, current: float | None = None) -> float | None:
+        return self._store.update_rate_limit(
+            self._namespace, self._key, self.rate, self.per, current or time.time()
+        )
+
+    def reset(self) -> None:
+        self._store.reset(self._namespace, self._key)
+
+    def __repr__(self) -> str:
+        return f"<Cooldown rate: {self.rate} per: {self.per} store: {self._store!r}>"
+
+
 class CooldownMapping:
     def __init__(
         self,
         original: Cooldown | None,
         type: Callable[[Message], Any],
+        *,
+        store: CooldownStore | None = None,
+        namespace: str | None = None,
     ) -> None:
         if not callable(type):
             raise TypeError("Cooldown type must be a BucketType or callable")
 
+        self._store: CooldownStore | None = store
+        self.namespace: str | None = namespace
+
         self._cache: dict[Any, Cooldown] = {}
+        # (expiry, tiebreaker, key, bucket), one entry per cached bucket
+        self._expiry: list[tuple[float, int, Any, Cooldown]] = []
+        self._counter = itertools.count()
         self._cooldown: Cooldown | None = original
         self._type: Callable[[Message], Any] = type
 
     def copy(self) -> CooldownMapping:
-        ret = CooldownMapping(self._cooldown, self._type)
-        ret._cache = self._cache.copy()
+        ret = CooldownMapping(
+            self._cooldown, self._type, store=self._store, namespace=self.namespace
+        )
+        ret._copy_cache(self)
         return ret
 
+    def _copy_cache(self, other: CooldownMapping) -> None:
+        self._cache = other._cache.copy()
+        self._expiry = other._expiry.copy()
+        self._counter = itertools.count(next(other._counter))
+
     @property
     def valid(self) -> bool:
         return self._cooldown is not None
@@ -232,9 +718,20 @@ class CooldownMapping:
     def type(self) -> Callable[[Message], Any]:
         return self._type
 
+    @property
+    def store(self) -> CooldownStore | None:
+        return self._store
+
     @classmethod
-    def from_cooldown(cls: type[C], rate, per, type) -> C:
-        return cls(Cooldown(rate, per), type)
+    def from_cooldown(
+        cls: type[C], rate, per, type, *, store=None, namespace=None
+    ) -> C:
+        return cls(Cooldown(rate, per), type, store=store, namespace=namespace)
+
+    def _bind(self, namespace: str) -> None:
+        # stored buckets are shared by every mapping with the same namespace
+        if self.namespace is None:
+            self.namespace = namespace
 
     def _bucket_key(self, msg: Message) -> Any:
         return self._type(msg)
@@ -243,29 +740,91 @@ class CooldownMapping:
         # we want to delete all cache objects that haven't been used
         # in a cooldown window. e.g. if we have a  command that has a
         # cooldown of 60s, and it has not been used in 60s then that key should be deleted
+        # buckets are indexed by the time they were last known to expire at, so only
+        # the ones that are due are looked at. A bucket that was used since is pushed
+        # back with its new expiry, which happens at most once per cooldown window.
         current = current or time.time()
-        dead_keys = [k for k, v in self._cache.items() if current > v._last + v.per]
-        for k in dead_keys:
-            del self._cache[k]
+        expiry = self._expiry
+        cache = self._cache
+        while expiry and expiry[0][0] < current:
+            _, _, key, bucket = heapq.heappop(expiry)
+            if cache.get(key) is not bucket:
+                continue
+            if current > bucket._last + bucket.per:
+                del cache[key]
+            else:
+                self._track(key, bucket, bucket._last + bucket.per)
+
+    def _track(self, key: Any, bucket: Cooldown, expires: float) -> None:
+        heapq.heappush(self._expiry, (expires, next(self._counter), key, bucket))
 
     def create_bucket(self, message: Message) -> Cooldown:
         return self._cooldown.copy()  # type: ignore
 
     def get_bucket(self, message: Message, current: float | None = None) -> Cooldown:
+        if self._store is not None:
+            bucket = self.create_bucket(message)
+            if bucket is None:
+                return bucket
+            return _StoredCooldown(
+                self._store,
+                self.namespace or "",
+                self._bucket_key(message),
+                bucket.rate,
+                bucket.per,
+            )
+
         if self._type is BucketType.default:
             return self._cooldown  # type: ignore
 
+        current = current or time.time()
         self._verify_cache_integrity(current)
         key = self._bucket_key(message)
         if key not in self._cache:
             bucket = self.create_bucket(message)
             if bucket is not None:
                 self._cache[key] = bucket
+                self._track(key, bucket, current + bucket.per)
         else:
             bucket = self._cache[key]
 
         return bucket
 
+    def get_retry_after_many(
+        self, keys: Iterable[Any], current: float | None = None
+    ) -> dict[Any, float]:
+        """Returns the retry-after of many buckets at once, without creating
+        buckets for keys that are not on cooldown.
+
+        .. versionadded:: 2.9
+
+        Parameters
+        ----------
+        keys: Iterable[Any]
+            The bucket keys to look up, as returned by the bucket type
+            (e.g. user IDs for :attr:`BucketType.user`).
+        current: Optional[:class:`float`]
+            The time in seconds since Unix epoch to calculate the retry-after at.
+            If not supplied then :func:`time.time()` is used.
+
+        Returns
+        -------
+        Dict[Any, :class:`float`]
+            The seconds until each bucket can be used again, ``0.0`` for keys
+            that are not rate limited.
+        """
+        current = current or time.time()
+        if self._store is not None:
+            return self._store.get_retry_after_many(self.namespace or "", keys, current)
+
+        self._verify_cache_integrity(current)
+        cache = self._cache
+        result = {}
+        for key in keys:
+            bucket = cache.get(key)
+            result[key] = 0.0 if bucket is None else bucket.get_retry_after(current)
+        return result
+
     def update_rate_limit(
         self, message: Message, current: float | None = None
     ) -> float | None:
@@ -275,14 +834,21 @@ class CooldownMapping:
 
 class DynamicCooldownMapping(CooldownMapping):
     def __init__(
-        self, factory: Callable[[Message], Cooldown], type: Callable[[Message], Any]
+        self,
+        factory: Callable[[Message], Cooldown],
+        type: Callable[[Message], Any],
+        *,
+        store: CooldownStore | None = None,
+        namespace: str | None = None,
     ) -> None:
-        super().__init__(None, type)
+        super().__init__(None, type, store=store, namespace=namespace)
         self._factory: Callable[[Message], Cooldown] = factory
 
     def copy(self) -> DynamicCooldownMapping:
-        ret = DynamicCooldownMapping(self._factory, self._type)
-        ret._cache = self._cache.copy()
+        ret = DynamicCooldownMapping(
+            self._factory, self._type, store=self._store, namespace=self.namespace
+        )
+        ret._copy_cache(self)
         return ret
 
     @property
@@ -354,13 +920,23 @@ class _Semaphore:
 
 
 class MaxConcurrency:
-    __slots__ = ("number", "per", "wait", "_mapping")
+    __slots__ = ("number", "per", "wait", "store", "namespace", "_mapping")
 
-    def __init__(self, number: int, *, per: BucketType, wait: bool) -> None:
+    def __init__(
+        self,
+        number: int,
+        *,
+        per: BucketType,
+        wait: bool,
+        store: CooldownStore | None = None,
+        namespace: str | None = None,
+    ) -> None:
         self._mapping: dict[Any, _Semaphore] = {}
         self.per: BucketType = per
         self.number: int = number
         self.wait: bool = wait
+        self.store: CooldownStore | None = store
+        self.namespace: str | None = namespace
 
         if number <= 0:
             raise ValueError("max_concurrency 'number' cannot be less than 1")
@@ -371,7 +947,17 @@ class MaxConcurrency:
             )
 
     def copy(self: MC) -> MC:
-        return self.__class__(self.number, per=self.per, wait=self.wait)
+        return self.__class__(
+            self.number,
+            per=self.per,
+            wait=self.wait,
+            store=self.store,
+            namespace=self.namespace,
+        )
+
+    def _bind(self, namespace: str) -> None:
+        if self.namespace is None:
+            self.namespace = namespace
 
     def __repr__(self) -> str:
         return (
@@ -384,6 +970,16 @@ class MaxConcurrency:
     async def acquire(self, message: Message) -> None:
         key = self.get_key(message)
 
+        if self.store is not None:
+            # other processes can't wake us up, so poll with a backoff instead
+            delay = 0.01
+            while not self.store.acquire(self.namespace or "", key, self.number):
+                if not self.wait:
+                    raise MaxConcurrencyReached(self.number, self.per)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 1.0)
+            return
+
         try:
             sem = self._mapping[key]
         except KeyError:
@@ -398,6 +994,10 @@ class MaxConcurrency:
         # But it might be more useful in the future
         key = self.get_key(message)
 
+        if self.store is not None:
+            self.store.release(self.namespace or "", key)
+            return
+
         try:
             sem = self._mapping[key]
         except KeyError:
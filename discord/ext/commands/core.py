@@ -60,8 +60,10 @@ from .cooldowns import (
     BucketType,
     Cooldown,
     CooldownMapping,
+    CooldownStore,
     DynamicCooldownMapping,
     MaxConcurrency,
+    _namespace_of,
 )
 from .errors import *
 
@@ -381,6 +383,7 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         else:
             raise TypeError("Cooldown must be an instance of CooldownMapping or None.")
         self._buckets: CooldownMapping = buckets
+        buckets._bind(_namespace_of(func))
 
         try:
             max_concurrency = func.__commands_max_concurrency__
@@ -388,6 +391,8 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             max_concurrency = kwargs.get("max_concurrency")
 
         self._max_concurrency: MaxConcurrency | None = max_concurrency
+        if max_concurrency is not None:
+            max_concurrency._bind(_namespace_of(func))
 
         self.require_var_positional: bool = kwargs.get("require_var_positional", False)
         self.ignore_extra: bool = kwargs.get("ignore_extra", True)
@@ -2315,6 +2320,8 @@ def cooldown(
     rate: int,
     per: float,
     type: BucketType | Callable[[Message], Any] = BucketType.default,
+    *,
+    store: CooldownStore | None = None,
 ) -> Callable[[T], T]:
     """A decorator that adds a cooldown to a command
 
@@ -2340,13 +2347,21 @@ def cooldown(
 
         .. versionchanged:: 1.7
             Callables are now supported for custom bucket types.
+    store: Optional[:class:`.CooldownStore`]
+        Where to keep the cooldown, e.g. to share it between processes.
+        Defaults to the current process.
+
+        .. versionadded:: 2.9
     """
 
     def decorator(func: Command | CoroFunc) -> Command | CoroFunc:
+        mapping = CooldownMapping(
+            Cooldown(rate, per), type, store=store, namespace=_namespace_of(func)
+        )
         if isinstance(func, (Command, ApplicationCommand)):
-            func._buckets = CooldownMapping(Cooldown(rate, per), type)
+            func._buckets = mapping
         else:
-            func.__commands_cooldown__ = CooldownMapping(Cooldown(rate, per), type)
+            func.__commands_cooldown__ = mapping
         return func
 
     return decorator  # type: ignore
@@ -2355,6 +2370,8 @@ def cooldown(
 def dynamic_cooldown(
     cooldown: BucketType | Callable[[Message], Any],
     type: BucketType = BucketType.default,
+    *,
+    store: CooldownStore | None = None,
 ) -> Callable[[T], T]:
     """A decorator that adds a dynamic cooldown to a command
 
@@ -2383,22 +2400,34 @@ def dynamic_cooldown(
         apply to this invocation or ``None`` if the cooldown should be bypassed.
     type: :class:`.BucketType`
         The type of cooldown to have.
+    store: Optional[:class:`.CooldownStore`]
+        Where to keep the cooldown, e.g. to share it between processes.
+        Defaults to the current process.
+
+        .. versionadded:: 2.9
     """
     if not callable(cooldown):
         raise TypeError("A callable must be provided")
 
     def decorator(func: Command | CoroFunc) -> Command | CoroFunc:
+        mapping = DynamicCooldownMapping(
+            cooldown, type, store=store, namespace=_namespace_of(func)
+        )
         if isinstance(func, Command):
-            func._buckets = DynamicCooldownMapping(cooldown, type)
+            func._buckets = mapping
         else:
-            func.__commands_cooldown__ = DynamicCooldownMapping(cooldown, type)
+            func.__commands_cooldown__ = mapping
         return func
 
     return decorator  # type: ignore
 
 
 def max_concurrency(
-    number: int, per: BucketType = BucketType.default, *, wait: bool = False
+    number: int,
+    per: BucketType = BucketType.default,
+    *,
+    wait: bool = False,
+    store: CooldownStore | None = None,
 ) -> Callable[[T], T]:
     """A decorator that adds a maximum concurrency to a command
 
@@ -2421,10 +2450,17 @@ def max_concurrency(
         then instead of waiting until the command can run again, the command raises
         :exc:`.MaxConcurrencyReached` to its error handler. If this is set to ``True``
         then the command waits until it can be executed.
+    store: Optional[:class:`.CooldownStore`]
+        Where to keep the running invocations, e.g. to limit them across
+        processes. Defaults to the current process.
+
+        .. versionadded:: 2.9
     """
 
     def decorator(func: Command | CoroFunc) -> Command | CoroFunc:
-        value = MaxConcurrency(number, per=per, wait=wait)
+        value = MaxConcurrency(
+            number, per=per, wait=wait, store=store, namespace=_namespace_of(func)
+        )
         if isinstance(func, (Command, ApplicationCommand)):
             func._max_concurrency = value
         else:
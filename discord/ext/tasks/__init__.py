@@ -29,6 +29,8 @@ import asyncio
 import contextvars
 import datetime
 import inspect
+import math
+import random
 import sys
 import traceback
 from collections.abc import Awaitable, Callable, Sequence
@@ -40,7 +42,10 @@ import discord
 from discord.backoff import ExponentialBackoff
 from discord.utils import MISSING, _get_event_loop
 
-__all__ = ("loop",)
+__all__ = (
+    "loop",
+    "LoopScheduler",
+)
 
 T = TypeVar("T")
 _func = Callable[..., Awaitable[Any]]
@@ -83,6 +88,224 @@ class SleepHandle:
         self.future.cancel()
 
 
+class _ScheduledSleep:
+    """A :class:`SleepHandle` replacement that waits on a :class:`LoopScheduler`."""
+
+    __slots__ = ("scheduler", "future", "when", "tick", "bucket", "offset")
+
+    def __init__(
+        self, scheduler: LoopScheduler, dt: datetime.datetime, offset: float
+    ) -> None:
+        self.scheduler = scheduler
+        self.future: asyncio.Future[Any] = scheduler._loop.create_future()
+        self.offset = offset
+        self.when: float = 0.0
+        self.tick: int = 0
+        self.bucket: set[_ScheduledSleep] | None = None
+        scheduler._schedule(self, dt)
+
+    def _fire(self) -> None:
+        self.bucket = None
+        if not self.future.done():
+            self.scheduler._record_drift(self.when)
+            self.future.set_result(True)
+
+    def recalculate(self, dt: datetime.datetime) -> None:
+        self.scheduler._unschedule(self)
+        self.scheduler._schedule(self, dt)
+
+    def wait(self) -> asyncio.Future[Any]:
+        return self.future
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def cancel(self) -> None:
+        self.scheduler._unschedule(self)
+        self.future.cancel()
+
+
+class LoopScheduler:
+    """Drives the sleeps of many :class:`Loop` instances from a single timer.
+
+    Without a scheduler, every sleeping loop holds its own timer in the event
+    loop. A scheduler keeps them in a hierarchical timing wheel instead, so
+    scheduling and cancelling is O(1) and the event loop only ever holds one
+    timer, no matter how many loops use it. Pass it to :func:`loop` to opt in.
+
+    Loops that run at the same ``time=`` can be spread over a window and
+    every wake up can be jittered, so thousands of loops don't all run at
+    the exact same moment.
+
+    .. versionadded:: 2.9
+
+    Parameters
+    ----------
+    resolution: :class:`float`
+        The length of a tick of the wheel in seconds. Loops wake up at most
+        this much later than they are scheduled for.
+    jitter: :class:`float`
+        The maximum amount of random seconds added to every wake up.
+    spread: :class:`float`
+        The size of the window in seconds that loops using ``time=`` are
+        spread over. Every loop gets a fixed offset inside this window, so
+        the time between its runs stays the same.
+    """
+
+    _BITS = 6
+    _SLOTS = 1 << _BITS
+    _MASK = _SLOTS - 1
+    _LEVELS = 4
+
+    def __init__(
+        self, *, resolution: float = 0.1, jitter: float = 0.0, spread: float = 0.0
+    ) -> None:
+        if resolution <= 0:
+            raise ValueError("resolution must be greater than 0.")
+        if jitter < 0 or spread < 0:
+            raise ValueError("jitter and spread cannot be negative.")
+
+        self.resolution: float = resolution
+        self.jitter: float = jitter
+        self.spread: float = spread
+        self._wheel: list[list[set[_ScheduledSleep]]] = [
+            [set() for _ in range(self._SLOTS)] for _ in range(self._LEVELS)
+        ]
+        self._loop: asyncio.AbstractEventLoop = MISSING
+        self._origin: float = 0.0
+        self._current: int = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._pending: int = 0
+        self._missed_ticks: int = 0
+        self._fired: int = 0
+        self._total_drift: float = 0.0
+        self._max_drift: float = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<LoopScheduler resolution={self.resolution} pending={self._pending}"
+            f" missed_ticks={self._missed_ticks}>"
+        )
+
+    @property
+    def pending(self) -> int:
+        """The amount of loops currently waiting on this scheduler."""
+        return self._pending
+
+    @property
+    def missed_ticks(self) -> int:
+        """How many ticks were processed late because the event loop was
+        blocked for longer than the resolution.
+        """
+        return self._missed_ticks
+
+    @property
+    def max_drift(self) -> float:
+        """The most seconds a loop woke up later than scheduled."""
+        return self._max_drift
+
+    @property
+    def average_drift(self) -> float:
+        """The average seconds loops woke up later than scheduled."""
+        return self._total_drift / self._fired if self._fired else 0.0
+
+    def _offset_for(self, loop: Loop[Any]) -> float:
+        if not self.spread or loop._time is MISSING:
+            return 0.0
+        # stable per loop, so that the time between its runs doesn't change
+        return (hash((loop.coro, id(loop._injected))) % 1000) / 1000 * self.spread
+
+    def _sleep(self, loop: Loop[Any], dt: datetime.datetime) -> _ScheduledSleep:
+        if self._loop is MISSING:
+            self._loop = asyncio.get_running_loop()
+            self._origin = self._loop.time()
+        return _ScheduledSleep(self, dt, self._offset_for(loop))
+
+    def _tick_of(self, when: float) -> int:
+        return math.ceil((when - self._origin) / self.resolution)
+
+    def _schedule(self, handle: _ScheduledSleep, dt: datetime.datetime) -> None:
+        delay = discord.utils.compute_timedelta(dt) + handle.offset
+        if self.jitter:
+            delay += random.uniform(0, self.jitter)
+        now = self._loop.time()
+        handle.when = now + delay
+
+        if self._timer is None:
+            # the wheel was idle, so it starts turning from now on
+            self._current = self._tick_of(now)
+            self._timer = self._loop.call_at(
+                self._origin + (self._current + 1) * self.resolution, self._advance
+            )
+
+        handle.tick = self._tick_of(handle.when)
+        if handle.tick <= self._current:
+            self._loop.call_soon(handle._fire)
+            return
+        self._insert(handle)
+        self._pending += 1
+
+    def _insert(self, handle: _ScheduledSleep) -> None:
+        tick = handle.tick
+        delta = tick - self._current
+        for level in range(self._LEVELS):
+            if delta < 1 << (self._BITS * (level + 1)):
+                break
+        else:
+            # further out than the wheel reaches, park it in the last slot
+            # of the top level and reinsert it when that slot is cascaded
+            tick = self._current + (1 << (self._BITS * self._LEVELS)) - 1
+        bucket = self._wheel[level][(tick >> (self._BITS * level)) & self._MASK]
+        bucket.add(handle)
+        handle.bucket = bucket
+
+    def _unschedule(self, handle: _ScheduledSleep) -> None:
+        if handle.bucket is not None:
+            handle.bucket.discard(handle)
+            handle.bucket = None
+            self._pending -= 1
+
+    def _advance(self) -> None:
+        target = self._tick_of(self._loop.time())
+        if target - self._current > 1:
+            self._missed_ticks += target - self._current - 1
+
+        while self._current < target and self._pending:
+            self._current += 1
+            tick = self._current
+            for level in range(1, self._LEVELS):
+                if tick & ((1 << (self._BITS * level)) - 1):
+                    break
+                bucket = self._wheel[level][(tick >> (self._BITS * level)) & self._MASK]
+                handles = list(bucket)
+                bucket.clear()
+                for handle in handles:
+                    self._insert(handle)
+
+            bucket = self._wheel[0][tick & self._MASK]
+            if bucket:
+                handles = list(bucket)
+                bucket.clear()
+                self._pending -= len(handles)
+                for handle in handles:
+                    handle._fire()
+
+        self._current = max(self._current, target)
+        if self._pending:
+            self._timer = self._loop.call_at(
+                self._origin + (self._current + 1) * self.resolution, self._advance
+            )
+        else:
+            self._timer = None
+
+    def _record_drift(self, when: float) -> None:
+        drift = max(self._loop.time() - when, 0.0)
+        self._fired += 1
+        self._total_drift += drift
+        if drift > self._max_drift:
+            self._max_drift = drift
+
+
 class Loop(Generic[LF]):
     """A background task helper that abstracts the loop and reconnection logic for you.
 
@@ -100,14 +323,16 @@ class Loop(Generic[LF]):
         reconnect: bool,
         loop: asyncio.AbstractEventLoop,
         overlap: bool | int,
+        scheduler: LoopScheduler | None = None,
     ) -> None:
         self.coro: LF = coro
+        self.scheduler: LoopScheduler | None = scheduler
         self.reconnect: bool = reconnect
         self.loop: asyncio.AbstractEventLoop = loop
         self.overlap: bool | int = overlap
         self.count: int | None = count
         self._current_loop = 0
-        self._handle: SleepHandle = MISSING
+        self._handle: SleepHandle | _ScheduledSleep = MISSING
         self._task: asyncio.Task[None] = MISSING
         self._injected = None
         self._valid_exception = (
@@ -180,7 +405,10 @@ class Loop(Generic[LF]):
             setattr(self, f"_{name}_running", False)
 
     def _try_sleep_until(self, dt: datetime.datetime):
-        self._handle = SleepHandle(dt=dt, loop=self.loop)
+        if self.scheduler is not None:
+            self._handle = self.scheduler._sleep(self, dt)
+        else:
+            self._handle = SleepHandle(dt=dt, loop=self.loop)
         return self._handle.wait()
 
     async def _loop(self, *args: Any, **kwargs: Any) -> None:
@@ -267,6 +495,7 @@ class Loop(Generic[LF]):
             reconnect=self.reconnect,
             loop=self.loop,
             overlap=self.overlap,
+            scheduler=self.scheduler,
         )
         copy._injected = obj
         copy._before_loop = self._before_loop
@@ -792,6 +1021,7 @@ def loop(
     reconnect: bool = True,
     loop: asyncio.AbstractEventLoop = MISSING,
     overlap: bool | int = False,
+    scheduler: LoopScheduler | None = None,
 ) -> Callable[[LF], Loop[LF]]:
     """A decorator that schedules a task in the background for you with
     optional reconnect logic. The decorator returns a :class:`Loop`.
@@ -833,6 +1063,12 @@ def loop(
 
         .. versionadded:: 2.7
 
+    scheduler: Optional[:class:`LoopScheduler`]
+        The scheduler to wait on between iterations instead of a timer of
+        this loop's own. Useful when running a large number of loops.
+
+        .. versionadded:: 2.9
+
     Raises
     ------
     ValueError
@@ -853,6 +1089,7 @@ def loop(
             reconnect=reconnect,
             loop=loop,
             overlap=overlap,
+            scheduler=scheduler,
         )
 
     return decorator
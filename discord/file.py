@@ -25,9 +25,15 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 import io
+import mmap as _mmap
 import os
-from typing import TYPE_CHECKING
+import tempfile
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import payload as _payload
 
 __all__ = (
     "File",
@@ -35,6 +41,134 @@ __all__ = (
 )
 
 
+CHUNK_SIZE = 256 * 1024
+
+
+class _StreamSource(AsyncIterable[bytes]):
+    """Uploads a source that can only be read once, like an async iterator or a pipe.
+
+    Everything read is spooled to a temporary file, in memory up to
+    ``spool_size`` bytes, so that a retried request can replay it before
+    reading on from the source.
+    """
+
+    def __init__(
+        self, source: Any, *, spool_size: int, chunk_size: int, owner: bool = False
+    ) -> None:
+        self.source = source
+        self.owner = owner
+        self.name: str | None = getattr(source, "name", None)
+        self.chunk_size = chunk_size
+        self._spool = tempfile.SpooledTemporaryFile(max_size=spool_size)
+        self._spooled = 0
+        self._position = 0
+        self._exhausted = False
+        self._iterator: AsyncIterator[bytes] | None = None
+        if isinstance(source, AsyncIterable):
+            self._iterator = source.__aiter__()
+
+    def seek(self, position: int) -> None:
+        self._position = position
+
+    def tell(self) -> int:
+        return self._position
+
+    async def _read_source(self) -> bytes:
+        if self._iterator is not None:
+            try:
+                return bytes(await self._iterator.__anext__())
+            except StopAsyncIteration:
+                return b""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.source.read, self.chunk_size)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        position = self._position
+        while position < self._spooled:
+            self._spool.seek(position)
+            chunk = self._spool.read(min(self.chunk_size, self._spooled - position))
+            position += len(chunk)
+            yield chunk
+
+        while not self._exhausted:
+            chunk = await self._read_source()
+            if not chunk:
+                self._exhausted = True
+                break
+            self._spool.seek(self._spooled)
+            self._spool.write(chunk)
+            self._spooled += len(chunk)
+            position = self._spooled
+            yield chunk
+
+    def close(self) -> None:
+        self._spool.close()
+        if self.owner:
+            self.source.close()
+
+
+class _MappedFile:
+    """Uploads a file from a read-only memory mapping.
+
+    The request body is written as views into the mapping, so the file is
+    never read into Python objects.
+    """
+
+    def __init__(self, fp: Any, *, chunk_size: int, owner: bool = False) -> None:
+        self.name: str | None = getattr(fp, "name", None)
+        self.chunk_size = chunk_size
+        self.owner = owner
+        self._file = fp
+        self._map = _mmap.mmap(fp.fileno(), 0, access=_mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self._position = 0
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def seek(self, position: int) -> None:
+        self._position = position
+
+    def tell(self) -> int:
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._map) if size < 0 else self._position + size
+        data = self._map[self._position : end]
+        self._position += len(data)
+        return data
+
+    def chunks(self):
+        view = self._view
+        for start in range(self._position, len(view), self.chunk_size):
+            yield view[start : start + self.chunk_size]
+
+    def close(self) -> None:
+        self._view.release()
+        self._map.close()
+        if self.owner:
+            self._file.close()
+
+
+class _MappedFilePayload(_payload.Payload):
+    _value: _MappedFile
+
+    def __init__(self, value: _MappedFile, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("content_type", "application/octet-stream")
+        super().__init__(value, *args, **kwargs)
+        self._size = len(value) - value.tell()
+
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        raise TypeError("memory mapped uploads can not be decoded")
+
+    async def write(self, writer: Any) -> None:
+        for chunk in self._value.chunks():
+            await writer.write(chunk)
+
+
+_payload.PAYLOAD_REGISTRY.register(_MappedFilePayload, _MappedFile)
+
+
 class File:
     r"""A parameter object used for :meth:`abc.Messageable.send`
     for sending file objects.
@@ -66,6 +200,34 @@ class File:
         The description of a file, used by Discord to display alternative text on images.
     spoiler: :class:`bool`
         Whether the attachment is a spoiler.
+
+    Parameters
+    ----------
+    fp: Union[:class:`str`, :class:`os.PathLike`, :class:`io.BufferedIOBase`, AsyncIterable[:class:`bytes`]]
+        The file to upload. Besides paths and seekable file objects, this can be a
+        non-seekable file object, like a pipe, or an async iterable of :class:`bytes`.
+        Those are streamed while uploading and spooled to a temporary file so that a
+        retried request can send them again.
+
+        .. versionchanged:: 2.9
+            Non-seekable file objects and async iterables are accepted.
+    filename: Optional[:class:`str`]
+        The filename to display when uploading to Discord.
+    description: Optional[:class:`str`]
+        The description of a file, used by Discord to display alternative text on images.
+    spoiler: :class:`bool`
+        Whether the attachment is a spoiler.
+    mmap: :class:`bool`
+        Whether to upload a path or a real file object from a read-only memory mapping
+        instead of reading it in chunks. The upload then writes views straight
+        into the mapped file, so the file is never copied into memory.
+
+        .. versionadded:: 2.9
+    spool_size: :class:`int`
+        How many bytes of a streamed source are kept in memory for retries before
+        spooling to disk.
+
+        .. versionadded:: 2.9
     """
 
     __slots__ = (
@@ -86,23 +248,44 @@ class File:
 
     def __init__(
         self,
-        fp: str | bytes | os.PathLike | io.BufferedIOBase,
+        fp: str | bytes | os.PathLike | io.BufferedIOBase | AsyncIterable[bytes],
         filename: str | None = None,
         *,
         description: str | None = None,
         spoiler: bool = False,
+        mmap: bool = False,
+        spool_size: int = 1024 * 1024,
     ):
 
-        if isinstance(fp, io.IOBase):
-            if not (fp.seekable() and fp.readable()):
-                raise ValueError(f"File buffer {fp!r} must be seekable and readable")
+        original = fp
+        if mmap and not isinstance(fp, io.IOBase):
+            fp = open(fp, "rb")
+            mmap_owner = True
+        else:
+            mmap_owner = False
+
+        if isinstance(fp, AsyncIterable):
+            self.fp = _StreamSource(fp, spool_size=spool_size, chunk_size=CHUNK_SIZE)
+            self._original_pos = 0
+        elif not isinstance(fp, io.IOBase):
+            self.fp = open(fp, "rb")
+            self._original_pos = 0
+        elif not fp.readable():
+            raise ValueError(f"File buffer {fp!r} must be readable")
+        elif mmap and os.fstat(fp.fileno()).st_size:
+            self._original_pos = fp.tell()
+            self.fp = _MappedFile(fp, chunk_size=CHUNK_SIZE, owner=mmap_owner)
+            self.fp.seek(self._original_pos)
+        elif mmap_owner or fp.seekable():
+            # this includes empty files, which can't be mapped
             self.fp = fp
             self._original_pos = fp.tell()
-            self._owner = False
         else:
-            self.fp = open(fp, "rb")
+            self.fp = _StreamSource(fp, spool_size=spool_size, chunk_size=CHUNK_SIZE)
             self._original_pos = 0
-            self._owner = True
+
+        # wrappers release their own resources, but only close what we opened
+        self._owner = mmap_owner or self.fp is not fp
 
         # aiohttp only uses two methods from IOBase
         # read and close, since I want to control when the files
@@ -112,10 +295,10 @@ class File:
         self.fp.close = lambda: None
 
         if filename is None:
-            if isinstance(fp, str):
-                _, self.filename = os.path.split(fp)
+            if isinstance(original, str):
+                _, self.filename = os.path.split(original)
             else:
-                self.filename = getattr(fp, "name", None)
+                self.filename = getattr(original, "name", None)
         else:
             self.filename = filename
 
@@ -328,10 +328,12 @@ class DiscordWebSocket:
     def is_ratelimited(self) -> bool:
         return self._rate_limiter.is_ratelimited()
 
-    def debug_log_receive(self, data: dict[str, Any], /) -> None:
+    def debug_log_receive(self, data: str | bytes, /) -> None:
+        if type(data) is bytes:
+            data = data.decode("utf-8")
         self._dispatch("socket_raw_receive", data)
 
-    def log_receive(self, _: dict[str, Any], /) -> None:
+    def log_receive(self, _: str | bytes, /) -> None:
         pass
 
     @classmethod
@@ -480,8 +482,8 @@ class DiscordWebSocket:
 
             if len(msg) < 4 or msg[-4:] != b"\x00\x00\xff\xff":
                 return
+            # the JSON backend decodes the inflated bytes directly
             msg = self._zlib.decompress(self._buffer)
-            msg = msg.decode("utf-8")
             self._buffer = bytearray()
 
         self.log_receive(msg)
@@ -666,18 +668,26 @@ class DiscordWebSocket:
                     self.socket, shard_id=self.shard_id, code=code
                 ) from None
 
-    async def debug_send(self, data: str, /) -> None:
+    async def debug_send(self, data: str | bytes, /) -> None:
         await self._rate_limiter.block()
-        self._dispatch("socket_raw_send", data)
-        await self.socket.send_str(data)
+        if type(data) is bytes:
+            self._dispatch("socket_raw_send", data.decode("utf-8"))
+            await self.socket.send_frame(data, aiohttp.WSMsgType.TEXT)
+        else:
+            self._dispatch("socket_raw_send", data)
+            await self.socket.send_str(data)
 
-    async def send(self, data: str, /) -> None:
+    async def send(self, data: str | bytes, /) -> None:
         await self._rate_limiter.block()
-        await self.socket.send_str(data)
+        if type(data) is bytes:
+            # already UTF-8 encoded JSON, sent as a text frame as is
+            await self.socket.send_frame(data, aiohttp.WSMsgType.TEXT)
+        else:
+            await self.socket.send_str(data)
 
     async def send_as_json(self, data: Any) -> None:
         try:
-            await self.send(utils._to_json(data))
+            await self.send(utils._to_json_bytes(data))
         except RuntimeError as exc:
             if not self._can_handle_close():
                 raise ConnectionClosed(self.socket, shard_id=self.shard_id) from exc
@@ -685,7 +695,9 @@ class DiscordWebSocket:
     async def send_heartbeat(self, data: Any) -> None:
         # This bypasses the rate limit handling code since it has a higher priority
         try:
-            await self.socket.send_str(utils._to_json(data))
+            await self.socket.send_frame(
+                utils._to_json_bytes(data), aiohttp.WSMsgType.TEXT
+            )
         except RuntimeError as exc:
             if not self._can_handle_close():
                 raise ConnectionClosed(self.socket, shard_id=self.shard_id) from exc
@@ -717,8 +729,8 @@ class DiscordWebSocket:
             },
         }
 
-        sent = utils._to_json(payload)
-        _log.debug('Sending "%s" to change status', sent)
+        sent = utils._to_json_bytes(payload)
+        _log.debug('Sending "%s" to change status', sent.decode("utf-8"))
         await self.send(sent)
 
     async def request_chunks(
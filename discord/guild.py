@@ -28,6 +28,7 @@ from __future__ import annotations
 import copy
 import datetime
 import unicodedata
+from bisect import bisect_left, insort
 from collections.abc import Sequence
 from typing import (
     TYPE_CHECKING,
@@ -147,6 +148,82 @@ class _GuildLimit(NamedTuple):
     filesize: int
 
 
+class _MemberNameIndex:
+    """Maps the case-folded username, global name and nickname of the cached
+    members of a guild to their ids.
+
+    The sorted list of names used for prefix lookups is only built on the
+    first prefix lookup and kept up to date afterwards.
+    """
+
+    __slots__ = ("_names", "_keys", "_sorted")
+
+    def __init__(self) -> None:
+        self._names: dict[str, dict[int, None]] = {}
+        self._keys: dict[int, tuple[str, ...]] = {}
+        self._sorted: list[str] | None = None
+
+    @staticmethod
+    def _member_keys(member: Member) -> tuple[str, ...]:
+        keys = []
+        for name in (member.name, member.global_name, member.nick):
+            if name and (key := name.casefold()) not in keys:
+                keys.append(key)
+        return tuple(keys)
+
+    def add(self, member: Member) -> None:
+        keys = self._member_keys(member)
+        old = self._keys.get(member.id)
+        if old == keys:
+            return
+        if old is not None:
+            self._discard(member.id, old)
+        self._keys[member.id] = keys
+        for key in keys:
+            ids = self._names.get(key)
+            if ids is None:
+                ids = self._names[key] = {}
+                if self._sorted is not None:
+                    insort(self._sorted, key)
+            ids[member.id] = None
+
+    def remove(self, member_id: int) -> None:
+        keys = self._keys.pop(member_id, None)
+        if keys is not None:
+            self._discard(member_id, keys)
+
+    def _discard(self, member_id: int, keys: tuple[str, ...]) -> None:
+        for key in keys:
+            ids = self._names.get(key)
+            if ids is None:
+                continue
+            ids.pop(member_id, None)
+            if not ids:
+                del self._names[key]
+                if self._sorted is not None:
+                    i = bisect_left(self._sorted, key)
+                    if i < len(self._sorted) and self._sorted[i] == key:
+                        del self._sorted[i]
+
+    def get(self, name: str) -> list[int]:
+        return list(self._names.get(name.casefold(), ()))
+
+    def prefix(self, prefix: str, limit: int | None = None) -> list[int]:
+        if self._sorted is None:
+            self._sorted = sorted(self._names)
+        prefix = prefix.casefold()
+        names = self._sorted
+        found: dict[int, None] = {}
+        i = bisect_left(names, prefix)
+        while i < len(names) and names[i].startswith(prefix):
+            for member_id in self._names[names[i]]:
+                found[member_id] = None
+                if limit is not None and len(found) >= limit:
+                    return list(found)
+            i += 1
+        return list(found)
+
+
 class GuildRoleCounts(dict[int, int]):
     """A dictionary subclass that maps role IDs to their member counts.
 
@@ -359,6 +436,7 @@ class Guild(Hashable):
         "nsfw_level",
         "_scheduled_events",
         "_members",
+        "_member_names",
         "_channels",
         "_icon",
         "_banner",
@@ -407,6 +485,7 @@ class Guild(Hashable):
 
         self._channels: dict[int, GuildChannel] = {}
         self._members: dict[int, Member] = {}
+        self._member_names: _MemberNameIndex = _MemberNameIndex()
         self._scheduled_events: dict[int, ScheduledEvent] = {}
         self._voice_states: dict[int, VoiceState] = {}
         self._threads: dict[int, Thread] = {}
@@ -425,6 +504,12 @@ class Guild(Hashable):
 
     def _add_member(self, member: Member, /) -> None:
         self._members[member.id] = member
+        self._member_names.add(member)
+
+    def _update_member_names(self, member: Member, /) -> None:
+        # only the cached member object is indexed, not copies of it
+        if self._members.get(member.id) is member:
+            self._member_names.add(member)
 
     def _get_and_update_member(
         self, payload: MemberPayload, user_id: int, cache_flag: bool, /
@@ -433,7 +518,9 @@ class Guild(Hashable):
         # flag should always be MemberCacheFlag.interaction) is set to True
         if user_id in self._members:
             member = self.get_member(user_id)
-            member._update(payload) if cache_flag else None
+            if cache_flag:
+                member._update(payload)
+                self._member_names.add(member)
         else:
             # NOTE:
             # This is a fallback in case the member is not found in the guild's members.
@@ -441,7 +528,7 @@ class Guild(Hashable):
             # class will be incorrect such as status and activities.
             member = Member(guild=self, state=self._state, data=payload)  # type: ignore
             if cache_flag:
-                self._members[user_id] = member
+                self._add_member(member)
         return member
 
     def _store_thread(self, payload: ThreadPayload, /) -> Thread:
@@ -451,6 +538,7 @@ class Guild(Hashable):
 
     def _remove_member(self, member: Snowflake, /) -> None:
         self._members.pop(member.id, None)
+        self._member_names.remove(member.id)
 
     def _add_scheduled_event(self, event: ScheduledEvent, /) -> None:
         self._scheduled_events[event.id] = event
@@ -1398,23 +1486,67 @@ class Guild(Hashable):
             then ``None`` is returned.
         """
 
-        result = None
-        members = self.members
+        members = self._members
         if len(name) > 5 and name[-5] == "#":
             # The 5 length is checking to see if #0000 is in the string,
             # as a#0000 has a length of 6, the minimum for a potential
             # discriminator lookup.
             potential_discriminator = name[-4:]
+            username = name[:-5]
 
             # do the actual lookup and return if found
             # if it isn't found then we'll do a full name lookup below.
-            result = utils.get(
-                members, name=name[:-5], discriminator=potential_discriminator
-            )
-            if result is not None:
-                return result
+            for member_id in self._member_names.get(username):
+                member = members.get(member_id)
+                if (
+                    member is not None
+                    and member.name == username
+                    and member.discriminator == potential_discriminator
+                ):
+                    return member
+
+        for member_id in self._member_names.get(name):
+            member = members.get(member_id)
+            if member is not None and name in (
+                member.nick,
+                member.name,
+                member.global_name,
+            ):
+                return member
+        return None
 
-        return utils.find(lambda m: name in (m.nick, m.name, m.global_name), members)
+    def get_members_named(
+        self, name: str, /, *, prefix: bool = False, limit: int | None = None
+    ) -> list[Member]:
+        """Returns the cached members whose username, global name or nickname
+        matches ``name``, case-insensitive.
+
+        This is looked up in an index that is kept up to date with the member
+        cache, so it does not have to go through every member.
+
+        .. versionadded:: 2.9
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name to look up.
+        prefix: :class:`bool`
+            Whether to return the members with a name starting with ``name``
+            instead of the ones with exactly that name.
+        limit: Optional[:class:`int`]
+            The maximum number of members to return.
+
+        Returns
+        -------
+        List[:class:`Member`]
+            The matching members.
+        """
+        if prefix:
+            ids = self._member_names.prefix(name, limit)
+        else:
+            ids = self._member_names.get(name)[:limit]
+        members = self._members
+        return [members[member_id] for member_id in ids if member_id in members]
 
     def _create_channel(
         self,
@@ -2434,7 +2566,11 @@ class Guild(Hashable):
 
     # TODO: Remove Optional typing here when async iterators are refactored
     def fetch_members(
-        self, *, limit: int | None = 1000, after: SnowflakeTime | None = None
+        self,
+        *,
+        limit: int | None = 1000,
+        after: SnowflakeTime | None = None,
+        prefetch: int = 0,
     ) -> MemberIterator:
         """Retrieves an :class:`.AsyncIterator` that enables receiving the guild's members. In order to use this,
         :meth:`Intents.members` must be enabled.
@@ -2456,6 +2592,11 @@ class Guild(Hashable):
             Retrieve members after this date or object.
             If a datetime is provided, it is recommended to use a UTC aware datetime.
             If the datetime is naive, it is assumed to be local time.
+        prefetch: :class:`int`
+            The number of pages of 1000 members to request in the background while
+            the current page is consumed. Defaults to ``0``.
+
+            .. versionadded:: 2.9
 
         Yields
         ------
@@ -2486,7 +2627,7 @@ class Guild(Hashable):
         if not self._state._intents.members:
             raise ClientException("Intents.members must be enabled to use this.")
 
-        return MemberIterator(self, limit=limit, after=after)
+        return MemberIterator(self, limit=limit, after=after, prefetch=prefetch)
 
     async def search_members(self, query: str, *, limit: int = 1000) -> list[Member]:
         """Search for guild members whose usernames or nicknames start with the query string. Unlike :meth:`fetch_members`, this does not require :meth:`Intents.members`.
@@ -2632,6 +2773,8 @@ class Guild(Hashable):
         limit: int | None = None,
         before: Snowflake | None = None,
         after: Snowflake | None = None,
+        *,
+        prefetch: int = 0,
     ) -> BanIterator:
         """|coro|
 
@@ -2658,6 +2801,11 @@ class Guild(Hashable):
             Retrieve bans before the given user.
         after: Optional[:class:`.abc.Snowflake`]
             Retrieve bans after the given user.
+        prefetch: :class:`int`
+            The number of pages of 1000 bans to request in the background while
+            the current page is consumed. Defaults to ``0``.
+
+            .. versionadded:: 2.9
 
         Yields
         ------
@@ -2685,7 +2833,9 @@ class Guild(Hashable):
             # bans is now a list of BanEntry...
         """
 
-        return BanIterator(self, limit=limit, before=before, after=after)
+        return BanIterator(
+            self, limit=limit, before=before, after=after, prefetch=prefetch
+        )
 
     async def prune_members(
         self,
@@ -3795,6 +3945,7 @@ class Guild(Hashable):
         after: SnowflakeTime | None = None,
         user: Snowflake = None,
         action: AuditLogAction = None,
+        prefetch: int = 0,
     ) -> AuditLogIterator:
         """Returns an :class:`AsyncIterator` that enables receiving the guild's audit logs.
 
@@ -3819,6 +3970,11 @@ class Guild(Hashable):
             The moderator to filter entries from.
         action: :class:`AuditLogAction`
             The action to filter with.
+        prefetch: :class:`int`
+            The number of pages of 100 entries to request in the background while
+            the current page is consumed. Defaults to ``0``.
+
+            .. versionadded:: 2.9
 
         Yields
         ------
@@ -3861,6 +4017,7 @@ class Guild(Hashable):
             limit=limit,
             user_id=user_id,
             action_type=action,
+            prefetch=prefetch,
         )
 
     async def widget(self) -> Widget:
@@ -4034,6 +4191,43 @@ class Guild(Hashable):
             cache=cache,
         )
 
+    async def load_member(
+        self, user_id: int, /, *, cache: bool = True, timeout: float | None = None
+    ) -> Member | None:
+        """|coro|
+
+        Requests a single member from the gateway, batched with other lookups.
+
+        Every lookup for this guild issued within a few milliseconds of each
+        other is sent as one request of up to 100 ids, so many concurrent
+        lookups only cost a handful of requests instead of one each.
+
+        .. versionadded:: 2.9
+
+        Parameters
+        ----------
+        user_id: :class:`int`
+            The id of the member to look up.
+        cache: :class:`bool`
+            Whether to cache the member internally.
+        timeout: Optional[:class:`float`]
+            How many seconds to wait for the member. Defaults to ``None``, which
+            waits until the chunk request itself times out after 30 seconds.
+
+        Returns
+        -------
+        Optional[:class:`Member`]
+            The member, or ``None`` if there is no member with that id.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            The request timed out waiting for the members.
+        """
+        return await self._state._member_loader.load(
+            self, user_id, cache=cache, timeout=timeout
+        )
+
     async def change_voice_state(
         self,
         *,
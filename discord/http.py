@@ -26,16 +26,36 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import copy
+import hashlib
+import io
 import logging
+import os
+import shutil
 import sys
+import tempfile
+import threading
+import time
 import weakref
-from collections.abc import AsyncGenerator, Coroutine, Iterable, Sequence
+from collections import OrderedDict
+from collections.abc import (
+    AsyncGenerator,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+    Sequence,
+)
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     TypeVar,
 )
+from urllib.parse import parse_qsl
 from urllib.parse import quote as _uriquote
+from urllib.parse import urlencode, urlsplit
 
 import aiohttp
 
@@ -108,7 +128,7 @@ async def parse_response(
 ) -> dict[str, Any] | str | bytes:
     try:
         if response.headers["content-type"] == "application/json":
-            return utils._from_json(await response.text(encoding="utf-8"))
+            return utils._from_json(await response.read())
         elif response.headers["content-type"] == "text/csv":
             return await response.read()
     except KeyError:
@@ -150,6 +170,249 @@ class Route:
         return f"{self.channel_id}:{self.guild_id}:{self.path}"
 
 
+class ResponseCache:
+    """Coalesces identical GET requests and optionally caches their responses.
+
+    Concurrent GET requests for the same URL share a single request. Routes
+    registered with :meth:`enable` additionally serve their response from
+    memory for ``ttl`` seconds. Any other request to the same resource, one of
+    its parents or one of its children drops the cached responses, and GET
+    requests that were already in flight are neither cached nor joined.
+
+    .. versionadded:: 2.9
+
+    Attributes
+    ----------
+    maxsize: :class:`int`
+        The maximum number of cached responses.
+    coalesce: :class:`bool`
+        Whether concurrent identical GET requests are merged.
+    hits: :class:`int`
+        The amount of requests served from the cache.
+    misses: :class:`int`
+        The amount of requests to cached routes that were sent.
+    coalesced: :class:`int`
+        The amount of requests that waited for an identical one in flight.
+    """
+
+    def __init__(
+        self,
+        routes: dict[str, float] | None = None,
+        *,
+        maxsize: int = 1024,
+        coalesce: bool = True,
+    ) -> None:
+        self.maxsize: int = maxsize
+        self.coalesce: bool = coalesce
+        self.hits: int = 0
+        self.misses: int = 0
+        self.coalesced: int = 0
+        self._ttls: dict[str, float] = dict(routes or {})
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, str, Any]] = (
+            OrderedDict()
+        )
+        # cached keys by the scopes of their resource, see _scopes
+        self._index: dict[str, set[tuple[Any, ...]]] = {}
+        self._inflight: dict[tuple[Any, ...], tuple[asyncio.Future[Any], int]] = {}
+        self._waiters: dict[tuple[Any, ...], int] = {}
+        # the generation of the latest invalidation of each scope, only kept
+        # while requests are running
+        self._generation: int = 0
+        self._invalidated: dict[str, int] = {}
+        self._running: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of requests to cached routes that did not have to be sent."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def enable(self, path: str, ttl: float) -> None:
+        """Caches the responses of a route.
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The path template of the route, e.g. ``"/guilds/{guild_id}/roles"``.
+        ttl: :class:`float`
+            The amount of seconds a response is served from the cache.
+        """
+        self._ttls[path] = ttl
+
+    def disable(self, path: str) -> None:
+        """Stops caching the responses of a route and drops the cached ones."""
+        self._ttls.pop(path, None)
+        for key in [k for k, v in self._entries.items() if v[1] == path]:
+            self._drop(key)
+
+    def clear(self) -> None:
+        """Drops every cached response."""
+        self._entries.clear()
+        self._index.clear()
+
+    @staticmethod
+    def _resource(url: str) -> str:
+        return url.split("?", 1)[0].rstrip("/")
+
+    @staticmethod
+    def _separators(resource: str) -> Iterator[int]:
+        # the slashes between path segments, skipping the one after the scheme
+        index = resource.find("/", resource.find("//") + 2)
+        while index != -1:
+            yield index
+            index = resource.find("/", index + 1)
+
+    @classmethod
+    def _scopes(cls, resource: str) -> Iterator[str]:
+        # the resource itself and every parent followed by a slash
+        yield resource
+        for index in cls._separators(resource):
+            yield resource[: index + 1]
+
+    @classmethod
+    def _related(cls, resource: str) -> Iterator[str]:
+        # the scopes of the resource, its children and its parents, so that two
+        # resources are related when one's scopes and the other's related meet
+        yield resource
+        yield resource + "/"
+        for index in cls._separators(resource):
+            yield resource[:index]
+
+    def invalidate(self, url: str) -> None:
+        """Drops the cached responses of a resource, its parents and its children."""
+        resource = self._resource(url)
+        if self._running:
+            self._generation += 1
+            for scope in self._scopes(resource):
+                self._invalidated[scope] = self._generation
+        if not self._entries:
+            return
+        for scope in self._related(resource):
+            keys = self._index.get(scope)
+            if keys:
+                for key in list(keys):
+                    self._drop(key)
+
+    def _is_stale(self, resource: str, generation: int) -> bool:
+        # whether a related resource was invalidated after the generation
+        invalidated = self._invalidated
+        return bool(invalidated) and any(
+            invalidated.get(scope, -1) > generation for scope in self._related(resource)
+        )
+
+    def _drop(self, key: tuple[Any, ...]) -> None:
+        del self._entries[key]
+        for scope in self._scopes(key[0]):
+            keys = self._index[scope]
+            keys.discard(key)
+            if not keys:
+                del self._index[scope]
+
+    def _get(self, key: tuple[Any, ...]) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        if entry[0] <= time.monotonic():
+            self._drop(key)
+            return MISSING
+        self._entries.move_to_end(key)
+        return copy.deepcopy(entry[2])
+
+    def _set(
+        self,
+        key: tuple[Any, ...],
+        path: str,
+        ttl: float,
+        data: Any,
+        generation: int,
+    ) -> None:
+        if self._is_stale(key[0], generation):
+            return
+        if key not in self._entries:
+            for scope in self._scopes(key[0]):
+                self._index.setdefault(scope, set()).add(key)
+        self._entries[key] = (time.monotonic() + ttl, path, data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._drop(next(iter(self._entries)))
+
+    def _start(self) -> int:
+        self._running += 1
+        return self._generation
+
+    def _finish(self) -> None:
+        self._running -= 1
+        if not self._running:
+            self._invalidated.clear()
+
+    async def fetch(
+        self,
+        route: Route,
+        params: Any,
+        locale: str | None,
+        request: Callable[[], Coroutine[Any, Any, Any]],
+    ) -> Any:
+        if params:
+            params = tuple(sorted(dict(params).items()))
+        key = (self._resource(route.url), route.url, params, locale)
+        ttl = self._ttls.get(route.path)
+        if ttl is not None:
+            data = self._get(key)
+            if data is not MISSING:
+                self.hits += 1
+                return data
+            self.misses += 1
+
+        if not self.coalesce:
+            generation = self._start()
+            try:
+                data = await request()
+                if ttl is not None:
+                    self._set(key, route.path, ttl, copy.deepcopy(data), generation)
+            finally:
+                self._finish()
+            return data
+
+        inflight = self._inflight.get(key)
+        if inflight is None or self._is_stale(key[0], inflight[1]):
+            # a request that started before a write may return outdated data
+            generation = self._start()
+            future = asyncio.ensure_future(request())
+            self._inflight[key] = (future, generation)
+
+            def done(future: asyncio.Future[Any]) -> None:
+                if self._inflight.get(key, (None,))[0] is future:
+                    del self._inflight[key]
+                if (
+                    ttl is not None
+                    and not future.cancelled()
+                    and not future.exception()
+                ):
+                    self._set(key, route.path, ttl, future.result(), generation)
+                self._finish()
+
+            future.add_done_callback(done)
+        else:
+            future = inflight[0]
+            self.coalesced += 1
+
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            data = await asyncio.shield(future)
+        finally:
+            self._waiters[key] -= 1
+            shared = ttl is not None or self._waiters[key] > 0
+            if not self._waiters[key]:
+                del self._waiters[key]
+
+        # the payload is shared with other callers or the cache, which must not
+        # see the changes a caller makes to it
+        return copy.deepcopy(data) if shared else data
+
+
 class MaybeUnlock:
     def __init__(self, lock: asyncio.Lock) -> None:
         self.lock: asyncio.Lock = lock
@@ -176,6 +439,219 @@ class MaybeUnlock:
 aiohttp.hdrs.WEBSOCKET = "websocket"  # type: ignore
 
 
+def _raise_for_cdn_status(resp: aiohttp.ClientResponse) -> None:
+    if resp.status == 200:
+        return
+    elif resp.status == 404:
+        raise NotFound(resp, "asset not found")
+    elif resp.status == 403:
+        raise Forbidden(resp, "cannot retrieve asset")
+    else:
+        raise HTTPException(resp, "failed to get asset")
+
+
+def _consume_download(
+    result: bytes | str, fp: io.BufferedIOBase | str | os.PathLike[str] | None
+) -> bytes | int:
+    # runs in an executor, result is either the content or the path of a file.
+    # a path target is only opened here, once the download succeeded, so that a
+    # failed download does not truncate it
+    if isinstance(result, bytes):
+        if fp is None:
+            return result
+        with _open_target(fp) as f:
+            return f.write(result)
+    with open(result, "rb") as source:
+        if fp is None:
+            return source.read()
+        with _open_target(fp) as f:
+            shutil.copyfileobj(source, f)
+        return source.tell()
+
+
+def _open_target(
+    fp: io.BufferedIOBase | str | os.PathLike[str],
+) -> contextlib.AbstractContextManager[IO[bytes]]:
+    if isinstance(fp, io.BufferedIOBase):
+        return contextlib.nullcontext(fp)  # type: ignore
+    return open(fp, "wb")
+
+
+class CDNCache:
+    """A size bounded on-disk cache for CDN downloads.
+
+    Files are stored under a hash of their URL, ignoring the expiring signature
+    of attachment URLs, and the least recently used ones are evicted once the
+    cache grows beyond ``max_size`` bytes. Files left in ``directory`` by a
+    previous run are picked up again.
+
+    .. versionadded:: 2.9
+
+    Parameters
+    ----------
+    directory: :class:`str`
+        The directory to store the files in. It is created if it doesn't exist.
+    max_size: :class:`int`
+        The maximum total size of the cached files in bytes.
+
+    Attributes
+    ----------
+    hits: :class:`int`
+        The amount of downloads served from the cache.
+    misses: :class:`int`
+        The amount of downloads that were not cached.
+    """
+
+    # query parameters of signed attachment URLs that change without the content
+    _SIGNATURE_PARAMS = frozenset(("ex", "is", "hm"))
+
+    def __init__(self, directory: str, *, max_size: int = 512 * 1024 * 1024) -> None:
+        self.directory: str = directory
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size: int = 0
+        # the index is used from the executor threads that do the file work
+        self._lock: threading.Lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        found = []
+        for entry in os.scandir(directory):
+            if entry.is_file() and not entry.name.startswith("."):
+                stat = entry.stat()
+                found.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._size += size
+        self._evict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached files in bytes."""
+        return self._size
+
+    @classmethod
+    def key(cls, url: str) -> str:
+        """Returns the name of the file ``url`` is cached under."""
+        parts = urlsplit(url)
+        query = [
+            (k, v) for k, v in parse_qsl(parts.query) if k not in cls._SIGNATURE_PARAMS
+        ]
+        normalized = f"{parts.netloc}{parts.path}?{urlencode(sorted(query))}"
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+    def path(self, url: str) -> str | None:
+        """Returns the path of the cached file for ``url`` and marks it as
+        recently used, or ``None`` if it is not cached.
+        """
+        key = self.key(url)
+        with self._lock:
+            if key not in self._entries:
+                return None
+            path = os.path.join(self.directory, key)
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                self._size -= self._entries.pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return path
+
+    def writer(self, url: str) -> _CDNFileWriter:
+        """Returns a writer that adds the file for ``url`` once it is committed."""
+        return _CDNFileWriter(self.directory, self, self.key(url))
+
+    def discard(self, url: str) -> None:
+        """Removes the cached file for ``url``, if any."""
+        with self._lock:
+            self._remove(self.key(url))
+
+    def clear(self) -> None:
+        """Removes every cached file."""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _store(self, path: str, key: str, size: int) -> bool:
+        if size > self.max_size:
+            return False
+        with self._lock:
+            os.replace(path, os.path.join(self.directory, key))
+            if key in self._entries:
+                self._size -= self._entries.pop(key)
+            self._entries[key] = size
+            self._size += size
+            self._evict()
+        return True
+
+    def _remove(self, key: str) -> None:
+        size = self._entries.pop(key, None)
+        if size is None:
+            return
+        self._size -= size
+        try:
+            os.remove(os.path.join(self.directory, key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        while self._size > self.max_size and self._entries:
+            self._remove(next(iter(self._entries)))
+
+
+class _CDNFileWriter:
+    """Writes a download into a temporary file, which is moved into the cache,
+    if there is one, once nobody reads it anymore.
+
+    Every method does blocking file I/O and is meant to run in an executor.
+    """
+
+    def __init__(self, directory: str | None, cache: CDNCache | None, key: str) -> None:
+        self.cache = cache
+        self.key = key
+        self.size = 0
+        fd, self.path = tempfile.mkstemp(prefix=".", dir=directory)
+        self.file = os.fdopen(fd, "wb")
+
+    def write(self, chunk: bytes) -> None:
+        self.size += self.file.write(chunk)
+
+    def close(self) -> None:
+        self.file.close()
+
+    def commit(self) -> None:
+        try:
+            if self.cache is not None and self.cache._store(
+                self.path, self.key, self.size
+            ):
+                return
+        except OSError:
+            _log.warning("Could not add %s to the CDN cache.", self.path, exc_info=True)
+        self.abort()
+
+    def abort(self) -> None:
+        self.file.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class _CDNDownload:
+    """A download shared by every request of the same file in flight."""
+
+    __slots__ = ("task", "waiters", "writer")
+
+    def __init__(self) -> None:
+        self.task: asyncio.Task[bytes | str]
+        self.waiters: int = 0
+        self.writer: _CDNFileWriter | None = None
+
+
 class HTTPClient:
     """Represents an HTTP client sending HTTP requests to the Discord API."""
 
@@ -187,6 +663,9 @@ class HTTPClient:
         proxy_auth: aiohttp.BasicAuth | None = None,
         loop: asyncio.AbstractEventLoop | None = None,
         unsync_clock: bool = True,
+        response_cache: ResponseCache | None = None,
+        cdn_cache: CDNCache | None = None,
+        max_cdn_downloads: int = 8,
     ) -> None:
         self.loop: asyncio.AbstractEventLoop = (
             _get_event_loop() if loop is None else loop
@@ -194,6 +673,8 @@ class HTTPClient:
         self.connector = connector
         self.__session: aiohttp.ClientSession = MISSING  # filled in static_login
         self._locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        # bucket -> (remaining requests, monotonic time the bucket resets at)
+        self._remaining: dict[str, tuple[int, float]] = {}
         self._global_over: asyncio.Event = asyncio.Event()
         self._global_over.set()
         self.token: str | None = None
@@ -201,6 +682,10 @@ class HTTPClient:
         self.proxy: str | None = proxy
         self.proxy_auth: aiohttp.BasicAuth | None = proxy_auth
         self.use_clock: bool = not unsync_clock
+        self.response_cache: ResponseCache = response_cache or ResponseCache()
+        self.cdn_cache: CDNCache | None = cdn_cache
+        self._cdn_semaphore: asyncio.Semaphore = asyncio.Semaphore(max_cdn_downloads)
+        self._cdn_downloads: dict[str, asyncio.Future[bytes]] = {}
 
         user_agent = (
             "DiscordBot (https://pycord.dev, {0}) Python/{1[0]}.{1[1]} aiohttp/{2}"
@@ -238,6 +723,57 @@ class HTTPClient:
         files: Sequence[File] | None = None,
         form: Iterable[dict[str, Any]] | None = None,
         **kwargs: Any,
+    ) -> Any:
+        cache = self.response_cache
+        if route.method != "GET":
+            try:
+                return await self._request(route, files=files, form=form, **kwargs)
+            finally:
+                cache.invalidate(route.url)
+
+        if files or form or not (cache.coalesce or cache._ttls):
+            return await self._request(route, files=files, form=form, **kwargs)
+
+        return await cache.fetch(
+            route,
+            kwargs.get("params"),
+            kwargs.get("locale"),
+            lambda: self._request(route, **kwargs),
+        )
+
+    def _store_remaining(
+        self, bucket: str, response: aiohttp.ClientResponse, remaining: str
+    ) -> None:
+        try:
+            delta = utils._parse_ratelimit_header(response, use_clock=self.use_clock)
+            self._remaining[bucket] = (int(remaining), time.monotonic() + delta)
+        except (KeyError, ValueError):
+            self._remaining.pop(bucket, None)
+
+    def remaining_requests(self, route: Route) -> int | None:
+        """Returns how many requests are left in the rate limit bucket of ``route``.
+
+        Returns ``None`` if no request to the bucket was made yet or if it has
+        been reset since.
+
+        .. versionadded:: 2.9
+        """
+        try:
+            remaining, reset_at = self._remaining[route.bucket]
+        except KeyError:
+            return None
+        if time.monotonic() >= reset_at:
+            del self._remaining[route.bucket]
+            return None
+        return remaining
+
+    async def _request(
+        self,
+        route: Route,
+        *,
+        files: Sequence[File] | None = None,
+        form: Iterable[dict[str, Any]] | None = None,
+        **kwargs: Any,
     ) -> Any:
         bucket = route.bucket
         method = route.method
@@ -259,7 +795,11 @@ class HTTPClient:
         # some checking if it's a JSON request
         if "json" in kwargs:
             headers["Content-Type"] = "application/json"
-            kwargs["data"] = utils._to_json(kwargs.pop("json"))
+            kwargs["data"] = utils._to_json_bytes(kwargs.pop("json"))
+        elif "encoded_json" in kwargs:
+            # already serialized, e.g. once for every channel of a broadcast
+            headers["Content-Type"] = "application/json"
+            kwargs["data"] = kwargs.pop("encoded_json")
 
         try:
             reason = kwargs.pop("reason")
@@ -315,6 +855,8 @@ class HTTPClient:
 
                         # check if we have rate limit header information
                         remaining = response.headers.get("X-Ratelimit-Remaining")
+                        if remaining is not None and bucket is not None:
+                            self._store_remaining(bucket, response, remaining)
                         if remaining == "0" and response.status != 429:
                             # we've depleted our current bucket
                             delta = utils._parse_ratelimit_header(
@@ -407,30 +949,115 @@ class HTTPClient:
             raise RuntimeError("Unreachable code in HTTP handling")
 
     async def get_from_cdn(self, url: str) -> bytes:
-        async with self.__session.get(url) as resp:
-            if resp.status == 200:
-                return await resp.read()
-            elif resp.status == 404:
-                raise NotFound(resp, "asset not found")
-            elif resp.status == 403:
-                raise Forbidden(resp, "cannot retrieve asset")
+        return await self._from_cdn(url, None)  # type: ignore
+
+    async def save_from_cdn(
+        self, url: str, fp: io.BufferedIOBase | str | os.PathLike[str]
+    ) -> int:
+        """Streams a CDN file into ``fp``, going through :attr:`cdn_cache`.
+
+        A path is only opened once the file was downloaded successfully.
+        """
+        return await self._from_cdn(url, fp)  # type: ignore
+
+    async def _from_cdn(
+        self, url: str, fp: io.BufferedIOBase | str | os.PathLike[str] | None
+    ) -> bytes | int:
+        loop = self.loop
+        cache = self.cdn_cache
+        if cache is not None:
+            path = await loop.run_in_executor(None, cache.path, url)
+            if path is not None:
+                try:
+                    result = await loop.run_in_executor(
+                        None, _consume_download, path, fp
+                    )
+                except FileNotFoundError:
+                    # evicted in the meantime
+                    pass
+                else:
+                    cache.hits += 1
+                    return result
+
+        # concurrent requests of the same file share one download, which
+        # keeps running as long as any of them is still waiting for it
+        key = CDNCache.key(url)
+        download = self._cdn_downloads.get(key)
+        if download is None:
+            download = self._cdn_downloads[key] = _CDNDownload()
+            download.task = loop.create_task(
+                self._download_from_cdn(url, key, download, to_file=fp is not None)
+            )
+        download.waiters += 1
+        commit = None
+        try:
+            result = await asyncio.shield(download.task)
+            data = await loop.run_in_executor(None, _consume_download, result, fp)
+        finally:
+            download.waiters -= 1
+            if not download.waiters:
+                commit = self._finish_cdn_download(key, download)
+        if commit is not None:
+            await commit
+        return data
+
+    def _finish_cdn_download(
+        self, key: str, download: _CDNDownload
+    ) -> asyncio.Future[None] | None:
+        if self._cdn_downloads.get(key) is download:
+            del self._cdn_downloads[key]
+        if not download.task.done():
+            download.task.cancel()
+        elif download.writer is not None and not download.task.cancelled():
+            # only cache the file once nobody reads the temporary file anymore
+            return self.loop.run_in_executor(None, download.writer.commit)
+        return None
+
+    async def _download_from_cdn(
+        self, url: str, key: str, download: _CDNDownload, *, to_file: bool
+    ) -> bytes | str:
+        cache = self.cdn_cache
+        loop = self.loop
+        try:
+            if cache is None and not to_file:
+                async with self._cdn_semaphore:
+                    async with self.__session.get(url) as resp:
+                        _raise_for_cdn_status(resp)
+                        return await resp.read()
+
+            if cache is not None:
+                cache.misses += 1
+                writer = await loop.run_in_executor(None, cache.writer, url)
             else:
-                raise HTTPException(resp, "failed to get asset")
+                writer = await loop.run_in_executor(
+                    None, _CDNFileWriter, None, None, key
+                )
+            try:
+                async for chunk in self.stream_from_cdn(url, 64 * 1024):
+                    await loop.run_in_executor(None, writer.write, chunk)
+                await loop.run_in_executor(None, writer.close)
+            except BaseException as exc:
+                abort = loop.run_in_executor(None, writer.abort)
+                if not isinstance(exc, asyncio.CancelledError):
+                    await abort
+                raise
+            download.writer = writer
+            return writer.path
+        except BaseException:
+            # failures are not shared with requests that come in later
+            if self._cdn_downloads.get(key) is download:
+                del self._cdn_downloads[key]
+            raise
 
     async def stream_from_cdn(self, url: str, chunksize: int) -> AsyncGenerator[bytes]:
         if not isinstance(chunksize, int) or chunksize < 1:
             raise InvalidArgument("The chunksize must be a positive integer.")
 
-        async with self.__session.get(url) as resp:
-            if resp.status == 200:
+        async with self._cdn_semaphore:
+            async with self.__session.get(url) as resp:
+                _raise_for_cdn_status(resp)
                 async for chunk in resp.content.iter_chunked(chunksize):
                     yield chunk
-            elif resp.status == 404:
-                raise NotFound(resp, "asset not found")
-            elif resp.status == 403:
-                raise Forbidden(resp, "cannot retrieve asset")
-            else:
-                raise HTTPException(resp, "failed to get asset")
 
     # state management
 
@@ -546,6 +1173,12 @@ class HTTPClient:
 
         return self.request(r, json=payload)
 
+    def send_serialized_message(
+        self, channel_id: Snowflake, payload: bytes
+    ) -> Response[message.Message]:
+        r = Route("POST", "/channels/{channel_id}/messages", channel_id=channel_id)
+        return self.request(r, encoded_json=payload)
+
     def send_typing(self, channel_id: Snowflake) -> Response[None]:
         return self.request(
             Route("POST", "/channels/{channel_id}/typing", channel_id=channel_id)
@@ -27,7 +27,14 @@ from __future__ import annotations
 
 import asyncio
 import datetime
-from collections.abc import AsyncIterator, Awaitable, Callable, Generator
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -45,6 +52,7 @@ from .utils import maybe_coroutine, snowflake_time, time_snowflake
 __all__ = (
     "ReactionIterator",
     "HistoryIterator",
+    "HistoryScanIterator",
     "AuditLogIterator",
     "GuildIterator",
     "MemberIterator",
@@ -122,9 +130,46 @@ class _AsyncIterator(AsyncIterator[T]):
     def filter(self, predicate: _Func[T, bool]) -> _FilteredAsyncIterator[T]:
         return _FilteredAsyncIterator(self, predicate)
 
+    def map_concurrent(
+        self, func: _Func[T, OT], *, limit: int = 10, ordered: bool = True
+    ) -> _ConcurrentMappedAsyncIterator[OT]:
+        if limit <= 0:
+            raise ValueError(
+                "async iterator concurrency limits must be greater than 0."
+            )
+        return _ConcurrentMappedAsyncIterator(self, func, limit, ordered)
+
+    def filter_concurrent(
+        self, predicate: _Func[T, bool], *, limit: int = 10, ordered: bool = True
+    ) -> _ConcurrentFilteredAsyncIterator[T]:
+        if limit <= 0:
+            raise ValueError(
+                "async iterator concurrency limits must be greater than 0."
+            )
+        return _ConcurrentFilteredAsyncIterator(self, predicate, limit, ordered)
+
+    def map_batches(
+        self,
+        func: _Func[list[T], OT],
+        max_size: int,
+        *,
+        limit: int = 10,
+        ordered: bool = True,
+    ) -> _ConcurrentMappedAsyncIterator[OT]:
+        return self.chunk(max_size).map_concurrent(func, limit=limit, ordered=ordered)
+
     async def flatten(self) -> list[T]:
         return [element async for element in self]
 
+    async def aclose(self) -> None:
+        self._close()
+
+    def _close(self) -> None:
+        # stops any work done ahead of the consumer, wrappers pass it on
+        iterator = getattr(self, "iterator", None)
+        if isinstance(iterator, _AsyncIterator):
+            iterator._close()
+
     async def __anext__(self) -> T:
         try:
             return await self.next()
@@ -299,7 +344,205 @@ class VoteIterator(_AsyncIterator[Union["User", "Member"]]):
                         await self.users.put(User(state=self.state, data=element))
 
 
-class HistoryIterator(_AsyncIterator["Message"]):
+class _PagePrefetcher:
+    """Fetches up to ``depth`` pages ahead of the consumer of a paginated iterator.
+
+    ``fetch`` retrieves the next page and advances the iterator's cursor, so at
+    most one request is in flight at a time. A falsy page ends the pagination.
+    Pages are only fetched ahead while ``quota`` reports that the rate limit
+    bucket has more than one request left, the page the consumer is waiting
+    for is always requested.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[Any]],
+        depth: int,
+        quota: Callable[[], int | None] | None = None,
+    ) -> None:
+        self.fetch = fetch
+        self.depth = depth
+        self.quota = quota
+        self.pages: deque[Any] = deque()
+        self.task: asyncio.Future[Any] | None = None
+        self.done = False
+
+    def _start(self) -> None:
+        self.task = asyncio.ensure_future(self.fetch())
+        self.task.add_done_callback(self._on_done)
+
+    def schedule(self) -> None:
+        if self.done or self.task is not None or len(self.pages) >= self.depth:
+            return
+        if self.quota is not None:
+            remaining = self.quota()
+            if remaining is not None and remaining <= 1:
+                return
+        self._start()
+
+    def _on_done(self, task: asyncio.Future[Any]) -> None:
+        self.task = None
+        if task.cancelled():
+            self.done = True
+            return
+
+        exc = task.exception()
+        if exc is not None:
+            self.pages.append(exc)
+            self.done = True
+            return
+
+        page = task.result()
+        self.pages.append(page)
+        if not page:
+            self.done = True
+        else:
+            self.schedule()
+
+    def cancel(self) -> None:
+        self.done = True
+        if self.task is not None:
+            self.task.cancel()
+
+    async def next_page(self) -> Any:
+        if not self.pages:
+            if self.task is None:
+                if self.done:
+                    return None
+                self._start()
+            await asyncio.wait((self.task,))  # type: ignore
+
+        page = self.pages.popleft()
+        if isinstance(page, BaseException):
+            raise page
+        self.schedule()
+        return page
+
+
+def _bucket_quota(
+    http: HTTPClient, method: str, path: str, **parameters: Any
+) -> Callable[[], int | None]:
+    from .http import Route
+
+    route = Route(method, path, **parameters)
+    return lambda: http.remaining_requests(route)
+
+
+class _PrefetchingAsyncIterator(_AsyncIterator[T]):
+    """An iterator that may request pages ahead of its consumer.
+
+    ``async for`` goes through an async generator, which the event loop closes
+    once the loop is left early, so the pages still being fetched in the
+    background are cancelled instead of using up the rate limit bucket.
+    """
+
+    _prefetcher: _PagePrefetcher | None
+
+    def __aiter__(self) -> AsyncGenerator[T]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncGenerator[T]:
+        try:
+            while True:
+                try:
+                    element = await self.next()
+                except NoMoreItems:
+                    return
+                yield element
+        finally:
+            self._close()
+
+    def _close(self) -> None:
+        if self._prefetcher is not None:
+            self._prefetcher.cancel()
+
+
+class _ConcurrentMappedAsyncIterator(_AsyncIterator[T]):
+    """Keeps up to ``limit`` calls of ``func`` in flight.
+
+    Elements are only pulled from the underlying iterator while fewer than
+    ``limit`` results are pending or waiting to be consumed, so a slow consumer
+    holds back the producer. If a call raises, the other pending calls are
+    cancelled and the error is propagated.
+    """
+
+    def __init__(self, iterator, func, limit, ordered):
+        self.iterator = iterator
+        self.func = func
+        self.limit = limit
+        self.ordered = ordered
+        self._pending: deque[asyncio.Future[tuple[Any, Any]]] = deque()
+        self._done: deque[asyncio.Future[tuple[Any, Any]]] = deque()
+        self._exhausted = False
+
+    async def _call(self, item):
+        return item, await maybe_coroutine(self.func, item)
+
+    async def _fill(self) -> None:
+        while not self._exhausted and len(self._pending) + len(self._done) < self.limit:
+            try:
+                item = await self.iterator.next()
+            except NoMoreItems:
+                self._exhausted = True
+            else:
+                self._pending.append(asyncio.ensure_future(self._call(item)))
+
+    async def _next_result(self) -> tuple[Any, Any]:
+        await self._fill()
+        if self.ordered:
+            if not self._pending:
+                raise NoMoreItems()
+            future = self._pending[0]
+            await asyncio.wait((future,))
+            self._pending.popleft()
+        else:
+            if not self._done:
+                if not self._pending:
+                    raise NoMoreItems()
+                done, _ = await asyncio.wait(
+                    self._pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    self._pending.remove(future)
+                self._done.extend(done)
+            future = self._done.popleft()
+
+        try:
+            return future.result()
+        except BaseException:
+            self._cancel()
+            raise
+
+    def _cancel(self) -> None:
+        self._exhausted = True
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._done.clear()
+
+    def _close(self) -> None:
+        self._cancel()
+        super()._close()
+
+    async def next(self) -> T:
+        _, value = await self._next_result()
+        return value
+
+
+class _ConcurrentFilteredAsyncIterator(_ConcurrentMappedAsyncIterator[T]):
+    def __init__(self, iterator, predicate, limit, ordered):
+        if predicate is None:
+            predicate = _identity
+        super().__init__(iterator, predicate, limit, ordered)
+
+    async def next(self) -> T:
+        while True:
+            item, ret = await self._next_result()
+            if ret:
+                return item
+
+
+class HistoryIterator(_PrefetchingAsyncIterator["Message"]):
     """Iterator for receiving a channel's message history.
 
     The messages endpoint has two behaviours we care about here:
@@ -331,6 +574,10 @@ class HistoryIterator(_AsyncIterator["Message"]):
     oldest_first: Optional[:class:`bool`]
         If set to ``True``, return messages in oldest->newest order. Defaults to
         ``True`` if `after` is specified, otherwise ``False``.
+    prefetch: :class:`int`
+        The number of pages to request ahead while the current one is consumed.
+
+        .. versionadded:: 2.9
     """
 
     def __init__(
@@ -341,6 +588,7 @@ class HistoryIterator(_AsyncIterator["Message"]):
         after=None,
         around=None,
         oldest_first=None,
+        prefetch=0,
     ):
         if isinstance(before, datetime.datetime):
             before = Object(id=time_snowflake(before, high=False))
@@ -355,8 +603,10 @@ class HistoryIterator(_AsyncIterator["Message"]):
         self.before = before
         self.after = after or OLDEST_OBJECT
         self.around = around
+        self.prefetch = prefetch
 
         self._filter = None  # message dict -> bool
+        self._prefetcher: _PagePrefetcher | None = None
 
         self.state = self.messageable._state
         self.logs_from = self.state.http.logs_from
@@ -406,27 +656,50 @@ class HistoryIterator(_AsyncIterator["Message"]):
         self.retrieve = r
         return r > 0
 
-    async def fill_messages(self):
+    async def _setup(self) -> None:
         if not hasattr(self, "channel"):
             # do the required set up
-            channel = await self.messageable._get_channel()
-            self.channel = channel
+            self._set_channel(await self.messageable._get_channel())
+
+    def _set_channel(self, channel: MessageableChannel) -> None:
+        self.channel = channel
+        if self.prefetch > 0:
+            quota = _bucket_quota(
+                self.state.http,
+                "GET",
+                "/channels/{channel_id}/messages",
+                channel_id=channel.id,
+            )
+            self._prefetcher = _PagePrefetcher(self._fetch_page, self.prefetch, quota)
 
-        if self._get_retrieve():
-            data = await self._retrieve_messages(self.retrieve)
-            if len(data) < 100:
-                self.limit = 0  # terminate the infinite loop
+    async def _fetch_page(self) -> list[MessagePayload] | None:
+        if not self._get_retrieve():
+            return None
+        data = await self._retrieve_messages(self.retrieve)
+        if len(data) < 100:
+            self.limit = 0  # terminate the infinite loop
+        return data
 
-            if self.reverse:
-                data = reversed(data)
-            if self._filter:
-                data = filter(self._filter, data)
+    async def fill_messages(self):
+        await self._setup()
 
-            channel = self.channel
-            for element in data:
-                await self.messages.put(
-                    self.state.create_message(channel=channel, data=element)
-                )
+        if self._prefetcher is None:
+            data = await self._fetch_page()
+        else:
+            data = await self._prefetcher.next_page()
+        if not data:
+            return
+
+        if self.reverse:
+            data = reversed(data)
+        if self._filter:
+            data = filter(self._filter, data)
+
+        channel = self.channel
+        for element in data:
+            await self.messages.put(
+                self.state.create_message(channel=channel, data=element)
+            )
 
     async def _retrieve_messages(self, retrieve: int) -> list[MessagePayload]:
         """Retrieve messages and update next parameters."""
@@ -444,6 +717,9 @@ class HistoryIterator(_AsyncIterator["Message"]):
             if self.limit is not None:
                 self.limit -= retrieve
             self.before = Object(id=int(data[-1]["id"]))
+            if self.before.id <= self.after.id:
+                # every older page would be filtered out
+                self.limit = 0
         return data
 
     async def _retrieve_messages_after_strategy(
@@ -458,6 +734,9 @@ class HistoryIterator(_AsyncIterator["Message"]):
             if self.limit is not None:
                 self.limit -= retrieve
             self.after = Object(id=int(data[0]["id"]))
+            if self.before and self.after.id >= self.before.id:
+                # every newer page would be filtered out
+                self.limit = 0
         return data
 
     async def _retrieve_messages_around_strategy(
@@ -474,7 +753,101 @@ class HistoryIterator(_AsyncIterator["Message"]):
         return []
 
 
-class AuditLogIterator(_AsyncIterator["AuditLogEntry"]):
+class HistoryScanIterator(_PrefetchingAsyncIterator["Message"]):
+    """Iterator for scanning a range of a channel's message history in windows.
+
+    The range between ``after`` and ``before`` is split into ``windows`` equally
+    long snowflake windows, each paginated by its own :class:`HistoryIterator`.
+    The windows share the channel's rate limit bucket, so their requests are
+    serialized; the gain is that each window keeps ``prefetch`` pages buffered
+    while earlier windows are consumed. Messages are still yielded in order.
+
+    .. versionadded:: 2.9
+
+    Parameters
+    ----------
+    messageable: :class:`abc.Messageable`
+        Messageable class to retrieve message history from.
+    after: Union[:class:`abc.Snowflake`, :class:`datetime.datetime`]
+        Message after which all messages must be.
+    before: Optional[Union[:class:`abc.Snowflake`, :class:`datetime.datetime`]]
+        Message before which all messages must be. Defaults to now.
+    windows: :class:`int`
+        The number of windows to split the range into.
+    prefetch: :class:`int`
+        The number of pages to buffer for each window.
+    oldest_first: :class:`bool`
+        Whether to return messages in oldest->newest order.
+    """
+
+    def __init__(
+        self,
+        messageable,
+        after,
+        before=None,
+        *,
+        windows=4,
+        prefetch=1,
+        oldest_first=True,
+    ):
+        if windows < 1:
+            raise ValueError("windows must be greater than 0.")
+
+        if isinstance(after, datetime.datetime):
+            after = Object(id=time_snowflake(after, high=True))
+        if before is None:
+            before = datetime.datetime.now(datetime.timezone.utc)
+        if isinstance(before, datetime.datetime):
+            before = Object(id=time_snowflake(before, high=False))
+
+        self.messageable = messageable
+        self.after = after
+        self.before = before
+        self.oldest_first = oldest_first
+
+        low, high = after.id, before.id
+        bounds = [low + (high - low) * i // windows for i in range(windows + 1)]
+        self.windows: list[HistoryIterator] = [
+            HistoryIterator(
+                messageable,
+                limit=None,
+                # the bounds are exclusive, so the windows start one id earlier
+                after=Object(id=start - 1 if i else start),
+                before=Object(id=end),
+                oldest_first=oldest_first,
+                prefetch=max(prefetch, 1),
+            )
+            for i, (start, end) in enumerate(zip(bounds, bounds[1:]))
+            if end > start
+        ]
+        if not oldest_first:
+            self.windows.reverse()
+        self._started = False
+
+    async def _start(self) -> None:
+        channel = await self.messageable._get_channel()
+        for window in self.windows:
+            window._set_channel(channel)
+            window._prefetcher.schedule()  # type: ignore
+        self._started = True
+
+    async def next(self) -> Message:
+        if not self._started:
+            await self._start()
+
+        while self.windows:
+            try:
+                return await self.windows[0].next()
+            except NoMoreItems:
+                del self.windows[0]
+        raise NoMoreItems()
+
+    def _close(self) -> None:
+        for window in self.windows:
+            window._close()
+
+
+class AuditLogIterator(_PrefetchingAsyncIterator["AuditLogEntry"]):
     def __init__(
         self,
         guild,
@@ -483,6 +856,7 @@ class AuditLogIterator(_AsyncIterator["AuditLogEntry"]):
         after=None,
         user_id=None,
         action_type=None,
+        prefetch=0,
     ):
         if isinstance(before, datetime.datetime):
             before = Object(id=time_snowflake(before, high=False))
@@ -500,6 +874,15 @@ class AuditLogIterator(_AsyncIterator["AuditLogEntry"]):
         self._users = {}
         self._state = guild._state
         self.entries = asyncio.Queue()
+        self._prefetcher: _PagePrefetcher | None = None
+        if prefetch > 0:
+            quota = _bucket_quota(
+                self._state.http,
+                "GET",
+                "/guilds/{guild_id}/audit-logs",
+                guild_id=guild.id,
+            )
+            self._prefetcher = _PagePrefetcher(self._fetch_page, prefetch, quota)
 
     async def _retrieve_entries(self, retrieve):
         if not self._get_retrieve():
@@ -544,22 +927,33 @@ class AuditLogIterator(_AsyncIterator["AuditLogEntry"]):
         self.retrieve = r
         return r > 0
 
+    async def _fetch_page(self):
+        if not self._get_retrieve():
+            return None
+        users, data = await self._retrieve_entries(self.retrieve)
+        if len(data) < 100:
+            self.limit = 0  # terminate the infinite loop
+        return (users, data) if data else None
+
     async def _fill(self):
         from .user import User
 
-        if self._get_retrieve():
-            users, data = await self._retrieve_entries(self.retrieve)
-            if len(data) < 100:
-                self.limit = 0  # terminate the infinite loop
+        if self._prefetcher is None:
+            page = await self._fetch_page()
+        else:
+            page = await self._prefetcher.next_page()
+        if page is None:
+            return
 
-            for user in users:
-                u = User(data=user, state=self._state)
-                self._users[u.id] = u
+        users, data = page
+        for user in users:
+            u = User(data=user, state=self._state)
+            self._users[u.id] = u
 
-            for element in data:
-                await self.entries.put(
-                    AuditLogEntry(data=element, users=self._users, guild=self.guild)
-                )
+        for element in data:
+            await self.entries.put(
+                AuditLogEntry(data=element, users=self._users, guild=self.guild)
+            )
 
 
 class GuildIterator(_AsyncIterator["Guild"]):
@@ -686,8 +1080,8 @@ class GuildIterator(_AsyncIterator["Guild"]):
         return data
 
 
-class MemberIterator(_AsyncIterator["Member"]):
-    def __init__(self, guild, limit=1000, after=None):
+class MemberIterator(_PrefetchingAsyncIterator["Member"]):
+    def __init__(self, guild, limit=1000, after=None, prefetch=0):
         if isinstance(after, datetime.datetime):
             after = Object(id=time_snowflake(after, high=True))
 
@@ -698,6 +1092,15 @@ class MemberIterator(_AsyncIterator["Member"]):
         self.state = self.guild._state
         self.get_members = self.state.http.get_members
         self.members = asyncio.Queue()
+        self._prefetcher: _PagePrefetcher | None = None
+        if prefetch > 0:
+            quota = _bucket_quota(
+                self.state.http,
+                "GET",
+                "/guilds/{guild_id}/members",
+                guild_id=guild.id,
+            )
+            self._prefetcher = _PagePrefetcher(self._fetch_page, prefetch, quota)
 
     async def next(self) -> Member:
         if self.members.empty():
@@ -717,19 +1120,30 @@ class MemberIterator(_AsyncIterator["Member"]):
         self.retrieve = r
         return r > 0
 
-    async def fill_members(self):
+    async def _fetch_page(self):
         if not self._get_retrieve():
-            return
+            return None
         after = self.after.id if self.after else None
         data = await self.get_members(self.guild.id, self.retrieve, after)
         if not data:
             # no data, terminate
-            return
+            return None
+        if self.limit:
+            self.limit -= self.retrieve
 
         if len(data) < 1000:
             self.limit = 0  # terminate loop
 
         self.after = Object(id=int(data[-1]["user"]["id"]))
+        return data
+
+    async def fill_members(self):
+        if self._prefetcher is None:
+            data = await self._fetch_page()
+        else:
+            data = await self._prefetcher.next_page()
+        if not data:
+            return
 
         for element in reversed(data):
             await self.members.put(self.create_member(element))
@@ -740,8 +1154,8 @@ class MemberIterator(_AsyncIterator["Member"]):
         return Member(data=data, guild=self.guild, state=self.state)
 
 
-class BanIterator(_AsyncIterator["BanEntry"]):
-    def __init__(self, guild, limit=None, before=None, after=None):
+class BanIterator(_PrefetchingAsyncIterator["BanEntry"]):
+    def __init__(self, guild, limit=None, before=None, after=None, prefetch=0):
         self.guild = guild
         self.limit = limit
         self.after = after
@@ -750,6 +1164,12 @@ class BanIterator(_AsyncIterator["BanEntry"]):
         self.state = self.guild._state
         self.get_bans = self.state.http.get_bans
         self.bans = asyncio.Queue()
+        self._prefetcher: _PagePrefetcher | None = None
+        if prefetch > 0:
+            quota = _bucket_quota(
+                self.state.http, "GET", "/guilds/{guild_id}/bans", guild_id=guild.id
+            )
+            self._prefetcher = _PagePrefetcher(self._fetch_page, prefetch, quota)
 
     async def next(self) -> BanEntry:
         if self.bans.empty():
@@ -769,15 +1189,15 @@ class BanIterator(_AsyncIterator["BanEntry"]):
         self.retrieve = r
         return r > 0
 
-    async def fill_bans(self):
+    async def _fetch_page(self):
         if not self._get_retrieve():
-            return
+            return None
         before = self.before.id if self.before else None
         after = self.after.id if self.after else None
         data = await self.get_bans(self.guild.id, self.retrieve, before, after)
         if not data:
             # no data, terminate
-            return
+            return None
         if self.limit:
             self.limit -= self.retrieve
 
@@ -785,6 +1205,15 @@ class BanIterator(_AsyncIterator["BanEntry"]):
             self.limit = 0  # terminate loop
 
         self.after = Object(id=int(data[-1]["user"]["id"]))
+        return data
+
+    async def fill_bans(self):
+        if self._prefetcher is None:
+            data = await self._fetch_page()
+        else:
+            data = await self._prefetcher.next_page()
+        if not data:
+            return
 
         for element in reversed(data):
             await self.bans.put(self.create_ban(element))
@@ -297,6 +297,12 @@ class Attachment(Hashable):
 
         Saves this attachment into a file-like object.
 
+        The attachment is streamed into the file instead of being read into
+        memory first, and served from the client's CDN cache if it has one.
+
+        .. versionchanged:: 2.9
+            The attachment is streamed into the file.
+
         Parameters
         ----------
         fp: Union[:class:`io.BufferedIOBase`, :class:`os.PathLike`]
@@ -332,28 +338,29 @@ class Attachment(Hashable):
         """
         if chunksize is not None:
             data = self.read_chunked(use_cached=use_cached, chunksize=chunksize)
-        else:
-            data = await self.read(use_cached=use_cached)
+            return await self._save_chunks(data, fp, seek_begin)
 
+        url = self.proxy_url if use_cached else self.url
+        written = await self._http.save_from_cdn(url, fp)
+        if seek_begin and isinstance(fp, io.BufferedIOBase):
+            fp.seek(0)
+        return written
+
+    @staticmethod
+    async def _save_chunks(
+        data: AsyncGenerator[bytes], fp: io.BufferedIOBase | PathLike, seek_begin: bool
+    ) -> int:
+        written = 0
         if isinstance(fp, io.BufferedIOBase):
-            if chunksize is not None:
-                written = 0
-                async for chunk in data:
-                    written += fp.write(chunk)
-            else:
-                written = fp.write(data)
+            async for chunk in data:
+                written += fp.write(chunk)
             if seek_begin:
                 fp.seek(0)
-            return written
         else:
             with open(fp, "wb") as f:
-                if chunksize is not None:
-                    written = 0
-                    async for chunk in data:
-                        written += f.write(chunk)
-                    return written
-                else:
-                    return f.write(data)
+                async for chunk in data:
+                    written += f.write(chunk)
+        return written
 
     async def read(self, *, use_cached: bool = False) -> bytes:
         """|coro|
@@ -1348,6 +1355,10 @@ class Message(Hashable):
             # It's a user here
             # TODO: consider adding to cache here
             self.author = Member._from_message(message=self, data=member)
+        else:
+            if isinstance(self.guild, Guild):
+                # the nickname may have changed
+                self.guild._update_member_names(author)  # type: ignore
 
     def _handle_mentions(self, mentions: list[UserWithMemberPayload]) -> None:
         self.mentions = r = []
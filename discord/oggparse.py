@@ -25,6 +25,8 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import mmap
+import os
 import struct
 from collections.abc import Generator
 from typing import IO, TYPE_CHECKING, ClassVar
@@ -45,6 +47,10 @@ class OggError(DiscordException):
 # https://tools.ietf.org/html/rfc3533
 # https://tools.ietf.org/html/rfc7845
 
+_PAGE_HEADER = struct.Struct("<4sxBQIIIB")
+# the smallest page there is, a header with an empty segment table
+_MIN_PAGE_SIZE = _PAGE_HEADER.size
+
 
 class OggPage:
     _header: ClassVar[struct.Struct] = struct.Struct("<xBQIIIB")
@@ -55,10 +61,15 @@ class OggPage:
         pagenum: int
         crc: int
         segnum: int
+        segtable: bytes | memoryview
+        data: bytes | memoryview
+
+    def __init__(self, stream: IO[bytes] | None) -> None:
+        if stream is None:
+            return
 
-    def __init__(self, stream: IO[bytes]) -> None:
         try:
-            header = stream.read(struct.calcsize(self._header.format))
+            header = stream.read(self._header.size)
 
             (
                 self.flag,
@@ -69,13 +80,48 @@ class OggPage:
                 self.segnum,
             ) = self._header.unpack(header)
 
-            self.segtable: bytes = stream.read(self.segnum)
-            bodylen = sum(struct.unpack("B" * self.segnum, self.segtable))
-            self.data: bytes = stream.read(bodylen)
+            self.segtable = stream.read(self.segnum)
+            self.data = stream.read(sum(self.segtable))
         except Exception:
             raise OggError("bad data stream") from None
 
-    def iter_packets(self) -> Generator[tuple[bytes, bool]]:
+    @classmethod
+    def from_buffer(cls, buffer: memoryview, offset: int = 0) -> OggPage:
+        """Creates a page from the ``OggS`` capture pattern at ``offset`` of
+        ``buffer`` without copying its segment table or body.
+        """
+        self = cls(None)
+        try:
+            (
+                magic,
+                self.flag,
+                self.gran_pos,
+                self.serial,
+                self.pagenum,
+                self.crc,
+                self.segnum,
+            ) = _PAGE_HEADER.unpack_from(buffer, offset)
+        except struct.error:
+            raise OggError("bad data stream") from None
+
+        if magic != b"OggS":
+            raise OggError("invalid header magic")
+
+        offset += _PAGE_HEADER.size
+        self.segtable = buffer[offset : offset + self.segnum]
+        offset += self.segnum
+        bodylen = sum(self.segtable)
+        self.data = buffer[offset : offset + bodylen]
+        if len(self.segtable) != self.segnum or len(self.data) != bodylen:
+            raise OggError("bad data stream")
+        return self
+
+    @property
+    def size(self) -> int:
+        """The full size of this page, including the header."""
+        return _PAGE_HEADER.size + self.segnum + len(self.data)
+
+    def iter_packets(self) -> Generator[tuple[bytes | memoryview, bool]]:
         packetlen = offset = 0
         partial = True
 
@@ -95,17 +141,117 @@ class OggPage:
 
 
 class OggStream:
-    def __init__(self, stream: IO[bytes]) -> None:
-        self.stream: IO[bytes] = stream
+    """Parses Opus packets out of an Ogg stream.
+
+    Pages are read into a reusable buffer and parsed in place, so no
+    intermediate objects are created per page or per segment. Use
+    :meth:`from_file` to memory-map a local file instead of reading it.
+
+    Parameters
+    ----------
+    stream: Optional[:term:`py:file object`]
+        The stream to read the pages from.
+    buffer_size: :class:`int`
+        The initial size of the read buffer. It grows if a page does not fit.
+    """
+
+    def __init__(self, stream: IO[bytes] | None, *, buffer_size: int = 65536) -> None:
+        self.stream: IO[bytes] | None = stream
+        self._buffer: bytearray | mmap.mmap = bytearray(buffer_size)
+        self._view: memoryview = memoryview(self._buffer)
+        self._start: int = 0
+        self._end: int = 0
+        self._eof: bool = stream is None
+
+        if stream is not None:
+            read = getattr(stream, "readinto1", None) or getattr(
+                stream, "readinto", None
+            )
+            self._readinto = read or self._readinto_fallback
+
+    @classmethod
+    def from_file(cls, fp: str | os.PathLike[str] | IO[bytes]) -> OggStream:
+        """Memory-maps a local Ogg file.
+
+        Packets yielded by :meth:`iter_packet_views` point straight into the
+        mapping, so playing a file does not copy any packet data.
+
+        Parameters
+        ----------
+        fp: Union[:class:`str`, :class:`os.PathLike`, :term:`py:file object`]
+            The path of the file, or a file object opened in binary mode.
+        """
+        if isinstance(fp, (str, os.PathLike)):
+            with open(fp, "rb") as f:
+                mapping = cls._map(f.fileno())
+        else:
+            mapping = cls._map(fp.fileno())
+
+        self = cls(None, buffer_size=0)
+        if mapping is None:
+            # empty files can't be mapped, they have no pages anyway
+            return self
+        self._buffer = mapping
+        self._view = memoryview(mapping)
+        self._end = len(mapping)
+        return self
+
+    @staticmethod
+    def _map(fileno: int) -> mmap.mmap | None:
+        if os.fstat(fileno).st_size == 0:
+            return None
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+    def close(self) -> None:
+        """Releases the read buffer or memory mapping.
+
+        Views yielded by :meth:`iter_packet_views` must not be used afterwards.
+        """
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            try:
+                self._buffer.close()
+            except BufferError:
+                # a view is still being held somewhere, it's unmapped once collected
+                pass
+
+    def _readinto_fallback(self, buffer: memoryview) -> int:
+        data = self.stream.read(len(buffer))  # type: ignore
+        buffer[: len(data)] = data
+        return len(data)
+
+    def _fill(self, size: int) -> bool:
+        """Ensures that ``size`` bytes are available from ``self._start``."""
+        available = self._end - self._start
+        if available >= size:
+            return True
+        if self._eof:
+            return False
+
+        if self._start + size > len(self._buffer):
+            if size > len(self._buffer):
+                # views handed out earlier keep the old buffer alive
+                buffer = bytearray(max(size, len(self._buffer) * 2))
+                buffer[:available] = self._view[self._start : self._end]
+                self._buffer = buffer
+                self._view = memoryview(buffer)
+            else:
+                self._view[:available] = self._view[self._start : self._end]
+            self._start, self._end = 0, available
+
+        while self._end - self._start < size:
+            read = self._readinto(self._view[self._end :])
+            if not read:
+                self._eof = True
+                return False
+            self._end += read
+        return True
 
     def _next_page(self) -> OggPage | None:
-        head = self.stream.read(4)
-        if head == b"OggS":
-            return OggPage(self.stream)
-        elif not head:
+        start = self._read_page()
+        if start is None:
             return None
-        else:
-            raise OggError("invalid header magic")
+        return OggPage.from_buffer(self._view, start)
 
     def _iter_pages(self) -> Generator[OggPage]:
         page = self._next_page()
@@ -113,11 +259,69 @@ class OggStream:
             yield page
             page = self._next_page()
 
+    def _read_page(self) -> int | None:
+        """Makes sure the next page is fully buffered, validates its header
+        and consumes it, returning the offset the page starts at.
+        """
+        if not self._fill(_MIN_PAGE_SIZE):
+            if self._end != self._start:
+                raise OggError("bad data stream")
+            return None
+
+        start = self._start
+        if self._view[start : start + 4] != b"OggS":
+            raise OggError("invalid header magic")
+
+        segnum = self._view[start + _MIN_PAGE_SIZE - 1]
+        if not self._fill(_MIN_PAGE_SIZE + segnum):
+            raise OggError("bad data stream")
+
+        start = self._start
+        table = start + _MIN_PAGE_SIZE
+        size = _MIN_PAGE_SIZE + segnum + sum(self._view[table : table + segnum])
+        if not self._fill(size):
+            raise OggError("bad data stream")
+
+        start = self._start
+        self._start += size
+        return start
+
+    def _iter_packets(self, copy: bool) -> Generator[bytes | memoryview]:
+        partial = bytearray()
+        while (start := self._read_page()) is not None:
+            view = self._view
+            table = start + _MIN_PAGE_SIZE
+            segnum = view[table - 1]
+            offset = table + segnum
+            packetlen = 0
+
+            for seg in view[table : table + segnum]:
+                packetlen += seg
+                if seg == 255:
+                    continue
+
+                end = offset + packetlen
+                if partial:
+                    partial += view[offset:end]
+                    yield bytes(partial) if copy else memoryview(bytes(partial))
+                    partial.clear()
+                else:
+                    yield view[offset:end].tobytes() if copy else view[offset:end]
+                offset = end
+                packetlen = 0
+
+            if packetlen:
+                partial += view[offset : offset + packetlen]
+
+    def iter_packet_views(self) -> Generator[memoryview]:
+        """Iterates over the packets of the stream without copying them.
+
+        Every packet is only valid until the next one is requested, unless the
+        stream was created with :meth:`from_file`. Packets spanning multiple
+        pages are the only ones that have to be joined and copied.
+        """
+        return self._iter_packets(False)  # type: ignore
+
     def iter_packets(self) -> Generator[bytes]:
-        partial = b""
-        for page in self._iter_pages():
-            for data, complete in page.iter_packets():
-                partial += data
-                if complete:
-                    yield partial
-                    partial = b""
+        """Iterates over the packets of the stream as :class:`bytes`."""
+        return self._iter_packets(True)  # type: ignore
@@ -27,27 +27,40 @@ from __future__ import annotations
 
 import array
 import asyncio
+import hashlib
 import io
 import json
 import logging
+import operator
+import os
+import queue
 import re
 import shlex
 import subprocess
 import sys
+import tempfile
 import threading
 import time
 import warnings
+from collections import OrderedDict, deque
 from collections.abc import Callable
 from math import floor
 from typing import IO, TYPE_CHECKING, Any, Generic, TypeVar
 
 from .enums import SpeakingState
 from .errors import ClientException
-from .oggparse import OggStream
+from .oggparse import OggError, OggStream
 from .opus import OPUS_SILENCE
 from .opus import Encoder as OpusEncoder
 from .utils import MISSING
 
+try:
+    import numpy
+except ModuleNotFoundError:
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
 if TYPE_CHECKING:
     from typing_extensions import Self
 
@@ -63,9 +76,16 @@ __all__ = (
     "AudioSource",
     "PCMAudio",
     "FFmpegAudio",
+    "FFmpegProcessPool",
     "FFmpegPCMAudio",
     "FFmpegOpusAudio",
+    "OggOpusAudio",
+    "OpusCache",
     "PCMVolumeTransformer",
+    "PCMMixer",
+    "MixerInput",
+    "AudioQueue",
+    "QueueEntry",
 )
 
 CREATE_NO_WINDOW: int
@@ -141,13 +161,211 @@ class PCMAudio(AudioSource):
         return ret
 
 
+class FFmpegProcessPool:
+    """A pool of pre-spawned ffmpeg processes.
+
+    Starting ffmpeg takes a noticeable amount of time. When an :class:`FFmpegAudio`
+    is created with a pool, the pool remembers its argument set and keeps ``size``
+    idle processes with the exact same arguments running, so that the next source
+    with those arguments starts with a warm process.
+
+    This works best for sources created with ``pipe=True``, as their arguments do
+    not contain the input, and for sounds that are played over and over again.
+
+    .. versionadded:: 2.9
+
+    Parameters
+    ----------
+    size: :class:`int`
+        The amount of idle processes to keep per argument set.
+    max_argument_sets: :class:`int`
+        The amount of argument sets to keep processes for. The least recently used
+        argument set is dropped first.
+    max_idle: :class:`float`
+        The amount of seconds an idle process is kept for before being replaced.
+
+    Attributes
+    ----------
+    hits: :class:`int`
+        How many sources got a warm process.
+    misses: :class:`int`
+        How many sources had to spawn a new process.
+    """
+
+    def __init__(
+        self, *, size: int = 1, max_argument_sets: int = 8, max_idle: float = 60.0
+    ) -> None:
+        self.size: int = size
+        self.max_argument_sets: int = max_argument_sets
+        self.max_idle: float = max_idle
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._idle: OrderedDict[tuple[Any, ...], deque[tuple[float, subprocess.Popen]]]
+        self._idle = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self._closed: bool = False
+
+    def __repr__(self) -> str:
+        return (
+            f"<FFmpegProcessPool size={self.size} idle={self.idle_count} "
+            f"hits={self.hits} misses={self.misses}>"
+        )
+
+    @property
+    def idle_count(self) -> int:
+        """The amount of idle processes currently held by the pool."""
+        return sum(len(processes) for processes in self._idle.values())
+
+    @staticmethod
+    def _make_key(args: list[str], kwargs: dict[str, Any]) -> tuple[Any, ...] | None:
+        stderr = kwargs.get("stderr")
+        if stderr is not None and not isinstance(stderr, int):
+            # a process writing into a specific file can't be handed to someone else
+            return None
+        items = tuple(sorted((k, v) for k, v in kwargs.items() if k != "stderr"))
+        return tuple(args), stderr, items
+
+    @staticmethod
+    def _kill(process: subprocess.Popen) -> None:
+        try:
+            process.kill()
+            process.communicate(timeout=5)
+        except Exception:
+            _log.debug("Ignoring error killing pooled ffmpeg process", exc_info=True)
+
+    def _spawn(self, key: tuple[Any, ...], args: list[str], kwargs: dict[str, Any]):
+        try:
+            process = subprocess.Popen(args, creationflags=CREATE_NO_WINDOW, **kwargs)
+        except Exception:
+            _log.debug("Could not pre-spawn ffmpeg process %s", args, exc_info=True)
+            return
+
+        with self._lock:
+            processes = self._idle.get(key)
+            keep = not (
+                self._closed or processes is None or len(processes) >= self.size
+            )
+            if keep:
+                processes.append((time.monotonic(), process))  # type: ignore
+                _log.debug("Pre-spawned ffmpeg process %s", process.pid)
+
+        if not keep:
+            self._kill(process)
+
+    def _replenish(self, key: tuple[Any, ...], args: list[str], kwargs: dict[str, Any]):
+        with self._lock:
+            if self._closed:
+                return
+            missing = self.size - len(self._idle[key])
+
+        for _ in range(missing):
+            threading.Thread(
+                target=self._spawn,
+                args=(key, args, kwargs),
+                daemon=True,
+                name="ffmpeg-process-pool-spawner",
+            ).start()
+
+    def prewarm(self, args: list[str], **subprocess_kwargs: Any) -> None:
+        r"""Starts spawning idle processes for an argument set in the background.
+
+        Parameters
+        ----------
+        args: List[:class:`str`]
+            The full command line, including the executable.
+        \*\*subprocess_kwargs
+            The keyword arguments passed to :class:`subprocess.Popen`.
+        """
+        subprocess_kwargs.setdefault("stdout", subprocess.PIPE)
+        key = self._make_key(args, subprocess_kwargs)
+        if key is None:
+            return
+
+        expired = self._register(key)
+        for process in expired:
+            self._kill(process)
+        self._replenish(key, list(args), subprocess_kwargs)
+
+    def _register(self, key: tuple[Any, ...]) -> list[subprocess.Popen]:
+        # returns the processes that have to be killed outside the lock
+        expired = []
+        now = time.monotonic()
+        with self._lock:
+            processes = self._idle.get(key)
+            if processes is None:
+                processes = self._idle[key] = deque()
+            self._idle.move_to_end(key)
+
+            while len(self._idle) > self.max_argument_sets:
+                _, dropped = self._idle.popitem(last=False)
+                expired.extend(process for _, process in dropped)
+
+            for spawned_at, process in list(processes):
+                if now - spawned_at > self.max_idle or process.poll() is not None:
+                    processes.remove((spawned_at, process))
+                    expired.append(process)
+        return expired
+
+    def acquire(
+        self, args: list[str], **subprocess_kwargs: Any
+    ) -> subprocess.Popen | None:
+        r"""Takes an idle process for an argument set out of the pool.
+
+        The argument set is remembered and the pool is refilled in the background.
+
+        Parameters
+        ----------
+        args: List[:class:`str`]
+            The full command line, including the executable.
+        \*\*subprocess_kwargs
+            The keyword arguments passed to :class:`subprocess.Popen`.
+
+        Returns
+        -------
+        Optional[:class:`subprocess.Popen`]
+            The process, or ``None`` if no warm process was available.
+        """
+        key = self._make_key(args, subprocess_kwargs)
+        if key is None:
+            return None
+
+        expired = self._register(key)
+        with self._lock:
+            processes = self._idle[key]
+            process = processes.popleft()[1] if processes else None
+            if process is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        for proc in expired:
+            self._kill(proc)
+        self._replenish(key, list(args), subprocess_kwargs)
+        return process
+
+    def close(self) -> None:
+        """Kills all idle processes and stops refilling the pool."""
+        with self._lock:
+            self._closed = True
+            processes = [p for procs in self._idle.values() for _, p in procs]
+            self._idle.clear()
+
+        for process in processes:
+            self._kill(process)
+
+
 class FFmpegAudio(AudioSource):
     """Represents an FFmpeg (or AVConv) based AudioSource.
 
     User created AudioSources using FFmpeg differently from how :class:`FFmpegPCMAudio` and
-    :class:`FFmpegOpusAudio` work should subclass this.
+    :class:`FFmpegOpusAudio` work should subclass this, implement :meth:`_read_frame`
+    and call :meth:`_start_read_ahead` at the end of their ``__init__``.
 
     .. versionadded:: 1.3
+
+    .. versionchanged:: 2.9
+        Added read-ahead buffering, process pooling and playback statistics.
     """
 
     BLOCKSIZE: int = io.DEFAULT_BUFFER_SIZE
@@ -158,8 +376,19 @@ class FFmpegAudio(AudioSource):
         *,
         executable: str = "ffmpeg",
         args: Any,
+        read_ahead: int = 0,
+        pool: FFmpegProcessPool | None = None,
         **subprocess_kwargs: Any,
     ):
+        self._created_at: float = time.perf_counter()
+        self._time_to_first_frame: float | None = None
+        self._underruns: int = 0
+        self._pool: FFmpegProcessPool | None = pool
+        self._read_ahead: int = read_ahead
+        self._frame_queue: queue.Queue[bytes] | None = None
+        self._read_ahead_thread: threading.Thread | None = None
+        self._read_ahead_stop: threading.Event = threading.Event()
+
         piping_stdin = subprocess_kwargs.get("stdin") == subprocess.PIPE
         if piping_stdin and isinstance(source, str):
             raise TypeError(
@@ -214,6 +443,12 @@ class FFmpegAudio(AudioSource):
             self._pipe_reader_thread.start()
 
     def _spawn_process(self, args: Any, **subprocess_kwargs: Any) -> subprocess.Popen:
+        if self._pool is not None:
+            process = self._pool.acquire(args, **subprocess_kwargs)
+            if process is not None:
+                _log.debug("Using pre-spawned ffmpeg process %s", process.pid)
+                return process
+
         _log.debug("Spawning ffmpeg process with command: %s", args)
         process = None
         try:
@@ -250,7 +485,11 @@ class FFmpegAudio(AudioSource):
                 "ffmpeg process %s has not terminated. Waiting to terminate...",
                 proc.pid,
             )
-            proc.communicate()
+            try:
+                proc.communicate()
+            except ValueError:
+                # the stdin pipe writer already closed stdin
+                proc.wait()
             _log.info(
                 "ffmpeg process %s should have terminated with a return code of %s.",
                 proc.pid,
@@ -305,7 +544,140 @@ class FFmpegAudio(AudioSource):
                 self._stderr.close()
                 return
 
+    @property
+    def time_to_first_frame(self) -> float | None:
+        """The seconds it took from creating this source until the first frame
+        was read, or ``None`` if no frame was read yet.
+
+        .. versionadded:: 2.9
+        """
+        return self._time_to_first_frame
+
+    @property
+    def underruns(self) -> int:
+        """How many times a frame was not ready in time after playback started.
+
+        Without read-ahead, this counts the reads that blocked longer than a frame.
+
+        .. versionadded:: 2.9
+        """
+        return self._underruns
+
+    @property
+    def buffered_frames(self) -> int:
+        """The amount of frames currently held by the read-ahead buffer.
+
+        .. versionadded:: 2.9
+        """
+        return self._frame_queue.qsize() if self._frame_queue is not None else 0
+
+    def _read_frame(self) -> bytes:
+        """Reads the next 20ms frame straight from the process.
+
+        Subclasses must implement this.
+
+        .. versionadded:: 2.9
+        """
+        raise NotImplementedError
+
+    def _start_read_ahead(self) -> None:
+        if self._read_ahead <= 0 or self._read_ahead_thread is not None:
+            return
+
+        self._frame_queue = queue.Queue(self._read_ahead)
+        self._read_ahead_thread = threading.Thread(
+            target=self._read_ahead_worker,
+            daemon=True,
+            name=f"ffmpeg-read-ahead:pid-{self._process.pid}",
+        )
+        self._read_ahead_thread.start()
+
+    def _read_ahead_worker(self) -> None:
+        frames = self._frame_queue
+        assert frames is not None
+
+        try:
+            while not self._read_ahead_stop.is_set():
+                try:
+                    frame = self._read_frame()
+                except Exception:
+                    if not self._read_ahead_stop.is_set():
+                        _log.debug(
+                            "Read error for %s, stopping read-ahead",
+                            self,
+                            exc_info=True,
+                        )
+                    frame = b""
+
+                while not self._read_ahead_stop.is_set():
+                    try:
+                        frames.put(frame, timeout=0.1)
+                    except queue.Full:
+                        continue
+                    break
+
+                if not frame:
+                    return
+        finally:
+            # wake up a reader that is waiting, read() also notices this thread
+            # is gone in case the buffer is full
+            try:
+                frames.put_nowait(b"")
+            except queue.Full:
+                pass
+
+    def read(self) -> bytes:
+        frames = self._frame_queue
+        started = self._time_to_first_frame is not None
+
+        if frames is None:
+            if not started:
+                frame = self._read_frame()
+            else:
+                before = time.perf_counter()
+                frame = self._read_frame()
+                if time.perf_counter() - before > OpusEncoder.FRAME_LENGTH / 1000:
+                    self._underruns += 1
+        else:
+            try:
+                frame = frames.get_nowait()
+            except queue.Empty:
+                if started:
+                    self._underruns += 1
+                frame = self._wait_for_frame(frames)
+            if not frame:
+                # keep signalling the end of the stream on subsequent reads,
+                # unless the worker already did so on its way out
+                try:
+                    frames.put_nowait(frame)
+                except queue.Full:
+                    pass
+
+        if frame and not started:
+            self._time_to_first_frame = time.perf_counter() - self._created_at
+        return frame
+
+    def _wait_for_frame(self, frames: queue.Queue[bytes]) -> bytes:
+        thread = self._read_ahead_thread
+        while True:
+            try:
+                return frames.get(timeout=0.1)
+            except queue.Empty:
+                if not self._read_ahead_stop.is_set() and (
+                    thread is not None and thread.is_alive()
+                ):
+                    continue
+            # the worker is gone, there is nothing left to wait for
+            try:
+                return frames.get_nowait()
+            except queue.Empty:
+                return b""
+
     def cleanup(self) -> None:
+        # this function gets called in __del__ so instance attributes might not even exist
+        stop = getattr(self, "_read_ahead_stop", None)
+        if stop is not None:
+            stop.set()
         self._kill_process()
         self._process = self._stdout = self._stdin = self._stderr = MISSING
 
@@ -343,6 +715,15 @@ class FFmpegPCMAudio(FFmpegAudio):
         Extra command line arguments to pass to ffmpeg before the ``-i`` flag.
     options: Optional[:class:`str`]
         Extra command line arguments to pass to ffmpeg after the ``-i`` flag.
+    read_ahead: :class:`int`
+        The amount of frames to read ahead in a background thread, so that stalls of
+        the ffmpeg pipe do not cause audible jitter. ``0`` disables read-ahead.
+
+        .. versionadded:: 2.9
+    pool: Optional[:class:`FFmpegProcessPool`]
+        The pool to take a pre-spawned ffmpeg process from.
+
+        .. versionadded:: 2.9
 
     Raises
     ------
@@ -359,6 +740,8 @@ class FFmpegPCMAudio(FFmpegAudio):
         stderr: IO[bytes] | None = None,
         before_options: str | None = None,
         options: str | None = None,
+        read_ahead: int = 0,
+        pool: FFmpegProcessPool | None = None,
     ) -> None:
         args = []
         subprocess_kwargs = {
@@ -392,9 +775,17 @@ class FFmpegPCMAudio(FFmpegAudio):
 
         args.append("pipe:1")
 
-        super().__init__(source, executable=executable, args=args, **subprocess_kwargs)
+        super().__init__(
+            source,
+            executable=executable,
+            args=args,
+            read_ahead=read_ahead,
+            pool=pool,
+            **subprocess_kwargs,
+        )
+        self._start_read_ahead()
 
-    def read(self) -> bytes:
+    def _read_frame(self) -> bytes:
         ret = self._stdout.read(OpusEncoder.FRAME_SIZE)
         if len(ret) != OpusEncoder.FRAME_SIZE:
             return b""
@@ -457,6 +848,25 @@ class FFmpegOpusAudio(FFmpegAudio):
         Extra command line arguments to pass to ffmpeg before the ``-i`` flag.
     options: Optional[:class:`str`]
         Extra command line arguments to pass to ffmpeg after the ``-i`` flag.
+    read_ahead: :class:`int`
+        The amount of frames to read ahead in a background thread, so that stalls of
+        the ffmpeg pipe do not cause audible jitter. ``0`` disables read-ahead.
+
+        .. versionadded:: 2.9
+    pool: Optional[:class:`FFmpegProcessPool`]
+        The pool to take a pre-spawned ffmpeg process from.
+
+        .. versionadded:: 2.9
+    cache: Optional[:class:`OpusCache`]
+        The cache to store the transcoded audio in once ffmpeg finishes
+        successfully. Ignored when ``pipe`` is ``True``.
+
+        .. versionadded:: 2.9
+    cache_key: Optional[:class:`str`]
+        The key to store the audio under in ``cache``. Defaults to
+        :meth:`OpusCache.make_key` of the source and options.
+
+        .. versionadded:: 2.9
 
     Raises
     ------
@@ -475,6 +885,10 @@ class FFmpegOpusAudio(FFmpegAudio):
         stderr: IO[bytes] | None = None,
         before_options: str | None = None,
         options: str | None = None,
+        read_ahead: int = 0,
+        pool: FFmpegProcessPool | None = None,
+        cache: OpusCache | None = None,
+        cache_key: str | None = None,
     ) -> None:
         args = []
         subprocess_kwargs = {
@@ -488,8 +902,7 @@ class FFmpegOpusAudio(FFmpegAudio):
         args.append("-i")
         args.append("-" if pipe else source)
 
-        codec = "copy" if codec in ("opus", "libopus", "copy") else "libopus"
-        bitrate = bitrate if bitrate is not None else 128
+        codec, bitrate = self._output_format(codec, bitrate)
 
         args.extend(
             (
@@ -521,8 +934,96 @@ class FFmpegOpusAudio(FFmpegAudio):
 
         args.append("pipe:1")
 
-        super().__init__(source, executable=executable, args=args, **subprocess_kwargs)
-        self._packet_iter = OggStream(self._stdout).iter_packets()
+        super().__init__(
+            source,
+            executable=executable,
+            args=args,
+            read_ahead=read_ahead,
+            pool=pool,
+            **subprocess_kwargs,
+        )
+
+        stdout = self._stdout
+        self._cache_recorder: _CacheRecorder | None = None
+        if cache is not None and isinstance(source, str) and not pipe:
+            if cache_key is None:
+                cache_key = self._cache_key(
+                    cache,
+                    source,
+                    before_options=before_options,
+                    options=options,
+                    bitrate=bitrate,
+                    codec=codec,
+                )
+            stdout = self._cache_recorder = cache._record(
+                cache_key, stdout, self._process
+            )
+
+        self._packet_iter = OggStream(stdout).iter_packets()
+        self._start_read_ahead()
+
+    @staticmethod
+    def _output_format(codec: str | None, bitrate: int | None) -> tuple[str, int]:
+        codec = "copy" if codec in ("opus", "libopus", "copy") else "libopus"
+        return codec, bitrate if bitrate is not None else 128
+
+    @classmethod
+    def _cache_key(
+        cls,
+        cache: OpusCache,
+        source: str,
+        *,
+        before_options: str | None,
+        options: str | None,
+        bitrate: int | None,
+        codec: str | None,
+    ) -> str:
+        # keyed by what ffmpeg is actually told to do, so the constructor and
+        # from_probe share entries whenever they produce the same audio
+        return cls._format_key(
+            cache,
+            source,
+            cls._cache_format(codec, bitrate),
+            before_options=before_options,
+            options=options,
+        )
+
+    @classmethod
+    def _cache_format(
+        cls, codec: str | None, bitrate: int | None
+    ) -> tuple[str, int | None]:
+        codec, bitrate = cls._output_format(codec, bitrate)
+        # copied audio keeps its bitrate, whatever it was asked for
+        return codec, None if codec == "copy" else bitrate
+
+    @staticmethod
+    def _format_key(
+        cache: OpusCache,
+        source: str,
+        output_format: tuple[str, int | None],
+        *,
+        before_options: str | None,
+        options: str | None,
+    ) -> str:
+        codec, bitrate = output_format
+        return cache.make_key(
+            source,
+            before_options=before_options,
+            options=options,
+            bitrate=bitrate,
+            codec=codec,
+        )
+
+    @staticmethod
+    def _probe_key(
+        cache: OpusCache,
+        source: str,
+        *,
+        before_options: str | None,
+        options: str | None,
+    ) -> str:
+        # the input alone, before its codec and bitrate are known
+        return cache.make_key(source, before_options=before_options, options=options)
 
     @classmethod
     async def from_probe(
@@ -530,8 +1031,9 @@ class FFmpegOpusAudio(FFmpegAudio):
         source: str,
         *,
         method: str | Callable[[str, str], tuple[str | None, int | None]] | None = None,
+        cache: OpusCache | None = None,
         **kwargs: Any,
-    ) -> Self:
+    ) -> Self | OggOpusAudio:
         r"""|coro|
 
         A factory method that creates a :class:`FFmpegOpusAudio` after probing
@@ -570,6 +1072,14 @@ class FFmpegOpusAudio(FFmpegAudio):
             (or avconv).  As a callable, it must take two string arguments, ``source`` and
             ``executable``.  Both parameters are the same values passed to this factory function.
             ``executable`` will default to ``ffmpeg`` if not provided as a keyword argument.
+        cache: Optional[:class:`OpusCache`]
+            The cache to consult. If the source was played through this method before with
+            the same options, the cached audio is returned as an :class:`OggOpusAudio`
+            without running ffprobe or ffmpeg. Otherwise the source is probed, audio the
+            constructor cached with the probed codec and bitrate is reused, and a new
+            source stores its output in the cache.
+
+            .. versionadded:: 2.9
         \*\*kwargs
             The remaining parameters to be passed to the :class:`FFmpegOpusAudio` constructor,
             excluding ``bitrate`` and ``codec``.
@@ -583,12 +1093,36 @@ class FFmpegOpusAudio(FFmpegAudio):
 
         Returns
         --------
-        :class:`FFmpegOpusAudio`
-            An instance of this class.
+        Union[:class:`FFmpegOpusAudio`, :class:`OggOpusAudio`]
+            An instance of this class, or the cached audio if ``cache`` had it.
         """
 
+        if cache is None or not isinstance(source, str) or kwargs.get("pipe"):
+            cache = None
+        else:
+            options = {
+                "before_options": kwargs.get("before_options"),
+                "options": kwargs.get("options"),
+            }
+            probe_key = cls._probe_key(cache, source, **options)
+            known = cache._get_format(probe_key)
+            if known is not None:
+                cached = cache.open(cls._format_key(cache, source, known, **options))
+                if cached is not None:
+                    return cached
+
         executable = kwargs.get("executable")
         codec, bitrate = await cls.probe(source, method=method, executable=executable)
+
+        if cache is not None:
+            output_format = cls._cache_format(codec, bitrate)
+            key = cls._format_key(cache, source, output_format, **options)
+            cache._set_format(key, probe_key, *output_format)
+            cached = cache.open(key)
+            if cached is not None:
+                return cached
+            kwargs.update(cache=cache, cache_key=key)
+
         return cls(source, bitrate=bitrate, codec=codec, **kwargs)
 
     @classmethod
@@ -735,12 +1269,397 @@ class FFmpegOpusAudio(FFmpegAudio):
 
         return codec, bitrate
 
-    def read(self) -> bytes:
+    def _read_frame(self) -> bytes:
         return next(self._packet_iter, b"")
 
     def is_opus(self) -> bool:
         return True
 
+    def cleanup(self) -> None:
+        recorder = getattr(self, "_cache_recorder", None)
+        if recorder is not None:
+            recorder.discard()
+        super().cleanup()
+
+
+class OggOpusAudio(AudioSource):
+    """An audio source that plays a local Ogg Opus file directly, without
+    spawning ffmpeg.
+
+    The file is memory-mapped and the packets are handed to the player as views
+    into the mapping, so no packet data is copied while reading.
+
+    The file must contain 48KHz stereo Opus audio in 20ms frames, which is what
+    :class:`FFmpegOpusAudio` produces.
+
+    .. versionadded:: 2.9
+
+    Parameters
+    ----------
+    source: Union[:class:`str`, :class:`os.PathLike`, :term:`py:file object`]
+        The path of the file, or a file object opened in binary mode.
+    """
+
+    def __init__(self, source: str | os.PathLike[str] | IO[bytes]) -> None:
+        self._stream: OggStream = OggStream.from_file(source)
+        self._packet_iter = self._stream.iter_packet_views()
+
+        # RFC 7845 5: the first two packets are the OpusHead and OpusTags headers
+        for _ in range(2):
+            packet = next(self._packet_iter, None)
+            if packet is None or packet[:4] != b"Opus":
+                raise ClientException("source is not an Ogg Opus file")
+
+    def read(self) -> bytes:
+        return next(self._packet_iter, b"")  # type: ignore
+
+    def is_opus(self) -> bool:
+        return True
+
+    def cleanup(self) -> None:
+        stream = getattr(self, "_stream", None)
+        if stream is not None:
+            self._packet_iter = iter(())
+            stream.close()
+            self._stream = None  # type: ignore
+
+
+class _CacheRecorder:
+    """Copies everything read from an ffmpeg stdout into a temporary file that
+    is committed to an :class:`OpusCache` once ffmpeg exits successfully.
+    """
+
+    def __init__(
+        self, cache: OpusCache, key: str, stream: IO[bytes], process: subprocess.Popen
+    ) -> None:
+        self.cache: OpusCache = cache
+        self.key: str = key
+        self.stream: IO[bytes] = stream
+        self.process: subprocess.Popen = process
+        fd, self.path = tempfile.mkstemp(dir=cache.directory, suffix=".tmp")
+        self.file: IO[bytes] | None = os.fdopen(fd, "wb")
+
+    def readinto1(self, buffer: memoryview) -> int:
+        read = self.stream.readinto1(buffer)  # type: ignore
+        if self.file is None:
+            return read
+
+        if read:
+            try:
+                self.file.write(buffer[:read])
+            except OSError:
+                _log.warning(
+                    "Could not write to opus cache, disabling it for %s", self.key
+                )
+                self.discard()
+        else:
+            self._finish()
+        return read
+
+    def _finish(self) -> None:
+        try:
+            returncode = self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            returncode = None
+
+        if returncode != 0:
+            self.discard()
+            return
+
+        self.file.close()  # type: ignore
+        self.file = None
+        self.cache._commit(self.key, self.path)
+
+    def discard(self) -> None:
+        if self.file is None:
+            return
+        self.file.close()
+        self.file = None
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class OpusCache:
+    """A size bounded, content addressed on-disk cache of Opus audio transcoded
+    by :class:`FFmpegOpusAudio`.
+
+    Cached audio is stored as Ogg Opus files and played back through
+    :class:`OggOpusAudio`, so replaying a sound does not spawn ffmpeg at all.
+    Entries created by :meth:`FFmpegOpusAudio.from_probe` also remember the
+    probed codec and bitrate, so replaying them does not run ffprobe either.
+    Once the cache grows over ``max_size``, the least recently played entries are
+    removed first. The order survives restarts, as it is based on the file
+    modification times.
+
+    .. versionadded:: 2.9
+
+    Examples
+    --------
+
+    Playing a sound effect through the cache: ::
+
+        cache = discord.OpusCache("./opus-cache", max_size=512 * 1024**2)
+        source = await discord.FFmpegOpusAudio.from_probe("airhorn.mp3", cache=cache)
+        voice_client.play(source)
+
+    Parameters
+    ----------
+    directory: Union[:class:`str`, :class:`os.PathLike`]
+        The directory to store the cached audio in. It is created if it does not exist.
+    max_size: :class:`int`
+        The maximum size of the cache in bytes. Defaults to 1 GiB.
+
+    Attributes
+    ----------
+    directory: :class:`str`
+        The directory the cached audio is stored in.
+    max_size: :class:`int`
+        The maximum size of the cache in bytes.
+    hits: :class:`int`
+        How many lookups found a cached entry.
+    misses: :class:`int`
+        How many lookups did not find a cached entry.
+    """
+
+    SUFFIX: str = ".opus"
+    _FORMAT_SUFFIX: str = ".json"
+
+    def __init__(self, directory: str | os.PathLike[str], *, max_size: int = 1024**3):
+        self.directory: str = os.fspath(directory)
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._lock: threading.Lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size: int = 0
+        # the probed output format of an input, and the entry that stored it
+        self._formats: dict[str, tuple[str, str, int | None]] = {}
+        self._probes: dict[str, str] = {}
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._load()
+
+    def __repr__(self) -> str:
+        return (
+            f"<OpusCache directory={self.directory!r} entries={len(self)} "
+            f"size={self.size} max_size={self.max_size}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached audio in bytes."""
+        return self._size
+
+    def _load(self) -> None:
+        entries = []
+        formats = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".tmp"):
+                    # left behind by a process that did not exit cleanly
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+                elif entry.name.endswith(self.SUFFIX) and entry.is_file():
+                    stat = entry.stat()
+                    key = entry.name[: -len(self.SUFFIX)]
+                    entries.append((stat.st_mtime_ns, key, stat.st_size))
+                elif entry.name.endswith(self._FORMAT_SUFFIX):
+                    formats.append(entry.name[: -len(self._FORMAT_SUFFIX)])
+
+        for _, key, size in sorted(entries):
+            self._entries[key] = size
+            self._size += size
+
+        for key in formats:
+            path = self._format_path(key)
+            try:
+                if key not in self._entries:
+                    raise ValueError("the audio of this format is gone")
+                with open(path, encoding="utf-8") as f:
+                    probe_key, codec, bitrate = json.load(f)
+            except (OSError, ValueError):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            else:
+                self._formats[probe_key] = (key, codec, bitrate)
+                self._probes[key] = probe_key
+
+        with self._lock:
+            self._evict()
+
+    @staticmethod
+    def make_key(source: str, **options: Any) -> str:
+        r"""Creates the cache key of a source played with the given options.
+
+        Local files are identified by their path, size and modification time so
+        that editing a file invalidates its cached audio. Any other source, such
+        as a URL, is identified by its value.
+
+        Parameters
+        ----------
+        source: :class:`str`
+            The source passed to :class:`FFmpegOpusAudio`.
+        \*\*options
+            The options that affect the transcoded audio, e.g. ``options`` and
+            ``bitrate``.
+
+        Returns
+        -------
+        :class:`str`
+            The hex digest to use as key.
+        """
+        try:
+            stat = os.stat(source)
+        except (OSError, ValueError):
+            identity: list[Any] = [source]
+        else:
+            identity = [os.path.abspath(source), stat.st_size, stat.st_mtime_ns]
+
+        payload = json.dumps([identity, sorted(options.items())], default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def path_for(self, key: str) -> str:
+        """Returns the path the audio of ``key`` is (or would be) stored at."""
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def _format_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self._FORMAT_SUFFIX)
+
+    def _get_format(self, probe_key: str) -> tuple[str, int | None] | None:
+        with self._lock:
+            entry = self._formats.get(probe_key)
+        return None if entry is None else entry[1:]
+
+    def _set_format(
+        self, key: str, probe_key: str, codec: str, bitrate: int | None
+    ) -> None:
+        # written before the audio is committed; lookups only use it once the
+        # entry exists, and orphans are dropped on the next load
+        try:
+            with open(self._format_path(key), "w", encoding="utf-8") as f:
+                json.dump([probe_key, codec, bitrate], f)
+        except OSError:
+            return
+
+        with self._lock:
+            self._formats[probe_key] = (key, codec, bitrate)
+            self._probes[key] = probe_key
+
+    def get(self, key: str) -> str | None:
+        """Looks up ``key`` and marks it as recently used.
+
+        Returns
+        -------
+        Optional[:class:`str`]
+            The path of the cached audio, if any.
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def open(self, key: str) -> OggOpusAudio | None:
+        """Opens the cached audio of ``key`` for playback.
+
+        Returns
+        -------
+        Optional[:class:`OggOpusAudio`]
+            The audio source, or ``None`` if ``key`` is not cached.
+        """
+        path = self.get(key)
+        if path is None:
+            return None
+
+        try:
+            return OggOpusAudio(path)
+        except (OSError, ValueError, ClientException, OggError):
+            # removed from under us or truncated, treat it as a miss
+            _log.debug("Dropping unreadable opus cache entry %s", key, exc_info=True)
+            self.remove(key)
+            return None
+
+    def remove(self, key: str) -> None:
+        """Removes the cached audio of ``key``, if any."""
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Removes all cached audio."""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _remove(self, key: str) -> bool:
+        try:
+            os.remove(self.path_for(key))
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # still memory-mapped somewhere on windows, try again later
+            return False
+
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._size -= size
+
+        probe_key = self._probes.pop(key, None)
+        if probe_key is not None:
+            if self._formats.get(probe_key, (None,))[0] == key:
+                del self._formats[probe_key]
+            try:
+                os.remove(self._format_path(key))
+            except OSError:
+                pass
+        return True
+
+    def _evict(self) -> None:
+        for key in list(self._entries):
+            if self._size <= self.max_size:
+                return
+            self._remove(key)
+
+    def _record(
+        self, key: str, stream: IO[bytes], process: subprocess.Popen
+    ) -> _CacheRecorder:
+        return _CacheRecorder(self, key, stream, process)
+
+    def _commit(self, key: str, path: str) -> None:
+        size = os.path.getsize(path)
+        if size > self.max_size:
+            os.remove(path)
+            return
+
+        with self._lock:
+            os.replace(path, self.path_for(key))
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old
+            self._entries[key] = size
+            self._size += size
+            self._evict()
+
 
 class PCMVolumeTransformer(AudioSource, Generic[AT]):
     """Transforms a previous :class:`AudioSource` to have volume controls.
@@ -800,6 +1719,724 @@ class PCMVolumeTransformer(AudioSource, Generic[AT]):
         return samples.tobytes()
 
 
+def _mix_numpy(frames: list[tuple[bytes, float, float]]) -> bytes:
+    acc = numpy.zeros(OpusEncoder.FRAME_SIZE // 2, dtype=numpy.float32)
+    for data, start, end in frames:
+        samples = numpy.frombuffer(data, dtype=numpy.int16)
+        if start == end == 1.0:
+            acc += samples
+        elif start == end:
+            acc += samples * numpy.float32(start)
+        else:
+            # one gain per sample pair, so both channels fade together
+            ramp = numpy.linspace(
+                start,
+                end,
+                OpusEncoder.SAMPLES_PER_FRAME,
+                endpoint=False,
+                dtype=numpy.float32,
+            )
+            acc += samples * numpy.repeat(ramp, OpusEncoder.CHANNELS)
+    numpy.clip(acc, -0x8000, 0x7FFF, out=acc)
+    return acc.astype(numpy.int16).tobytes()
+
+
+def _mix_python(frames: list[tuple[bytes, float, float]]) -> bytes:
+    acc: list[float] | None = None
+    for data, start, end in frames:
+        samples: Any = array.array("h", data)
+        if start != end:
+            step = (end - start) / OpusEncoder.SAMPLES_PER_FRAME
+            samples = [
+                s * (start + step * (i // OpusEncoder.CHANNELS))
+                for i, s in enumerate(samples)
+            ]
+        elif start != 1.0:
+            samples = [s * start for s in samples]
+        acc = list(samples) if acc is None else list(map(operator.add, acc, samples))
+
+    assert acc is not None
+    return array.array(
+        "h",
+        [0x7FFF if s > 0x7FFF else -0x8000 if s < -0x8000 else int(s) for s in acc],
+    ).tobytes()
+
+
+class MixerInput:
+    """A single input of a :class:`PCMMixer`.
+
+    These are created by :meth:`PCMMixer.add` and should not be created manually.
+
+    .. versionadded:: 2.9
+
+    Attributes
+    ----------
+    source: :class:`AudioSource`
+        The audio source that is being mixed.
+    mixer: :class:`PCMMixer`
+        The mixer this input belongs to.
+    """
+
+    def __init__(
+        self, mixer: PCMMixer, source: AudioSource, gain: float, read_ahead: int
+    ) -> None:
+        self.mixer: PCMMixer = mixer
+        self.source: AudioSource = source
+        self._gain: float = max(gain, 0.0)
+        self._target: float = self._gain
+        self._step: float = 0.0
+        self._fade_frames: int = 0
+        self._remove_after_fade: bool = False
+        self._underruns: int = 0
+        self._started: bool = False
+        self._finished: bool = False
+
+        self._frames: queue.Queue[bytes] | None = None
+        self._stop: threading.Event = threading.Event()
+        self._thread: threading.Thread | None = None
+        if read_ahead > 0:
+            self._frames = queue.Queue(read_ahead)
+            self._thread = threading.Thread(
+                target=self._read_ahead_worker,
+                daemon=True,
+                name=f"mixer-read-ahead:{id(self):#x}",
+            )
+            self._thread.start()
+
+    def __repr__(self) -> str:
+        return f"<MixerInput source={self.source!r} gain={self._gain}>"
+
+    @property
+    def gain(self) -> float:
+        """Retrieves or sets the gain of this input as a floating point
+        percentage (e.g. ``1.0`` for 100%).
+
+        Setting it cancels any fade that is in progress.
+        """
+        return self._gain
+
+    @gain.setter
+    def gain(self, value: float) -> None:
+        with self.mixer._lock:
+            self._gain = self._target = max(value, 0.0)
+            self._fade_frames = 0
+
+    @property
+    def underruns(self) -> int:
+        """How many times this input had no frame ready and was skipped."""
+        return self._underruns
+
+    @property
+    def finished(self) -> bool:
+        """Whether this input ran out of audio or was removed."""
+        return self._finished
+
+    def fade(self, gain: float, duration: float) -> None:
+        """Linearly fades the gain of this input to ``gain`` over ``duration``
+        seconds.
+
+        Parameters
+        ----------
+        gain: :class:`float`
+            The gain to fade to.
+        duration: :class:`float`
+            The length of the fade in seconds.
+        """
+        with self.mixer._lock:
+            self._fade(gain, duration)
+
+    def _fade(self, gain: float, duration: float) -> None:
+        gain = max(gain, 0.0)
+        frames = int(duration * 1000 / OpusEncoder.FRAME_LENGTH)
+        if frames <= 0:
+            self._gain = self._target = gain
+            self._fade_frames = 0
+            return
+
+        self._target = gain
+        self._step = (gain - self._gain) / frames
+        self._fade_frames = frames
+
+    def remove(self, *, fade_out: float = 0.0) -> None:
+        """Removes this input from its mixer, see :meth:`PCMMixer.remove`."""
+        self.mixer.remove(self, fade_out=fade_out)
+
+    def _read_ahead_worker(self) -> None:
+        frames = self._frames
+        assert frames is not None
+
+        while not self._stop.is_set():
+            try:
+                frame = self.source.read()
+            except Exception:
+                _log.exception("Reading from mixer input %s failed", self)
+                frame = b""
+
+            while not self._stop.is_set():
+                try:
+                    frames.put(frame, timeout=0.1)
+                except queue.Full:
+                    continue
+                break
+
+            if not frame:
+                return
+
+    def _next_frame(self) -> bytes | None:
+        """Returns the next frame, ``None`` if it isn't ready or ``b""`` once
+        the source is exhausted.
+        """
+        if self._frames is None:
+            return self.source.read()
+
+        try:
+            frame = self._frames.get_nowait()
+        except queue.Empty:
+            # the source is still starting up, that's not an underrun
+            if self._started:
+                self._underruns += 1
+            return None
+
+        self._started = True
+        return frame
+
+    def _next_gains(self) -> tuple[float, float]:
+        start = self._gain
+        if self._fade_frames:
+            self._fade_frames -= 1
+            if self._fade_frames:
+                self._gain += self._step
+            else:
+                self._gain = self._target
+        return start, self._gain
+
+    def _close(self) -> None:
+        self._finished = True
+        self._stop.set()
+        self.source.cleanup()
+
+
+class PCMMixer(AudioSource):
+    """An audio source that mixes any number of other sources together, e.g.
+    to play sound effects or text-to-speech over background music.
+
+    Inputs can be added and removed while the mixer is playing, and every
+    input has its own gain and fades. Each input is read by its own thread
+    ahead of time, so a slow input is skipped for a frame instead of delaying
+    the whole mix.
+
+    Mixing is vectorized with NumPy if it is installed, otherwise a slower
+    pure Python implementation is used. Samples are summed at a higher
+    precision and clipped once, so loud inputs never wrap around.
+
+    This does not work on audio sources that have :meth:`AudioSource.is_opus`
+    set to ``True``.
+
+    .. versionadded:: 2.9
+
+    Parameters
+    ----------
+    read_ahead: :class:`int`
+        The amount of 20ms frames read in advance for every input. ``0``
+        reads every input synchronously in the player thread.
+    stop_when_empty: :class:`bool`
+        Whether to stop playing once the last input finished. By default, the
+        mixer plays silence until new inputs are added or :meth:`stop` is called.
+    """
+
+    def __init__(self, *, read_ahead: int = 5, stop_when_empty: bool = False):
+        self.read_ahead: int = read_ahead
+        self.stop_when_empty: bool = stop_when_empty
+        self._inputs: list[MixerInput] = []
+        self._lock: threading.Lock = threading.Lock()
+        self._stopped: bool = False
+        self._mix = _mix_numpy if HAS_NUMPY else _mix_python
+
+    @property
+    def inputs(self) -> list[MixerInput]:
+        """The inputs that are currently being mixed."""
+        return list(self._inputs)
+
+    def add(
+        self,
+        source: AudioSource,
+        *,
+        gain: float = 1.0,
+        fade_in: float = 0.0,
+        read_ahead: int | None = None,
+    ) -> MixerInput:
+        """Adds a source to the mix, starting with the next frame.
+
+        Parameters
+        ----------
+        source: :class:`AudioSource`
+            The PCM audio source to add.
+        gain: :class:`float`
+            The gain of the source as a floating point percentage.
+        fade_in: :class:`float`
+            The amount of seconds to fade in from silence to ``gain``.
+        read_ahead: Optional[:class:`int`]
+            Overrides the read-ahead of the mixer for this input.
+
+        Returns
+        -------
+        :class:`MixerInput`
+            The handle to change the gain of the input or remove it.
+
+        Raises
+        ------
+        TypeError
+            Not an audio source.
+        ClientException
+            The audio source is opus encoded or the mixer was stopped.
+        """
+        if not isinstance(source, AudioSource):
+            raise TypeError(f"expected AudioSource not {source.__class__.__name__}.")
+
+        if source.is_opus():
+            raise ClientException("AudioSource must not be Opus encoded.")
+
+        if self._stopped:
+            raise ClientException("The mixer was stopped.")
+
+        if read_ahead is None:
+            read_ahead = self.read_ahead
+        mixer_input = MixerInput(self, source, 0.0 if fade_in else gain, read_ahead)
+        with self._lock:
+            if fade_in:
+                mixer_input._fade(gain, fade_in)
+            self._inputs.append(mixer_input)
+        return mixer_input
+
+    def remove(self, mixer_input: MixerInput, *, fade_out: float = 0.0) -> None:
+        """Removes an input from the mix.
+
+        Parameters
+        ----------
+        mixer_input: :class:`MixerInput`
+            The input to remove.
+        fade_out: :class:`float`
+            The amount of seconds to fade out before the input is removed.
+        """
+        with self._lock:
+            if mixer_input not in self._inputs:
+                return
+            if fade_out > 0:
+                mixer_input._fade(0.0, fade_out)
+                mixer_input._remove_after_fade = True
+                return
+            self._inputs.remove(mixer_input)
+        mixer_input._close()
+
+    def stop(self) -> None:
+        """Stops the mixer, the player stops after the current frame."""
+        self._stopped = True
+
+    def read(self) -> bytes:
+        if self._stopped:
+            return b""
+
+        frames: list[tuple[bytes, float, float]] = []
+        finished: list[MixerInput] = []
+        with self._lock:
+            inputs = list(self._inputs)
+
+        for mixer_input in inputs:
+            frame = mixer_input._next_frame()
+            if frame is None:
+                continue
+            if not frame:
+                finished.append(mixer_input)
+                continue
+
+            with self._lock:
+                start, end = mixer_input._next_gains()
+                if mixer_input._remove_after_fade and not mixer_input._fade_frames:
+                    finished.append(mixer_input)
+            if start == end == 0.0:
+                continue
+            if len(frame) != OpusEncoder.FRAME_SIZE:
+                frame = bytes(frame[: OpusEncoder.FRAME_SIZE]).ljust(
+                    OpusEncoder.FRAME_SIZE, b"\0"
+                )
+            frames.append((frame, start, end))
+
+        if finished:
+            with self._lock:
+                for mixer_input in finished:
+                    if mixer_input in self._inputs:
+                        self._inputs.remove(mixer_input)
+                empty = not self._inputs
+            for mixer_input in finished:
+                mixer_input._close()
+            if empty and self.stop_when_empty:
+                self._stopped = True
+                if not frames:
+                    return b""
+
+        if not frames:
+            return bytes(OpusEncoder.FRAME_SIZE)
+        if len(frames) == 1 and frames[0][1] == frames[0][2] == 1.0:
+            return frames[0][0]
+        return self._mix(frames)
+
+    def cleanup(self) -> None:
+        # this function gets called in __del__ so instance attributes might not even exist
+        lock = getattr(self, "_lock", None)
+        if lock is None:
+            return
+        with lock:
+            inputs, self._inputs = self._inputs, []
+        for mixer_input in inputs:
+            mixer_input._close()
+
+
+class QueueEntry:
+    """A source waiting in or playing from an :class:`AudioQueue`.
+
+    These are created by :meth:`AudioQueue.add` and should not be created manually.
+
+    .. versionadded:: 2.9
+
+    Attributes
+    ----------
+    after: Optional[Callable[[Optional[:class:`Exception`]], Any]]
+        Called from the player thread once this entry finished playing, was
+        skipped or failed to open.
+    """
+
+    def __init__(
+        self,
+        source: AudioSource | Callable[[], AudioSource],
+        after: Callable[[Exception | None], Any] | None,
+    ) -> None:
+        self._factory: Callable[[], AudioSource] | None = None
+        self._source: AudioSource | None = None
+        if isinstance(source, AudioSource):
+            self._source = source
+        elif callable(source):
+            self._factory = source
+        else:
+            raise TypeError(
+                f"expected AudioSource or callable not {source.__class__.__name__}."
+            )
+
+        if after is not None and not callable(after):
+            raise TypeError('Expected a callable for the "after" parameter.')
+
+        self.after: Callable[[Exception | None], Any] | None = after
+        self._buffer: deque[bytes] = deque()
+        self._ready: threading.Event = threading.Event()
+        self._claimed: bool = False
+        self._playing: bool = False
+        self._finished: bool = False
+        self._lock: threading.Lock = threading.Lock()
+        self._error: Exception | None = None
+        self._preload_latency: float | None = None
+
+    def __repr__(self) -> str:
+        return f"<QueueEntry source={self._source or self._factory!r}>"
+
+    @property
+    def source(self) -> AudioSource | None:
+        """The audio source of this entry, or ``None`` if it was passed as a
+        callable that was not called yet.
+        """
+        return self._source
+
+    @property
+    def preload_latency(self) -> float | None:
+        """The seconds it took to open this entry and read its first frame,
+        or ``None`` if it was not prepared yet.
+        """
+        return self._preload_latency
+
+    def _prepare(self, frames: int) -> None:
+        start = time.perf_counter()
+        try:
+            if self._source is None:
+                source = self._factory()  # type: ignore
+                if not isinstance(source, AudioSource):
+                    raise TypeError(
+                        f"expected AudioSource not {source.__class__.__name__}."
+                    )
+                self._source = source
+            for _ in range(frames):
+                frame = self._source.read()
+                self._buffer.append(frame)
+                if not frame:
+                    break
+                if self._preload_latency is None:
+                    self._preload_latency = time.perf_counter() - start
+        except Exception as exc:
+            self._error = exc
+        finally:
+            if self._preload_latency is None:
+                self._preload_latency = time.perf_counter() - start
+            self._ready.set()
+
+    def _read(self) -> bytes:
+        if self._buffer:
+            return self._buffer.popleft()
+        if self._source is None:
+            return b""
+        return self._source.read()
+
+    def _finish(self) -> None:
+        with self._lock:
+            if self._finished:
+                return
+            self._finished = True
+
+        if self._source is not None:
+            self._source.cleanup()
+
+        if self.after is not None:
+            try:
+                self.after(self._error)
+            except Exception as exc:
+                exc.__context__ = self._error
+                _log.exception("Calling the after function failed.", exc_info=exc)
+        elif self._error is not None:
+            _log.exception("Failed to play queued source", exc_info=self._error)
+
+
+class AudioQueue(AudioSource):
+    """An audio source that plays other sources back to back without gaps.
+
+    While one source plays, the next one is opened and its first frames are
+    read by a background thread, so the switch happens between two frames of
+    the same player instead of stopping it and spawning a new one.
+
+    Sources can be given as a callable returning an :class:`AudioSource`, in
+    which case they are only opened once they are up next. This is recommended
+    for :class:`FFmpegAudio` based sources, which start a process as soon as
+    they are created.
+
+    Opus and PCM sources can be mixed freely. Once the last entry ended, the
+    queue is closed and the player stops. You typically use this through
+    :meth:`VoiceClient.enqueue`, which starts a new queue when needed.
+
+    .. versionadded:: 2.9
+
+    Parameters
+    ----------
+    preload: :class:`int`
+        The amount of 20ms frames read from the next source in advance.
+    """
+
+    def __init__(self, *, preload: int = 10) -> None:
+        self.preload: int = max(preload, 1)
+        self._entries: deque[QueueEntry] = deque()
+        self._current: QueueEntry | None = None
+        self._is_opus: bool = False
+        self._skip: bool = False
+        self._closed: bool = False
+        self._preload_misses: int = 0
+        self._preload_latency: float | None = None
+        self._condition: threading.Condition = threading.Condition()
+        self._preloader: threading.Thread = threading.Thread(
+            target=self._preload_worker,
+            daemon=True,
+            name=f"audio-queue-preloader:{id(self):#x}",
+        )
+        self._preloader.start()
+
+    @property
+    def current(self) -> QueueEntry | None:
+        """The entry that is currently playing."""
+        return self._current
+
+    @property
+    def entries(self) -> list[QueueEntry]:
+        """The entries waiting to be played, in order."""
+        with self._condition:
+            return list(self._entries)
+
+    @property
+    def depth(self) -> int:
+        """The amount of entries waiting to be played."""
+        return len(self._entries)
+
+    @property
+    def preload_latency(self) -> float | None:
+        """The seconds it took to open the most recently preloaded entry and
+        read its first frame.
+        """
+        return self._preload_latency
+
+    @property
+    def preload_misses(self) -> int:
+        """How many times the next entry was not preloaded yet when the
+        previous one ended, which means there was a gap.
+        """
+        return self._preload_misses
+
+    def add(
+        self,
+        source: AudioSource | Callable[[], AudioSource],
+        *,
+        after: Callable[[Exception | None], Any] | None = None,
+    ) -> QueueEntry:
+        """Adds a source to the end of the queue.
+
+        Parameters
+        ----------
+        source: Union[:class:`AudioSource`, Callable[[], :class:`AudioSource`]]
+            The source to play, or a callable that creates it.
+        after: Optional[Callable[[Optional[:class:`Exception`]], Any]]
+            The finalizer called once the source finished playing. This
+            function must have a single parameter, ``error``, that denotes an
+            optional exception that was raised while opening or playing it.
+
+        Returns
+        -------
+        :class:`QueueEntry`
+            The entry that was added.
+
+        Raises
+        ------
+        TypeError
+            The source is neither an audio source nor a callable, or after
+            is not a callable.
+        ClientException
+            The queue was already cleaned up.
+        """
+        entry = QueueEntry(source, after)
+        with self._condition:
+            if self._closed:
+                raise ClientException("The queue was already cleaned up.")
+            self._entries.append(entry)
+            self._condition.notify_all()
+        return entry
+
+    def remove(self, entry: QueueEntry) -> None:
+        """Removes an entry that is waiting to be played.
+
+        Raises
+        ------
+        ValueError
+            The entry is not waiting in this queue.
+        """
+        with self._condition:
+            self._entries.remove(entry)
+            preloading = entry._claimed and not entry._ready.is_set()
+        # a preloading entry is cleaned up by the preloader once it's done
+        if not preloading:
+            entry._finish()
+
+    def clear(self) -> None:
+        """Removes every entry that is waiting to be played."""
+        with self._condition:
+            entries = [e for e in self._entries if not e._claimed or e._ready.is_set()]
+            self._entries.clear()
+        for entry in entries:
+            entry._finish()
+
+    def skip(self) -> None:
+        """Stops the current entry, the next one starts with the next frame."""
+        self._skip = True
+
+    def is_opus(self) -> bool:
+        if self._current is None:
+            # nothing was read yet, so the player asks about the first entry
+            with self._condition:
+                entry = self._entries[0] if self._entries else None
+            if entry is not None and entry._source is not None:
+                return entry._source.is_opus()
+        return self._is_opus
+
+    def _preload_worker(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and (
+                    not self._entries or self._entries[0]._claimed
+                ):
+                    self._condition.wait()
+                if self._closed:
+                    return
+                entry = self._entries[0]
+                entry._claimed = True
+
+            entry._prepare(self.preload)
+            self._preload_latency = entry.preload_latency
+            _log.debug(
+                "Preloaded %s in %.2fms", entry, (entry.preload_latency or 0) * 1000
+            )
+
+            with self._condition:
+                removed = not entry._playing and (
+                    self._closed or entry not in self._entries
+                )
+            if removed:
+                entry._finish()
+
+    def _next_entry(self, switching: bool) -> QueueEntry | None:
+        with self._condition:
+            if not self._entries:
+                # the player stops now, so later additions need a new queue
+                self._closed = True
+                self._condition.notify_all()
+                return None
+            entry = self._entries.popleft()
+            claimed = entry._claimed
+            entry._claimed = entry._playing = True
+            self._condition.notify_all()
+
+        if not claimed or not entry._ready.is_set():
+            # the previous entry was too short for the preloader to finish this one
+            if switching:
+                self._preload_misses += 1
+            if claimed:
+                entry._ready.wait()
+            else:
+                entry._prepare(1)
+        return entry
+
+    def read(self) -> bytes:
+        switching = False
+        while True:
+            entry = self._current
+            if entry is None:
+                entry = self._current = self._next_entry(switching)
+                if entry is None:
+                    return b""
+
+            frame = b""
+            if self._skip:
+                self._skip = False
+            elif entry._error is None:
+                try:
+                    frame = entry._read()
+                except Exception as exc:
+                    entry._error = exc
+
+            if frame:
+                self._is_opus = entry._source.is_opus()  # type: ignore
+                return frame
+
+            self._current = None
+            entry._finish()
+            switching = True
+
+    def cleanup(self) -> None:
+        # this function gets called in __del__ so instance attributes might not even exist
+        condition = getattr(self, "_condition", None)
+        if condition is None:
+            return
+        with condition:
+            self._closed = True
+            entries = [e for e in self._entries if not e._claimed or e._ready.is_set()]
+            self._entries.clear()
+            condition.notify_all()
+
+        current, self._current = self._current, None
+        if current is not None:
+            current._finish()
+        for entry in entries:
+            entry._finish()
+
+
 class AudioPlayer(threading.Thread):
     DELAY: float = OpusEncoder.FRAME_LENGTH / 1000.0
 
@@ -17,4 +17,6 @@ from .mp3 import *
 from .mp4 import *
 from .ogg import *
 from .pcm import *
+from .replay import *
+from .streaming import *
 from .wave import *
@@ -87,3 +87,10 @@ class MKASinkError(SinkException):
 
     .. versionadded:: 2.0
     """
+
+
+class StreamingSinkError(SinkException):
+    """Exception thrown when an exception occurs with a :class:`StreamingSink`
+
+    .. versionadded:: 2.9
+    """
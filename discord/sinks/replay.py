@@ -0,0 +1,312 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import array
+import threading
+import time
+from typing import IO, Any
+
+from ..opus import Decoder
+from .core import Filters, Sink, default_filters
+
+__all__ = (
+    "ReplayBuffer",
+    "ReplayClip",
+    "ReplaySink",
+)
+
+
+FRAME_DURATION = Decoder.FRAME_LENGTH / 1000
+# RFC 6716 3.4 R2: a single opus frame is at most 1275 bytes
+MAX_OPUS_FRAME_SIZE = 1275
+OPUS_SILENCE = b"\xf8\xff\xfe"
+
+
+class ReplayClip:
+    """A window of audio exported from a :class:`ReplayBuffer`.
+
+    The chunks are :class:`memoryview` objects pointing into the buffer itself,
+    so they are only valid until the buffer wraps around and overwrites them.
+    Use :meth:`tobytes` or :meth:`write` right away if the clip has to outlive
+    that.
+
+    .. versionadded:: 2.9
+
+    Attributes
+    ----------
+    user: Any
+        The user this clip belongs to.
+    start: :class:`int`
+        The frame number of the first frame of this clip.
+    frames: :class:`int`
+        The amount of 20ms frames in this clip, including silence.
+    chunks: List[:class:`memoryview`]
+        The audio of this clip, in order. For PCM buffers contiguous frames are
+        merged into a single chunk, for opus buffers every chunk is one packet.
+    """
+
+    __slots__ = ("user", "start", "frames", "chunks")
+
+    def __init__(
+        self, user: Any, start: int, frames: int, chunks: list[memoryview]
+    ) -> None:
+        self.user = user
+        self.start = start
+        self.frames = frames
+        self.chunks = chunks
+
+    def __repr__(self) -> str:
+        return (
+            f"<ReplayClip user={self.user!r} start={self.start} frames={self.frames}>"
+        )
+
+    @property
+    def duration(self) -> float:
+        """The duration of this clip in seconds."""
+        return self.frames * FRAME_DURATION
+
+    def tobytes(self) -> bytes:
+        """Copies the clip into a single :class:`bytes` object."""
+        return b"".join(self.chunks)
+
+    def write(self, fp: IO[bytes]) -> None:
+        """Writes the clip to a file-like object without joining the chunks first."""
+        for chunk in self.chunks:
+            fp.write(chunk)
+
+
+class ReplayBuffer:
+    """A preallocated ring buffer holding the last ``capacity`` frames of a
+    single user.
+
+    Appending is O(1) and never allocates. Every slot is stamped with the frame
+    number it was written for, so slots that were never written or that belong
+    to an older lap are exported as silence.
+
+    .. versionadded:: 2.9
+    """
+
+    __slots__ = ("capacity", "opus", "slot_size", "_data", "_view", "_stamps", "_sizes")
+
+    def __init__(self, capacity: int, *, opus: bool = False) -> None:
+        self.capacity = capacity
+        self.opus = opus
+        self.slot_size = MAX_OPUS_FRAME_SIZE if opus else Decoder.FRAME_SIZE
+        self._data = bytearray(capacity * self.slot_size)
+        self._view = memoryview(self._data)
+        self._stamps = array.array("q", [-1]) * capacity
+        self._sizes = array.array("H", [0]) * capacity
+
+    @property
+    def nbytes(self) -> int:
+        """The amount of memory preallocated for the audio."""
+        return len(self._data)
+
+    def append(self, frame: int, data: bytes) -> None:
+        """Stores ``data`` as the audio of the given frame number."""
+        slot = frame % self.capacity
+        size = len(data)
+        if size > self.slot_size:
+            data = memoryview(data)[: self.slot_size]
+            size = self.slot_size
+        offset = slot * self.slot_size
+        self._view[offset : offset + size] = data
+        if not self.opus and size < self.slot_size:
+            # pad short PCM frames so every slot is a full frame
+            self._view[offset + size : offset + self.slot_size] = bytes(
+                self.slot_size - size
+            )
+        self._sizes[slot] = size
+        self._stamps[slot] = frame
+
+    def export(self, user: Any, start: int, end: int) -> ReplayClip:
+        """Exports the frames in ``[start, end)`` as a :class:`ReplayClip`.
+
+        Frames that are older than the buffer can hold are clamped away.
+        """
+        start = max(start, end - self.capacity, 0)
+        chunks: list[memoryview] = []
+        if self.opus:
+            silence = memoryview(OPUS_SILENCE)
+            for frame in range(start, end):
+                slot = frame % self.capacity
+                if self._stamps[slot] != frame:
+                    chunks.append(silence)
+                    continue
+                offset = slot * self.slot_size
+                chunks.append(self._view[offset : offset + self._sizes[slot]])
+            return ReplayClip(user, start, max(end - start, 0), chunks)
+
+        silence = memoryview(bytes(self.slot_size))
+        run_start = -1
+        for frame in range(start, end):
+            slot = frame % self.capacity
+            valid = self._stamps[slot] == frame
+            if run_start != -1 and (not valid or slot == 0):
+                chunks.append(self._slots(run_start, slot or self.capacity))
+                run_start = -1
+            if not valid:
+                chunks.append(silence)
+            elif run_start == -1:
+                run_start = slot
+        if run_start != -1:
+            chunks.append(self._slots(run_start, (end - 1) % self.capacity + 1))
+        return ReplayClip(user, start, max(end - start, 0), chunks)
+
+    def _slots(self, first: int, last: int) -> memoryview:
+        return self._view[first * self.slot_size : last * self.slot_size]
+
+
+class ReplaySink(Sink):
+    """A sink that only keeps the last ``duration`` seconds of audio of every
+    user, e.g. for moderation clips.
+
+    Each user gets a preallocated :class:`ReplayBuffer`, so memory stays
+    constant no matter how long the sink keeps running. All users share the
+    same frame clock, which means windows exported with :meth:`export` line up
+    across users.
+
+    .. versionadded:: 2.9
+
+    Parameters
+    ----------
+    duration: :class:`float`
+        The amount of seconds kept for each user.
+    opus: :class:`bool`
+        Whether to store the opus packets instead of decoded PCM. This uses
+        about a third of the memory but has to be decoded by the consumer.
+    filters: Optional[:class:`dict`]
+        The filters of this sink, see :class:`Filters`.
+    """
+
+    encoding = "pcm"
+
+    def __init__(self, *, duration: float = 60, opus: bool = False, filters=None):
+        if filters is None:
+            filters = default_filters
+        self.filters = filters
+        Filters.__init__(self, **self.filters)
+
+        if duration <= 0:
+            raise ValueError("duration must be greater than 0")
+
+        self.duration = duration
+        self.opus = opus
+        self.encoding = "opus" if opus else "pcm"
+        self.capacity = int(duration / FRAME_DURATION)
+        self.vc = None
+        self.audio_data: dict[Any, ReplayBuffer] = {}
+
+        self._last_frames: dict[Any, int] = {}
+        self._lock = threading.Lock()
+        self._epoch = time.perf_counter()
+
+    def is_opus(self) -> bool:
+        return self.opus
+
+    def current_frame(self) -> int:
+        """The frame number of the shared clock right now."""
+        return int((time.perf_counter() - self._epoch) / FRAME_DURATION)
+
+    @Filters.container
+    def write(self, data, user):
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            # VoiceData from the packet router
+            data = data.opus if self.opus else data.pcm
+            if data is None:
+                return
+
+        frame = self.current_frame()
+        with self._lock:
+            buffer = self.audio_data.get(user)
+            if buffer is None:
+                buffer = self.audio_data[user] = ReplayBuffer(
+                    self.capacity, opus=self.opus
+                )
+
+            # packets arriving in a burst are laid out back to back instead of
+            # overwriting each other, the clock catches up once the burst ends
+            last = self._last_frames.get(user, -1)
+            if frame <= last:
+                frame = last + 1
+            self._last_frames[user] = frame
+            buffer.append(frame, data)
+
+    def export(
+        self, seconds: float | None = None, *, users=None
+    ) -> dict[Any, ReplayClip]:
+        """Exports the last ``seconds`` of audio for every user.
+
+        Every clip covers the exact same frames, users that were silent in part
+        of the window are padded with silence.
+
+        Parameters
+        ----------
+        seconds: Optional[:class:`float`]
+            The length of the window, defaults to the full ``duration``.
+        users: Optional[Iterable[Any]]
+            The users to export, defaults to every user heard so far.
+
+        Returns
+        -------
+        Dict[Any, :class:`ReplayClip`]
+            The clips, keyed by user.
+        """
+        if seconds is None:
+            seconds = self.duration
+        end = self.current_frame() + 1
+        start = end - int(seconds / FRAME_DURATION)
+        return self.export_frames(start, end, users=users)
+
+    def export_frames(
+        self, start: int, end: int, *, users=None
+    ) -> dict[Any, ReplayClip]:
+        """Exports the frames in ``[start, end)`` of the shared clock for every user.
+
+        See :meth:`export` for the details.
+        """
+        with self._lock:
+            if users is None:
+                users = list(self.audio_data)
+            return {
+                user: self.audio_data[user].export(user, start, end)
+                for user in users
+                if user in self.audio_data
+            }
+
+    def cleanup(self):
+        self.finished = True
+
+    def format_audio(self, audio):
+        return
+
+    def get_all_audio(self):
+        """Exports the full window for every user."""
+        return list(self.export().values())
+
+    def get_user_audio(self, user):
+        """Exports the full window of one specific user."""
+        return self.export(users=[user]).get(user)
@@ -0,0 +1,423 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import subprocess
+import tempfile
+import threading
+from typing import IO, Any
+
+from ..opus import Decoder
+from .core import CREATE_NO_WINDOW, AudioData, Filters, Sink, default_filters
+from .errors import StreamingSinkError
+
+__all__ = (
+    "StreamingAudioData",
+    "StreamingSink",
+    "StreamingWaveSink",
+    "StreamingFFmpegSink",
+    "StreamingMP3Sink",
+    "StreamingOGGSink",
+    "StreamingMKVSink",
+)
+
+
+BYTES_PER_SECOND = Decoder.SAMPLING_RATE * Decoder.SAMPLE_SIZE
+
+
+class _EncoderPipe:
+    """Wraps a long-lived ffmpeg process so that it can be written to like a file."""
+
+    def __init__(self, process: subprocess.Popen) -> None:
+        self.process = process
+
+    def write(self, data: bytes) -> int:
+        return self.process.stdin.write(data)  # type: ignore
+
+    def close(self) -> None:
+        try:
+            self.process.stdin.close()  # type: ignore
+        except BrokenPipeError:
+            pass
+        self.process.wait()
+
+
+class StreamingAudioData(AudioData):
+    """Handles audio data that is streamed to disk as it is received.
+
+    Unlike :class:`AudioData`, the audio is never held in memory as a whole.
+    Every write goes straight to the current segment, which is rotated according
+    to the limits of the owning :class:`StreamingSink`.
+
+    .. versionadded:: 2.9
+
+    Attributes
+    ----------
+    segments: List[:class:`str`]
+        The paths of every segment written for this user, in order.
+    bytes_written: :class:`int`
+        The amount of raw PCM bytes written to all segments.
+    """
+
+    def __init__(self, sink: StreamingSink, user: Any):
+        self.sink = sink
+        self.user = user
+        self.segments: list[str] = []
+        self.bytes_written = 0
+        self.finished = False
+
+        self._segment_bytes = 0
+        self._lock = threading.Lock()
+        self.file: IO[bytes] | _EncoderPipe = self._open_segment()
+
+    def _open_segment(self) -> IO[bytes] | _EncoderPipe:
+        path = self.sink._segment_path(self.user, len(self.segments))
+        output = self.sink.open_segment(path)
+        self.segments.append(path)
+        self._segment_bytes = 0
+        return output
+
+    def _should_rotate(self, size: int) -> bool:
+        if self._segment_bytes == 0:
+            return False
+
+        sink = self.sink
+        new_size = self._segment_bytes + size
+        if sink.max_segment_size and new_size > sink.max_segment_size:
+            return True
+        if (
+            sink.max_segment_duration
+            and new_size > sink.max_segment_duration * BYTES_PER_SECOND
+        ):
+            return True
+        return False
+
+    def write(self, data):
+        """Writes audio data to the current segment, rotating it if needed.
+
+        Raises
+        ------
+        StreamingSinkError
+            The AudioData is already finished writing.
+        """
+        with self._lock:
+            if self.finished:
+                raise StreamingSinkError("The AudioData is already finished writing.")
+
+            size = len(data)
+            if self._should_rotate(size):
+                self.sink.close_segment(self.file)
+                self.file = self._open_segment()
+
+            self.file.write(data)
+            self._segment_bytes += size
+            self.bytes_written += size
+
+    def cleanup(self):
+        """Closes the current segment.
+
+        This only flushes what is left in the write buffer, so it takes the same
+        time regardless of how long the recording was.
+
+        Raises
+        ------
+        StreamingSinkError
+            The AudioData is already finished writing.
+        """
+        with self._lock:
+            if self.finished:
+                raise StreamingSinkError("The AudioData is already finished writing.")
+            self.sink.close_segment(self.file)
+            self.finished = True
+
+
+class StreamingSink(Sink):
+    """A sink that streams raw PCM audio to disk while recording.
+
+    Every user gets its own file inside ``directory``. Memory usage is bounded by
+    ``buffer_size`` per user no matter how long the recording is, and stopping
+    the recording only has to close the open files.
+
+    .. versionadded:: 2.9
+
+    Parameters
+    ----------
+    directory: Optional[:class:`str`]
+        The directory to write the recordings to. Defaults to a new temporary
+        directory.
+    max_segment_size: Optional[:class:`int`]
+        The amount of raw PCM bytes after which a user's recording is rotated
+        to a new segment. ``None`` disables size based rotation.
+    max_segment_duration: Optional[:class:`float`]
+        The amount of seconds of audio after which a user's recording is rotated
+        to a new segment. ``None`` disables time based rotation.
+    buffer_size: :class:`int`
+        The size of the write buffer kept in memory for each user.
+    filters: Optional[:class:`dict`]
+        The filters of this sink, see :class:`Filters`.
+
+    Attributes
+    ----------
+    directory: :class:`str`
+        The directory the recordings are written to.
+    """
+
+    encoding = "pcm"
+
+    def __init__(
+        self,
+        *,
+        directory: str | None = None,
+        max_segment_size: int | None = None,
+        max_segment_duration: float | None = None,
+        buffer_size: int = 256 * 1024,
+        filters=None,
+    ):
+        if filters is None:
+            filters = default_filters
+        self.filters = filters
+        Filters.__init__(self, **self.filters)
+
+        if max_segment_size is not None and max_segment_size <= 0:
+            raise ValueError("max_segment_size must be greater than 0")
+        if max_segment_duration is not None and max_segment_duration <= 0:
+            raise ValueError("max_segment_duration must be greater than 0")
+
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="pycord-recording-")
+        else:
+            os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.max_segment_size = max_segment_size
+        self.max_segment_duration = max_segment_duration
+        self.buffer_size = buffer_size
+        self.vc = None
+        self.audio_data = {}
+        self._lock = threading.Lock()
+
+    def _segment_path(self, user: Any, index: int) -> str:
+        user_id = getattr(user, "id", user)
+        return os.path.join(self.directory, f"{user_id}-{index:04}.{self.encoding}")
+
+    def open_segment(self, path: str) -> IO[bytes] | _EncoderPipe:
+        """Opens a new segment for writing.
+
+        Subclasses can override this together with :meth:`close_segment`
+        to change the output format.
+        """
+        return open(path, "wb", buffering=self.buffer_size)
+
+    def close_segment(self, output: IO[bytes] | _EncoderPipe) -> None:
+        """Finalizes a segment opened by :meth:`open_segment`."""
+        output.close()
+
+    @Filters.container
+    def write(self, data, user):
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            # VoiceData from the packet router
+            data = data.pcm
+
+        audio = self.audio_data.get(user)
+        if audio is None:
+            with self._lock:
+                audio = self.audio_data.get(user)
+                if audio is None:
+                    audio = self.audio_data[user] = StreamingAudioData(self, user)
+
+        audio.write(data)
+
+    def cleanup(self):
+        self.finished = True
+        for audio in self.audio_data.values():
+            if not audio.finished:
+                audio.cleanup()
+            self.format_audio(audio)
+
+    def format_audio(self, audio):
+        """Called once a user's recording is finalized.
+
+        Streaming sinks encode while recording, so there is nothing left to do.
+        """
+        audio.on_format(self.encoding)
+
+    def get_all_audio(self):
+        """Gets the paths of all recorded segments."""
+        return [path for x in self.audio_data.values() for path in x.segments]
+
+    def get_user_audio(self, user):
+        """Gets the paths of the recorded segments of one specific user."""
+        audio = self.audio_data.get(user)
+        return list(audio.segments) if audio else []
+
+
+class StreamingWaveSink(StreamingSink):
+    """A streaming sink for .wav(wave) files.
+
+    The header is written up front and its sizes are patched in place when a
+    segment is closed.
+
+    .. versionadded:: 2.9
+    """
+
+    encoding = "wav"
+
+    _header = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+    def open_segment(self, path):
+        file = super().open_segment(path)
+        file.write(
+            self._header.pack(
+                b"RIFF",
+                36,
+                b"WAVE",
+                b"fmt ",
+                16,
+                1,
+                Decoder.CHANNELS,
+                Decoder.SAMPLING_RATE,
+                BYTES_PER_SECOND,
+                Decoder.SAMPLE_SIZE,
+                16,
+                b"data",
+                0,
+            )
+        )
+        return file
+
+    def close_segment(self, output):
+        size = output.tell() - self._header.size
+        output.seek(4)
+        output.write(struct.pack("<I", 36 + size))
+        output.seek(40)
+        output.write(struct.pack("<I", size))
+        output.close()
+
+
+class StreamingFFmpegSink(StreamingSink):
+    """A streaming sink that pipes audio into one long-lived ffmpeg process per
+    user and segment.
+
+    The encoder writes straight to disk, so nothing has to be transcoded when the
+    recording stops.
+
+    .. versionadded:: 2.9
+
+    Parameters
+    ----------
+    format: :class:`str`
+        The ffmpeg output format, e.g. ``"mp3"`` or ``"matroska"``.
+    encoding: :class:`str`
+        The file extension of the segments. Defaults to ``format``.
+    executable: :class:`str`
+        The ffmpeg executable to use.
+    """
+
+    format = "mp3"
+
+    def __init__(
+        self,
+        *,
+        format: str | None = None,
+        encoding: str | None = None,
+        executable: str = "ffmpeg",
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        if format is not None:
+            self.format = format
+        if encoding is not None:
+            self.encoding = encoding
+        elif format is not None:
+            self.encoding = format
+        self.executable = executable
+
+    def open_segment(self, path):
+        args = [
+            self.executable,
+            "-f",
+            "s16le",
+            "-ar",
+            str(Decoder.SAMPLING_RATE),
+            "-loglevel",
+            "error",
+            "-ac",
+            str(Decoder.CHANNELS),
+            "-i",
+            "-",
+            "-f",
+            self.format,
+            "-y",
+            path,
+        ]
+        try:
+            process = subprocess.Popen(
+                args,
+                creationflags=CREATE_NO_WINDOW,
+                stdin=subprocess.PIPE,
+                bufsize=self.buffer_size,
+            )
+        except FileNotFoundError:
+            raise StreamingSinkError(f"{self.executable} was not found.") from None
+        except subprocess.SubprocessError as exc:
+            raise StreamingSinkError(
+                "Popen failed: {0.__class__.__name__}: {0}".format(exc)
+            ) from exc
+        return _EncoderPipe(process)
+
+
+class StreamingMP3Sink(StreamingFFmpegSink):
+    """A streaming sink for .mp3 files.
+
+    .. versionadded:: 2.9
+    """
+
+    format = "mp3"
+    encoding = "mp3"
+
+
+class StreamingOGGSink(StreamingFFmpegSink):
+    """A streaming sink for .ogg files.
+
+    .. versionadded:: 2.9
+    """
+
+    format = "ogg"
+    encoding = "ogg"
+
+
+class StreamingMKVSink(StreamingFFmpegSink):
+    """A streaming sink for .mkv files.
+
+    Unlike .mp4, matroska can be written progressively, which makes it a better
+    fit for long recordings.
+
+    .. versionadded:: 2.9
+    """
+
+    format = "matroska"
+    encoding = "mkv"
@@ -143,6 +143,85 @@ class ChunkRequest:
                 future.set_result(self.buffer)
 
 
+class MemberLoader:
+    """Batches member lookups by id into as few gateway chunk requests as possible.
+
+    Lookups for the same guild that are issued within ``delay`` seconds of the
+    first one are sent together, up to 100 ids per request.
+    """
+
+    MAX_IDS = 100
+
+    def __init__(self, state: ConnectionState, *, delay: float = 0.01) -> None:
+        self.state: ConnectionState = state
+        self.delay: float = delay
+        self.requests: int = 0
+        self._pending: dict[
+            tuple[int, bool], dict[int, asyncio.Future[Member | None]]
+        ] = {}
+        self._handles: dict[tuple[int, bool], asyncio.TimerHandle] = {}
+
+    async def load(
+        self,
+        guild: Guild,
+        user_id: int,
+        *,
+        cache: bool,
+        timeout: float | None = None,
+    ) -> Member | None:
+        key = (guild.id, cache)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = {}
+            self._handles[key] = self.state.loop.call_later(
+                self.delay, self._flush, guild, cache
+            )
+
+        future = batch.get(user_id)
+        if future is None:
+            future = batch[user_id] = self.state.loop.create_future()
+            if len(batch) >= self.MAX_IDS:
+                self._flush(guild, cache)
+        # giving up on a lookup must not cancel it for the rest of the batch
+        return await asyncio.wait_for(asyncio.shield(future), timeout)
+
+    def _flush(self, guild: Guild, cache: bool) -> None:
+        key = (guild.id, cache)
+        handle = self._handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+        batch = self._pending.pop(key, None)
+        if batch:
+            self.requests += 1
+            self.state.loop.create_task(self._query(guild, cache, batch))
+
+    async def _query(
+        self,
+        guild: Guild,
+        cache: bool,
+        batch: dict[int, asyncio.Future[Member | None]],
+    ) -> None:
+        try:
+            members = await self.state.query_members(
+                guild,
+                query=None,
+                limit=len(batch),
+                user_ids=list(batch),
+                cache=cache,
+                presences=False,
+            )
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        found = {member.id: member for member in members}
+        for user_id, future in batch.items():
+            if not future.done():
+                future.set_result(found.get(user_id))
+
+
 _log = logging.getLogger(__name__)
 
 
@@ -197,6 +276,7 @@ class ConnectionState:
 
         self.allowed_mentions: AllowedMentions | None = allowed_mentions
         self._chunk_requests: dict[int | str, ChunkRequest] = {}
+        self._member_loader: MemberLoader = MemberLoader(self)
 
         activity = options.get("activity", None)
         if activity:
@@ -980,6 +1060,14 @@ class ConnectionState:
 
         self.dispatch("interaction", interaction)
 
+    def _update_member_names(self, user_id: int) -> None:
+        # users are shared between guilds, so a new username or global name
+        # has to be reindexed in every guild the user is a member of
+        for guild in self._guilds.values():
+            member = guild._members.get(user_id)
+            if member is not None:
+                guild._member_names.add(member)
+
     def parse_presence_update(self, data) -> None:
         guild_id = utils._get_as_snowflake(data, "guild_id")
         # guild_id won't be None here
@@ -1004,6 +1092,7 @@ class ConnectionState:
         old_member = Member._copy(member)
         user_update = member._presence_update(data=data, user=user)
         if user_update:
+            self._update_member_names(member_id)
             self.dispatch("user_update", user_update[0], user_update[1])
 
         self.dispatch("presence_update", old_member, member)
@@ -1015,6 +1104,7 @@ class ConnectionState:
         ref = self._users.get(user.id)
         if ref:
             ref._update(data)
+        self._update_member_names(user.id)
 
     def parse_invite_create(self, data) -> None:
         invite = Invite.from_gateway(state=self, data=data)
@@ -1365,6 +1455,7 @@ class ConnectionState:
         # Always create or update the member object
         if old_member is not None:
             old_member._update(data)
+            guild._update_member_names(old_member)
             new_member: Member = old_member
         else:
             new_member = Member(guild=guild, data=data, state=self)  # type: ignore
@@ -1381,6 +1472,7 @@ class ConnectionState:
             user_update = new_member._update_inner_user(user)
 
         if user_update:
+            self._update_member_names(user_id)
             self.dispatch("user_update", user_update[0], user_update[1])
 
         if old_member_copy is not None:
@@ -26,7 +26,7 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .abc import Messageable, _purge_messages_helper
 from .enums import (
@@ -46,7 +46,13 @@ __all__ = (
 
 if TYPE_CHECKING:
     from .abc import Snowflake, SnowflakeTime
-    from .channel import CategoryChannel, ForumChannel, ForumTag, TextChannel
+    from .channel import (
+        CategoryChannel,
+        ForumChannel,
+        ForumTag,
+        PurgeProgress,
+        TextChannel,
+    )
     from .guild import Guild
     from .member import Member
     from .message import Message, PartialMessage
@@ -529,6 +535,9 @@ class Thread(Messageable, Hashable):
         oldest_first: bool | None = False,
         bulk: bool = True,
         reason: str | None = None,
+        concurrency: int = 5,
+        progress: Callable[[PurgeProgress], Any] | None = None,
+        resume: PurgeProgress | None = None,
     ) -> list[Message]:
         """|coro|
 
@@ -563,6 +572,21 @@ class Thread(Messageable, Hashable):
             fall back to single delete if messages are older than two weeks.
         reason: Optional[:class:`str`]
             The reason for deleting the messages. Shows up on the audit log.
+        concurrency: :class:`int`
+            The maximum number of delete requests in flight. The next page of the
+            history is fetched while the previous one is being deleted.
+
+            .. versionadded:: 2.9
+        progress: Optional[Callable[[:class:`.PurgeProgress`], Any]]
+            A function called with the progress of the purge every time a delete
+            request finishes. Could be a |coroutine_link|_.
+
+            .. versionadded:: 2.9
+        resume: Optional[:class:`.PurgeProgress`]
+            The progress of an interrupted purge to continue from. ``oldest_first``
+            is taken from it and ``limit`` includes the messages it already scanned.
+
+            .. versionadded:: 2.9
 
         Returns
         -------
@@ -597,6 +621,9 @@ class Thread(Messageable, Hashable):
             oldest_first=oldest_first,
             bulk=bulk,
             reason=reason,
+            concurrency=concurrency,
+            progress=progress,
+            resume=resume,
         )
 
     async def edit(
@@ -41,8 +41,9 @@ import types
 import unicodedata
 import warnings
 from base64 import b64encode
-from bisect import bisect_left
+from bisect import bisect_left, bisect_right
 from collections.abc import (
+    AsyncIterable,
     AsyncIterator,
     Awaitable,
     Callable,
@@ -95,6 +96,13 @@ except ModuleNotFoundError:
 else:
     HAS_MSGSPEC = True
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
 __all__ = (
     "parse_time",
     "warn_deprecated",
@@ -119,29 +127,46 @@ __all__ = (
     "format_dt",
     "generate_snowflake",
     "basic_autocomplete",
+    "AutocompleteIndex",
     "filter_params",
     "MISSING",
     "users_to_csv",
+    "set_json_backend",
 )
 
 _log = logging.getLogger(__name__)
 
 DISCORD_EPOCH = 1420070400000
 
-try:
-    with (
-        importlib.resources.files(__package__)
-        .joinpath("emojis.json")
-        .open(encoding="utf-8") as f
-    ):
-        EMOJIS_MAP = json.load(f)
-except FileNotFoundError:
-    _log.debug(
-        "Couldn't find emojis.json. Is the package data missing? Discord emojis names will not work.",
-    )
-    EMOJIS_MAP = {}
+if TYPE_CHECKING:
+    EMOJIS_MAP: dict[str, str]
+    UNICODE_EMOJIS: set[str]
+
+
+def _load_emojis() -> None:
+    # parsing emojis.json takes a while and most processes never need it
+    try:
+        with (
+            importlib.resources.files(__package__)
+            .joinpath("emojis.json")
+            .open(encoding="utf-8") as f
+        ):
+            emojis = json.load(f)
+    except FileNotFoundError:
+        _log.debug(
+            "Couldn't find emojis.json. Is the package data missing? Discord emojis names will not work.",
+        )
+        emojis = {}
+
+    # stored as regular globals so this only runs once
+    globals().update(EMOJIS_MAP=emojis, UNICODE_EMOJIS=set(emojis.values()))
 
-UNICODE_EMOJIS = set(EMOJIS_MAP.values())
+
+def __getattr__(name: str) -> Any:
+    if name in ("EMOJIS_MAP", "UNICODE_EMOJIS"):
+        _load_emojis()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class _MissingSentinel:
@@ -766,6 +791,28 @@ def _get_string_to_type_map() -> dict[str, type]:
     }
 
 
+# how long a single member lookup waits on the gateway before falling back to HTTP
+_MEMBER_LOOKUP_TIMEOUT = 2.0
+
+
+async def _fetch_member(guild: Any, member_id: int) -> Any:
+    state = guild._state
+    ws = state._get_websocket(guild.id)
+    if state._intents.members and ws is not None and not ws.is_ratelimited():
+        # lookups are batched into chunk requests of up to 100 members
+        try:
+            member = await guild.load_member(
+                member_id,
+                cache=state.member_cache_flags.joined,
+                timeout=_MEMBER_LOOKUP_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            member = None
+        if member is not None:
+            return member
+    return await guild.fetch_member(member_id)
+
+
 @functools.lru_cache(maxsize=1)
 def _get_getter_fetcher_map() -> dict[type, tuple[_Getter, _Fetcher]]:
     """Return a cached map of type names -> (getter, fetcher) functions."""
@@ -774,7 +821,7 @@ def _get_getter_fetcher_map() -> dict[type, tuple[_Getter, _Fetcher]]:
     base_map: dict[type, tuple[_Getter, _Fetcher]] = {
         Member: (
             lambda obj, oid: obj.get_member(oid),
-            lambda obj, oid: obj.fetch_member(oid),
+            _fetch_member,
         ),
         Role: (
             lambda obj, oid: obj.get_role(oid),
@@ -855,19 +902,71 @@ def _bytes_to_base64_data(data: bytes) -> str:
     return fmt.format(mime=mime, data=b64)
 
 
-if HAS_MSGSPEC:
+def _load_json_backend(
+    name: str,
+) -> tuple[Callable[[Any], bytes], Callable[[bytes | str], Any]]:
+    if name == "msgspec" and HAS_MSGSPEC:
+        return msgspec.json.Encoder().encode, msgspec.json.Decoder().decode
+    elif name == "orjson" and HAS_ORJSON:
 
-    def _to_json(obj: Any) -> str:  # type: ignore
-        return msgspec.json.encode(obj).decode("utf-8")
+        def dumps(obj: Any) -> bytes:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
 
-    _from_json = msgspec.json.decode  # type: ignore
+        return dumps, orjson.loads
+    elif name == "json":
 
-else:
+        def dumps(obj: Any) -> bytes:
+            return json.dumps(obj, separators=(",", ":"), ensure_ascii=True).encode()
+
+        return dumps, json.loads
+    elif name in ("msgspec", "orjson"):
+        raise InvalidArgument(f"The {name} JSON backend is not installed.")
+    raise InvalidArgument(f"Unknown JSON backend {name!r}.")
+
+
+def set_json_backend(name: str | None = None) -> str:
+    """Selects the library used to encode and decode JSON.
+
+    Requests, responses and gateway payloads are handled as :class:`bytes`
+    throughout, so every backend is used without converting to :class:`str`
+    first. This can be called at any time and affects the whole library.
+
+    .. versionadded:: 2.9
+
+    Parameters
+    ----------
+    name: Optional[:class:`str`]
+        One of ``"msgspec"``, ``"orjson"`` or ``"json"``. If ``None``, the
+        first one that is installed, in that order, is used. This is the
+        default when the library is imported.
+
+    Returns
+    -------
+    :class:`str`
+        The name of the backend in use.
+
+    Raises
+    ------
+    InvalidArgument
+        The backend is unknown or not installed.
+    """
+    global _to_json_bytes, _from_json, _json_backend
+
+    if name is None:
+        name = "msgspec" if HAS_MSGSPEC else "orjson" if HAS_ORJSON else "json"
+    _to_json_bytes, _from_json = _load_json_backend(name)
+    _json_backend = name
+    return name
 
-    def _to_json(obj: Any) -> str:
-        return json.dumps(obj, separators=(",", ":"), ensure_ascii=True)
 
-    _from_json = json.loads
+_to_json_bytes: Callable[[Any], bytes]
+_from_json: Callable[[bytes | str], Any]
+_json_backend: str
+set_json_backend()
+
+
+def _to_json(obj: Any) -> str:
+    return _to_json_bytes(obj).decode("utf-8")
 
 
 def _parse_ratelimit_header(request: Any, *, use_clock: bool = False) -> float:
@@ -1501,6 +1600,202 @@ AutocompleteFunc = Callable[[AutocompleteContext], AV]
 FilterFunc = Callable[[AutocompleteContext, Any], Union[bool, Awaitable[bool]]]
 
 
+def _autocomplete_key(item: Any) -> str:
+    return str(getattr(item, "name", item)).casefold()
+
+
+class AutocompleteIndex:
+    """A precomputed search index over a large set of autocomplete values.
+
+    The values are kept sorted by their case-folded name, so prefix searches
+    only have to binary search for the first match instead of testing every
+    value. Substring matches are found with a single scan over one joined
+    string and are ranked after the prefix matches.
+
+    Pass an instance to :func:`basic_autocomplete` to use it.
+
+    .. versionadded:: 2.9
+
+    Parameters
+    ----------
+    values: Union[Iterable[:class:`.OptionChoice`], Iterable[:class:`str`], Iterable[:class:`int`], Iterable[:class:`float`]]
+        The initial values. The name of an :class:`.OptionChoice` is what is searched.
+    substring: :class:`bool`
+        Whether to also match values that contain the query anywhere in their
+        name, after the values that start with it. Defaults to ``False``.
+
+    Example
+    -------
+
+    .. code-block:: python3
+
+        songs = discord.utils.AutocompleteIndex(await db.song_titles(), substring=True)
+
+        @tasks.loop(minutes=10)
+        async def refresh_songs():
+            await songs.refresh(db.iter_song_titles())
+
+        Option(str, "song", autocomplete=discord.utils.basic_autocomplete(songs))
+    """
+
+    def __init__(self, values: V = (), *, substring: bool = False) -> None:
+        self.substring: bool = substring
+        self._keys: list[str] = []
+        self._items: list[Any] = []
+        self._haystack: str | None = None
+        self._offsets: array.array[int] = array.array("q")
+        self._rebuild(values)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items)
+
+    def __contains__(self, item: Any) -> bool:
+        return self._find(item) != -1
+
+    def __repr__(self) -> str:
+        return f"<AutocompleteIndex values={len(self)} substring={self.substring}>"
+
+    def _rebuild(self, values: Iterable[Any]) -> None:
+        pairs = sorted(
+            ((_autocomplete_key(item), item) for item in values), key=lambda p: p[0]
+        )
+        self._keys = [key for key, _ in pairs]
+        self._items = [item for _, item in pairs]
+        self._haystack = None
+
+    def _find(self, item: Any) -> int:
+        key = _autocomplete_key(item)
+        for i in range(bisect_left(self._keys, key), bisect_right(self._keys, key)):
+            if self._items[i] == item:
+                return i
+        return -1
+
+    def add(self, *values: Any) -> None:
+        """Inserts values into the index, keeping it sorted."""
+        for item in values:
+            key = _autocomplete_key(item)
+            i = bisect_right(self._keys, key)
+            self._keys.insert(i, key)
+            self._items.insert(i, item)
+        self._haystack = None
+
+    def discard(self, *values: Any) -> None:
+        """Removes values from the index, ignoring the ones it does not contain."""
+        for item in values:
+            i = self._find(item)
+            if i != -1:
+                del self._keys[i]
+                del self._items[i]
+        self._haystack = None
+
+    def update(self, values: V) -> None:
+        """Replaces every value of the index at once."""
+        self._rebuild(values)
+
+    async def refresh(
+        self, values: V | AsyncIterable[Any], *, chunk_size: int = 1000
+    ) -> None:
+        """|coro|
+
+        Brings the index up to date with a new set of values.
+
+        An asynchronous iterable is consumed in chunks, yielding to the event
+        loop in between, and searches keep using the previous values until it
+        is exhausted. Only the values that were added or removed since the
+        last refresh are inserted or deleted, unless so many changed that
+        rebuilding the index is cheaper.
+
+        Parameters
+        ----------
+        values: Union[Iterable, AsyncIterable]
+            The complete new set of values.
+        chunk_size: :class:`int`
+            The amount of values consumed between yields to the event loop.
+        """
+        fresh: list[Any] = []
+        if isinstance(values, AsyncIterable):
+            async for item in values:
+                fresh.append(item)
+                if len(fresh) % chunk_size == 0:
+                    await asyncio.sleep(0)
+        else:
+            fresh.extend(values)
+
+        try:
+            current = collections.Counter(self._items)
+            new = collections.Counter(fresh)
+        except TypeError:
+            # unhashable values can't be diffed
+            self._rebuild(fresh)
+            return
+
+        removed = list((current - new).elements())
+        added = list((new - current).elements())
+        if len(removed) + len(added) > len(self._items) // 8:
+            self._rebuild(fresh)
+        else:
+            self.discard(*removed)
+            self.add(*added)
+
+    def _build_haystack(self) -> str:
+        offsets = array.array("q")
+        position = 0
+        for key in self._keys:
+            offsets.append(position)
+            position += len(key) + 1
+        self._offsets = offsets
+        self._haystack = "\0".join(self._keys)
+        return self._haystack
+
+    def search(self, query: str | None, limit: int = 25) -> list[Any]:
+        """Finds the values whose name starts with or, if :attr:`substring` is
+        enabled, contains ``query``, case-insensitive.
+
+        Parameters
+        ----------
+        query: Optional[:class:`str`]
+            The text typed by the user so far.
+        limit: :class:`int`
+            The maximum amount of values to return.
+
+        Returns
+        -------
+        List[Any]
+            The matching values, prefix matches first, each group in
+            alphabetical order.
+        """
+        query = str(query or "").casefold().replace("\0", "")
+        if not query:
+            return self._items[:limit]
+
+        keys = self._keys
+        start = i = bisect_left(keys, query)
+        end = len(keys)
+        while i < end and i - start < limit and keys[i].startswith(query):
+            i += 1
+        results = self._items[start:i]
+        if not self.substring or len(results) >= limit:
+            return results
+
+        haystack = self._haystack
+        if haystack is None:
+            haystack = self._build_haystack()
+        offsets = self._offsets
+        prefix_end = i
+        position = haystack.find(query)
+        while position != -1 and len(results) < limit:
+            index = bisect_right(offsets, position) - 1
+            if not start <= index < prefix_end:
+                results.append(self._items[index])
+            if index + 1 >= end:
+                break
+            position = haystack.find(query, offsets[index + 1])
+        return results
+
+
 def basic_autocomplete(
     values: Values, *, filter: FilterFunc | None = None
 ) -> AutocompleteFunc:
@@ -1515,6 +1810,12 @@ def basic_autocomplete(
     values: Union[Union[Iterable[:class:`.OptionChoice`], Iterable[:class:`str`], Iterable[:class:`int`], Iterable[:class:`float`]], Callable[[:class:`.AutocompleteContext`], Union[Union[Iterable[:class:`str`], Iterable[:class:`int`], Iterable[:class:`float`]], Awaitable[Union[Iterable[:class:`str`], Iterable[:class:`int`], Iterable[:class:`float`]]]]], Awaitable[Union[Iterable[:class:`str`], Iterable[:class:`int`], Iterable[:class:`float`]]]]
         Possible values for the option. Accepts an iterable of :class:`str`, a callable (sync or async) that takes a
         single argument of :class:`.AutocompleteContext`, or a coroutine. Must resolve to an iterable of :class:`str`.
+
+        For large sets of values, pass an :class:`AutocompleteIndex` to search it in logarithmic time instead of
+        testing every value. Its results are ordered alphabetically.
+
+        .. versionchanged:: 2.9
+            Accepts an :class:`AutocompleteIndex`.
     filter: Optional[Callable[[:class:`.AutocompleteContext`, Any], Union[:class:`bool`, Awaitable[:class:`bool`]]]]
         An optional callable (sync or async) used to filter the autocomplete options. It accepts two arguments:
         the :class:`.AutocompleteContext` and an item from ``values`` iteration treated as callback parameters. If ``None`` is provided, a default filter is used that includes items whose string representation starts with the user's input value, case-insensitive.
@@ -1563,6 +1864,9 @@ def basic_autocomplete(
         if asyncio.iscoroutine(_values):
             _values = await _values
 
+        if filter is None and isinstance(_values, AutocompleteIndex):
+            return iter(_values.search(ctx.value))
+
         if filter is None:
 
             def _filter(ctx: AutocompleteContext, item: Any) -> bool:
@@ -30,12 +30,13 @@ import datetime
 import logging
 import struct
 import warnings
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Literal, overload
 
 from discord import opus
 from discord.enums import SpeakingState, try_enum
 from discord.errors import ClientException
-from discord.player import AudioPlayer, AudioSource
+from discord.player import AudioPlayer, AudioQueue, AudioSource, QueueEntry
 from discord.sinks.core import Sink
 from discord.sinks.errors import RecordingException
 from discord.utils import MISSING
@@ -412,7 +413,13 @@ class VoiceClient(VoiceProtocol):
     def _get_voice_packet(self, data: Any) -> bytes:
 
         session = self._connection.dave_session
-        packet = session.encrypt_opus(data) if session and session.ready else data
+        if session and session.ready:
+            # sources may hand out zero-copy views, the DAVE session needs bytes
+            packet = session.encrypt_opus(
+                data if isinstance(data, bytes) else bytes(data)
+            )
+        else:
+            packet = data
 
         header = bytearray(12)
 
@@ -595,6 +602,87 @@ class VoiceClient(VoiceProtocol):
         self._player.start()
         return future
 
+    @property
+    def queue(self) -> AudioQueue | None:
+        """The :class:`AudioQueue` being played, if any.
+
+        .. versionadded:: 2.9
+        """
+        source = self.source
+        return source if isinstance(source, AudioQueue) else None
+
+    def enqueue(
+        self,
+        source: AudioSource | Callable[[], AudioSource],
+        *,
+        after: AfterCallback | None = None,
+        preload: int = 10,
+        **encoder_options: Any,
+    ) -> QueueEntry:
+        r"""Adds a source to the playback queue, starting to play it if nothing
+        is playing.
+
+        Sources in the queue are played back to back by the same player. The
+        next source is opened and buffered while the current one plays, so
+        there is no gap between them. See :class:`AudioQueue` for details.
+
+        .. versionadded:: 2.9
+
+        Parameters
+        ----------
+        source: Union[:class:`AudioSource`, Callable[[], :class:`AudioSource`]]
+            The audio source to play, or a callable that creates it once it
+            is up next.
+        after: Callable[[Optional[:class:`Exception`]], Any]
+            The finalizer that is called after this source is exhausted.
+        preload: :class:`int`
+            The amount of frames buffered from the next source in advance,
+            only used when a new queue is started.
+        \*\*encoder_options:
+            The encoder options of :meth:`play`, only used when the encoder
+            does not exist yet.
+
+        Returns
+        -------
+        :class:`QueueEntry`
+            The entry of the source in the queue.
+
+        Raises
+        ------
+        ClientException
+            Already playing audio that is not a queue, or not connected to voice.
+        TypeError
+            Source is neither an :class:`AudioSource` nor a callable, or after
+            is not a callable.
+        OpusNotLoaded
+            Source is not opus encoded and opus is not loaded. Callables are
+            assumed not to be opus encoded.
+        """
+        if not self.is_connected():
+            raise ClientException("Not connected to voice")
+
+        queue = self.queue
+        if queue is None and (self.is_playing() or self.is_paused()):
+            raise ClientException("Already playing audio")
+
+        if not self.encoder and not (
+            isinstance(source, AudioSource) and source.is_opus()
+        ):
+            self.encoder = opus.Encoder(**encoder_options)
+
+        if queue is not None:
+            try:
+                return queue.add(source, after=after)
+            except ClientException:
+                # the queue ran out just now and its player is stopping
+                self._player.stop()  # type: ignore
+                self._player = None
+
+        queue = AudioQueue(preload=preload)
+        entry = queue.add(source, after=after)
+        self.play(queue)
+        return entry
+
     def stop(self) -> None:
         """Stops playing audio, if applicable."""
         if self._player:
@@ -26,7 +26,6 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import re
 import weakref
@@ -126,7 +125,7 @@ class AsyncWebhookAdapter:
     ) -> Any:
         headers: dict[str, str] = {}
         files = files or []
-        to_send: str | aiohttp.FormData | None = None
+        to_send: bytes | aiohttp.FormData | None = None
         bucket = (route.webhook_id, route.webhook_token)
 
         try:
@@ -136,7 +135,7 @@ class AsyncWebhookAdapter:
 
         if payload is not None:
             headers["Content-Type"] = "application/json"
-            to_send = utils._to_json(payload)
+            to_send = utils._to_json_bytes(payload)
 
         if auth_token is not None:
             headers["Authorization"] = f"Bot {auth_token}"
@@ -177,12 +176,13 @@ class AsyncWebhookAdapter:
                             url,
                             response.status,
                         )
-                        data = (await response.text(encoding="utf-8")) or None
-                        if (
-                            data
-                            and response.headers["Content-Type"] == "application/json"
-                        ):
-                            data = json.loads(data)
+                        body = await response.read()
+                        if not body:
+                            data = None
+                        elif response.headers["Content-Type"] == "application/json":
+                            data = utils._from_json(body)
+                        else:
+                            data = body.decode("utf-8")
 
                         remaining = response.headers.get("X-Ratelimit-Remaining")
                         if remaining == "0" and response.status != 429:
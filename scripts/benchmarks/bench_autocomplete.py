@@ -0,0 +1,79 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# Compares basic_autocomplete over a plain list of values with an
+# AutocompleteIndex for a range of typed prefixes.
+#
+#   python scripts/benchmarks/bench_autocomplete.py --values 50000
+#   python scripts/benchmarks/bench_autocomplete.py --values 200000 --substring
+
+import argparse
+import asyncio
+import random
+import string
+import time
+from types import SimpleNamespace
+
+from discord.utils import AutocompleteIndex, basic_autocomplete
+
+
+def make_values(count):
+    rng = random.Random(0)
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+        for _ in range(2000)
+    ]
+    return [
+        " ".join(rng.choices(words, k=rng.randint(1, 4))).title() for _ in range(count)
+    ]
+
+
+async def measure(autocomplete, queries):
+    start = time.perf_counter()
+    for query in queries:
+        list(await autocomplete(SimpleNamespace(value=query)))
+    return (time.perf_counter() - start) / len(queries)
+
+
+async def main(args):
+    values = make_values(args.values)
+    rng = random.Random(1)
+    queries = [rng.choice(values)[: rng.randint(0, 6)] for _ in range(args.queries)]
+
+    start = time.perf_counter()
+    index = AutocompleteIndex(values, substring=args.substring)
+    print(f"build index of {len(index)} values: {time.perf_counter() - start:.3f}s")
+
+    linear = await measure(basic_autocomplete(values), queries)
+    indexed = await measure(basic_autocomplete(index), queries)
+    print(f"linear per request:  {linear * 1e3:.3f}ms")
+    print(f"indexed per request: {indexed * 1e3:.3f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--values", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--substring", action="store_true")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,123 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# Fills a user cooldown mapping with a large amount of buckets and measures the
+# cost of a command invocation, which has to expire stale buckets first.
+#
+#   python scripts/benchmarks/bench_cooldowns.py --buckets 1000000
+#   python scripts/benchmarks/bench_cooldowns.py --buckets 100000 --baseline
+#   python scripts/benchmarks/bench_cooldowns.py --buckets 100000 --store
+
+import argparse
+import time
+import uuid
+from types import SimpleNamespace
+
+from discord.ext.commands import (
+    BucketType,
+    CooldownMapping,
+    MemoryCooldownStore,
+    SharedMemoryCooldownStore,
+)
+
+
+class FullScanCooldownMapping(CooldownMapping):
+    # the previous implementation, which scanned every bucket on each invocation
+    scanning = False
+
+    def _verify_cache_integrity(self, current=None):
+        if not self.scanning:
+            return
+        current = current or time.time()
+        dead_keys = [k for k, v in self._cache.items() if current > v._last + v.per]
+        for k in dead_keys:
+            del self._cache[k]
+
+    def _track(self, key, bucket, expires):
+        pass
+
+
+def run(cls, buckets: int, invocations: int, store=None) -> None:
+    mapping = cls.from_cooldown(1, 60, BucketType.user, store=store, namespace="cmd")
+    messages = [SimpleNamespace(author=SimpleNamespace(id=i)) for i in range(buckets)]
+
+    now = 1_000_000.0
+    start = time.perf_counter()
+    for i, message in enumerate(messages):
+        # spread the buckets over a minute so some of them keep expiring
+        mapping.update_rate_limit(message, now + i * 60 / buckets)
+    fill = time.perf_counter() - start
+    # filling the baseline would be quadratic, so it only scans from here on
+    mapping.scanning = True
+
+    now += 60
+    start = time.perf_counter()
+    for i in range(invocations):
+        now += 0.001
+        mapping.update_rate_limit(messages[i % buckets], now)
+    elapsed = (time.perf_counter() - start) / invocations
+
+    start = time.perf_counter()
+    mapping.get_retry_after_many(range(0, buckets, 10), now)
+    bulk = time.perf_counter() - start
+
+    print(f"{cls.__name__}" + (f" ({type(store).__name__}):" if store else ":"))
+    print(f"  fill {buckets} buckets: {fill:.2f}s")
+    print(f"  per invocation:       {elapsed * 1e6:.1f}us")
+    print(f"  bulk query {buckets // 10}:   {bulk * 1000:.1f}ms")
+    if store is None:
+        print(f"  buckets left:         {len(mapping._cache)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark cooldown buckets.")
+    parser.add_argument("--buckets", type=int, default=1_000_000)
+    parser.add_argument("--invocations", type=int, default=10_000)
+    parser.add_argument(
+        "--baseline",
+        action="store_true",
+        help="also run the previous full scan implementation (slow)",
+    )
+    parser.add_argument(
+        "--store", action="store_true", help="also run with the cooldown stores"
+    )
+    args = parser.parse_args()
+
+    run(CooldownMapping, args.buckets, args.invocations)
+    if args.store:
+        run(CooldownMapping, args.buckets, args.invocations, MemoryCooldownStore())
+        store = SharedMemoryCooldownStore(
+            f"pycord-bench-{uuid.uuid4().hex[:12]}", capacity=args.buckets * 2
+        )
+        try:
+            run(CooldownMapping, args.buckets, args.invocations, store)
+        finally:
+            store.close()
+            store.unlink()
+    if args.baseline:
+        run(FullScanCooldownMapping, args.buckets, min(args.invocations, 100))
+
+
+if __name__ == "__main__":
+    main()
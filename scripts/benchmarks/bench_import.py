@@ -0,0 +1,108 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# Measures the cost of ``import discord`` in fresh interpreters, and what
+# loading the lazily imported parts costs on first use. Every scenario is timed
+# as a whole, and ``-X importtime`` is used to break it down per module. Caches
+# are warmed first, so this compares import work, not disk reads.
+#
+#   python scripts/benchmarks/bench_import.py
+#   python scripts/benchmarks/bench_import.py --runs 20 --top 15
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SCENARIOS = {
+    "import discord": "import discord",
+    "+ voice stack": "import discord; discord.FFmpegPCMAudio; discord.sinks; discord.opus",
+    "+ emoji map": "import discord; discord.utils.EMOJIS_MAP",
+    "import discord.ext.commands": "import discord.ext.commands",
+}
+
+
+TIMED = """\
+import time
+_start = time.perf_counter()
+{code}
+print(time.perf_counter() - _start)
+"""
+
+
+def importtime(code: str) -> tuple[float, dict[str, tuple[int, int]]]:
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", TIMED.format(code=code)],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        if own.strip().isdigit():
+            modules[name.strip()] = (int(own), int(cumulative))
+    return float(result.stdout.splitlines()[-1]), modules
+
+
+def run(name: str, code: str, runs: int) -> list[dict[str, tuple[int, int]]]:
+    importtime(code)
+    elapsed, samples = zip(*(importtime(code) for _ in range(runs)))
+    print(
+        f"{name:30} median {statistics.median(elapsed) * 1000:7.1f}ms"
+        f"  min {min(elapsed) * 1000:7.1f}ms  ({len(samples[0])} modules)"
+    )
+    return list(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the import time.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--top", type=int, default=10, help="the slowest modules of import discord"
+    )
+    args = parser.parse_args()
+
+    results = {name: run(name, code, args.runs) for name, code in SCENARIOS.items()}
+
+    print("\nslowest modules of 'import discord' (median self time):")
+    samples = results["import discord"]
+    own = {
+        module: statistics.median(s[module][0] for s in samples if module in s)
+        for module in samples[0]
+    }
+    for module, us in sorted(own.items(), key=lambda x: -x[1])[: args.top]:
+        print(f"  {module:40} {us / 1000:6.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# Encodes a message payload and decodes a large GUILD_CREATE payload with every
+# installed JSON backend, comparing the bytes path with the previous one that
+# went through str on both ends.
+#
+#   python scripts/benchmarks/bench_json.py
+#   python scripts/benchmarks/bench_json.py --members 20000 --rounds 50
+
+import argparse
+import time
+
+from discord import utils
+
+
+def guild_payload(members: int) -> dict:
+    return {
+        "op": 0,
+        "s": 2,
+        "t": "GUILD_CREATE",
+        "d": {
+            "id": "81384788765712384",
+            "name": "Pycord Benchmark Guild ✨",
+            "roles": [
+                {"id": str(10**17 + i), "name": f"role {i}", "permissions": "0"}
+                for i in range(250)
+            ],
+            "channels": [
+                {"id": str(2 * 10**17 + i), "name": f"channel-{i}", "type": 0}
+                for i in range(500)
+            ],
+            "members": [
+                {
+                    "user": {
+                        "id": str(3 * 10**17 + i),
+                        "username": f"member{i}",
+                        "global_name": f"Member é {i}",
+                        "avatar": None,
+                    },
+                    "roles": [str(10**17 + i % 250)],
+                    "joined_at": "2021-08-27T18:30:00.000000+00:00",
+                    "deaf": False,
+                    "mute": False,
+                }
+                for i in range(members)
+            ],
+        },
+    }
+
+
+MESSAGE = {
+    "content": "Hello there \U0001f44b",
+    "tts": False,
+    "embeds": [
+        {
+            "title": "Benchmark",
+            "description": "x" * 500,
+            "fields": [{"name": f"field {i}", "value": "y" * 50} for i in range(10)],
+        }
+    ],
+    "allowed_mentions": {"parse": ["users"], "replied_user": False},
+}
+
+
+def timed(func, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds
+
+
+def run(backend: str, guild: bytes, rounds: int) -> None:
+    utils.set_json_backend(backend)
+    to_bytes, loads = utils._to_json_bytes, utils._from_json
+
+    # the previous path encoded to str, which aiohttp encoded again, and
+    # decoded the response or inflated gateway message to str before parsing
+    encode_str = timed(lambda: to_bytes(MESSAGE).decode().encode(), rounds * 100)
+    encode_bytes = timed(lambda: to_bytes(MESSAGE), rounds * 100)
+    decode_str = timed(lambda: loads(guild.decode("utf-8")), rounds)
+    decode_bytes = timed(lambda: loads(guild), rounds)
+
+    print(f"{backend}:")
+    print(
+        f"  encode message  str: {encode_str * 1e6:7.1f}us  bytes: {encode_bytes * 1e6:7.1f}us"
+    )
+    print(
+        f"  decode guild    str: {decode_str * 1e3:7.2f}ms  bytes: {decode_bytes * 1e3:7.2f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the JSON backends.")
+    parser.add_argument("--members", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    utils.set_json_backend("json")
+    guild = utils._to_json_bytes(guild_payload(args.members))
+    print(f"GUILD_CREATE payload: {len(guild) / 1024:.0f}KiB")
+
+    for backend, available in (
+        ("json", True),
+        ("orjson", utils.HAS_ORJSON),
+        ("msgspec", utils.HAS_MSGSPEC),
+    ):
+        if available:
+            run(backend, guild, args.rounds)
+        else:
+            print(f"{backend}: not installed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# Measures how long PCMMixer takes to produce one 20ms frame depending on the
+# amount of inputs, compared to the 20ms budget of the player thread.
+#
+#   python scripts/benchmarks/bench_mixer.py --inputs 1 2 4 8 16
+#   python scripts/benchmarks/bench_mixer.py --python   # force the fallback
+
+import argparse
+import os
+import time
+
+from discord import player
+from discord.opus import Encoder
+from discord.player import AudioSource, PCMMixer
+
+BUDGET = Encoder.FRAME_LENGTH / 1000
+
+
+class NoiseSource(AudioSource):
+    def __init__(self) -> None:
+        self.frame = os.urandom(Encoder.FRAME_SIZE)
+
+    def read(self) -> bytes:
+        return self.frame
+
+
+def run(inputs: int, frames: int) -> float:
+    # inputs are read synchronously so that only the mixing itself is measured
+    mixer = PCMMixer(read_ahead=0)
+    for i in range(inputs):
+        mixer_input = mixer.add(NoiseSource(), gain=0.8)
+        if i % 2:
+            # keep half of the inputs fading for the whole run
+            mixer_input.fade(0.2, frames * BUDGET)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        mixer.read()
+    elapsed = (time.perf_counter() - start) / frames
+    mixer.cleanup()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark PCMMixer.")
+    parser.add_argument("--inputs", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument(
+        "--python", action="store_true", help="use the pure Python fallback"
+    )
+    args = parser.parse_args()
+
+    if args.python:
+        player.HAS_NUMPY = False
+    backend = "numpy" if player.HAS_NUMPY else "python"
+
+    print(f"backend: {backend}")
+    print(f"{'inputs':>6}  {'per frame':>10}  {'budget':>7}")
+    for inputs in args.inputs:
+        elapsed = run(inputs, args.frames)
+        print(f"{inputs:>6}  {elapsed * 1e6:>8.0f}us  {elapsed / BUDGET * 100:>6.1f}%")
+
+
+if __name__ == "__main__":
+    main()
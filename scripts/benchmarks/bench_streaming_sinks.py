@@ -0,0 +1,100 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# Simulates a multi-speaker recording by feeding 20ms PCM frames straight into a
+# sink, then reports peak Python memory and the time it takes to stop.
+#
+#   python scripts/benchmarks/bench_streaming_sinks.py --minutes 120 --speakers 10
+#   python scripts/benchmarks/bench_streaming_sinks.py --minutes 5 --baseline
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from discord.opus import Decoder
+from discord.sinks import PCMSink, StreamingSink, StreamingWaveSink
+
+FRAMES_PER_MINUTE = 60 * 1000 // Decoder.FRAME_LENGTH
+
+
+def run(sink, minutes: int, speakers: int) -> None:
+    frame = os.urandom(Decoder.FRAME_SIZE)
+    frames = minutes * FRAMES_PER_MINUTE
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(frames):
+        for user in range(speakers):
+            sink.write(frame, user)
+    feed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sink.cleanup()
+    finalize = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    audio = frames * speakers * Decoder.FRAME_SIZE
+    print(f"{type(sink).__name__}:")
+    print(f"  audio written:  {audio / 2**30:.2f} GiB")
+    print(f"  feed time:      {feed:.2f}s ({audio / feed / 2**20:.0f} MiB/s)")
+    print(f"  finalize time:  {finalize * 1000:.2f}ms")
+    print(f"  peak memory:    {peak / 2**20:.2f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark recording sinks.")
+    parser.add_argument("--minutes", type=int, default=120)
+    parser.add_argument("--speakers", type=int, default=10)
+    parser.add_argument("--rotate-minutes", type=float, default=30)
+    parser.add_argument(
+        "--baseline",
+        action="store_true",
+        help="also run the in-memory PCMSink (needs as much RAM as audio written)",
+    )
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="pycord-bench-")
+    try:
+        for cls in (StreamingSink, StreamingWaveSink):
+            sink = cls(
+                directory=os.path.join(directory, cls.__name__),
+                max_segment_duration=args.rotate_minutes * 60,
+            )
+            run(sink, args.minutes, args.speakers)
+            shutil.rmtree(sink.directory)
+
+        if args.baseline:
+            sink = PCMSink()
+            sink.format_audio = lambda audio: None
+            run(sink, args.minutes, args.speakers)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
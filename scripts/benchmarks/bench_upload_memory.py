@@ -0,0 +1,137 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# Uploads files of various sizes to a local server the same way HTTPClient
+# does and reports the peak Python memory of every File source.
+#
+#   python scripts/benchmarks/bench_upload_memory.py --sizes 25 100
+#   python scripts/benchmarks/bench_upload_memory.py --sizes 25 100 250 500
+
+import argparse
+import asyncio
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+import aiohttp
+from aiohttp import web
+
+from discord.file import File
+
+MB = 1024 * 1024
+
+
+async def discard(request):
+    reader = await request.multipart()
+    total = 0
+    async for part in reader:
+        while chunk := await part.read_chunk(MB):
+            total += len(chunk)
+    return web.json_response({"size": total})
+
+
+def make_file(directory, size):
+    path = os.path.join(directory, f"{size}.bin")
+    block = os.urandom(MB)
+    with open(path, "wb") as fp:
+        for _ in range(size):
+            fp.write(block)
+    return path
+
+
+def sources(path):
+    def buffered():
+        # what non-seekable sources had to do so far
+        with open(path, "rb") as fp:
+            return File(io.BytesIO(fp.read()), "upload.bin")
+
+    async def chunks():
+        with open(path, "rb") as fp:
+            while chunk := fp.read(256 * 1024):
+                yield chunk
+
+    return {
+        "BytesIO": buffered,
+        "path": lambda: File(path, "upload.bin"),
+        "mmap": lambda: File(path, "upload.bin", mmap=True),
+        "async iterator": lambda: File(chunks(), "upload.bin"),
+    }
+
+
+async def upload(session, url, make):
+    tracemalloc.start()
+    start = time.perf_counter()
+    file = make()
+    try:
+        form = aiohttp.FormData(quote_fields=False)
+        form.add_field(name="payload_json", value="{}")
+        form.add_field(
+            name="files[0]",
+            value=file.fp,
+            filename=file.filename,
+            content_type="application/octet-stream",
+        )
+        async with session.post(url, data=form) as response:
+            size = (await response.json())["size"]
+    finally:
+        file.close()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, elapsed, peak
+
+
+async def main(args):
+    app = web.Application(client_max_size=0)
+    app.router.add_post("/upload", discard)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/upload"
+
+    with tempfile.TemporaryDirectory() as directory:
+        async with aiohttp.ClientSession() as session:
+            for size in args.sizes:
+                path = make_file(directory, size)
+                print(f"{size}MB:")
+                for name, make in sources(path).items():
+                    uploaded, elapsed, peak = await upload(session, url, make)
+                    assert uploaded >= size * MB
+                    print(
+                        f"  {name:<15} peak {peak / MB:8.1f}MB"
+                        f"  {size / elapsed:7.1f}MB/s"
+                    )
+                os.remove(path)
+
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 100, 250, 500])
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,170 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import subprocess
+import sys
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from discord.ext.commands import (
+    BucketType,
+    CooldownMapping,
+    MaxConcurrency,
+    MaxConcurrencyReached,
+    MemoryCooldownStore,
+    SharedMemoryCooldownStore,
+)
+
+
+def message(user_id: int) -> SimpleNamespace:
+    return SimpleNamespace(author=SimpleNamespace(id=user_id))
+
+
+@pytest.fixture
+def shared_store():
+    store = SharedMemoryCooldownStore(f"pycord-test-{uuid.uuid4().hex[:12]}")
+    yield store
+    store.close()
+    store.unlink()
+
+
+@pytest.fixture(params=["memory", "shared"])
+def store(request, shared_store):
+    if request.param == "memory":
+        return MemoryCooldownStore()
+    return shared_store
+
+
+def test_stored_cooldown(store):
+    mapping = CooldownMapping.from_cooldown(
+        2, 10, BucketType.user, store=store, namespace="cmd"
+    )
+    assert mapping.update_rate_limit(message(1), 1000.0) is None
+    assert mapping.update_rate_limit(message(1), 1001.0) is None
+    assert mapping.update_rate_limit(message(1), 1002.0) == 8.0
+    assert mapping.get_bucket(message(1)).get_tokens(1003.0) == 0
+    assert mapping.get_bucket(message(2)).get_tokens(1003.0) == 2
+
+    assert mapping.get_retry_after_many([1, 2], 1004.0) == {1: 6.0, 2: 0.0}
+    # a new window starts once the old one is over
+    assert mapping.update_rate_limit(message(1), 1011.0) is None
+
+    mapping.get_bucket(message(1)).reset()
+    assert mapping.get_bucket(message(1)).get_tokens(1012.0) == 2
+
+
+def test_namespaces_are_separate(store):
+    first = CooldownMapping.from_cooldown(
+        1, 10, BucketType.user, store=store, namespace="a"
+    )
+    second = CooldownMapping.from_cooldown(
+        1, 10, BucketType.user, store=store, namespace="b"
+    )
+    assert first.update_rate_limit(message(1), 1000.0) is None
+    assert second.update_rate_limit(message(1), 1000.0) is None
+    assert first.update_rate_limit(message(1), 1000.0)
+
+
+def test_stored_max_concurrency(store):
+    concurrency = MaxConcurrency(
+        1, per=BucketType.user, wait=False, store=store, namespace="cmd"
+    )
+
+    async def run():
+        await concurrency.acquire(message(1))
+        await concurrency.acquire(message(2))
+        with pytest.raises(MaxConcurrencyReached):
+            await concurrency.acquire(message(1))
+
+        await concurrency.release(message(1))
+        await concurrency.acquire(message(1))
+
+    # stored concurrency does not need the current event loop at all
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+def test_shared_between_processes(shared_store):
+    mapping = CooldownMapping.from_cooldown(
+        1, 60, BucketType.user, store=shared_store, namespace="cmd"
+    )
+    code = (
+        "from discord.ext.commands import SharedMemoryCooldownStore;"
+        f"store = SharedMemoryCooldownStore({shared_store.name!r});"
+        "print(store.update_rate_limit('cmd', 1, 1, 60, 1000.0));"
+        "store.close()"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "None"
+    assert mapping.update_rate_limit(message(1), 1010.0) == 50.0
+
+
+def test_full_table_evicts_least_recently_used():
+    store = SharedMemoryCooldownStore(
+        f"pycord-test-{uuid.uuid4().hex[:12]}", capacity=4, max_probes=4
+    )
+    try:
+        for user_id in range(4):
+            store.update_rate_limit("cmd", user_id, 1, 60, 1000.0 + user_id)
+        store.update_rate_limit("cmd", 10, 1, 60, 1010.0)
+
+        retry_after = store.get_retry_after_many("cmd", range(4), 1010.0)
+        assert list(retry_after.values()).count(0.0) == 1
+        assert retry_after[0] == 0.0
+        assert store.get_tokens("cmd", 10, 1, 60, 1010.0) == 0
+    finally:
+        store.close()
+        store.unlink()
+
+
+def test_full_table_never_evicts_running_invocations():
+    store = SharedMemoryCooldownStore(
+        f"pycord-test-{uuid.uuid4().hex[:12]}", capacity=4, max_probes=4
+    )
+    try:
+        assert store.acquire("mc", 1, 1)
+        for user_id in range(3):
+            store.update_rate_limit("cmd", user_id, 1, 60, 1000.0 + user_id)
+        # evicts the oldest cooldown bucket, not the concurrency slot
+        store.update_rate_limit("cmd", 10, 1, 60, 1010.0)
+        assert not store.acquire("mc", 1, 1)
+
+        # once every slot is held there is nothing left to evict
+        for user_id in range(2, 5):
+            assert store.acquire("mc", user_id, 1)
+        with pytest.raises(RuntimeError):
+            store.update_rate_limit("cmd", 11, 1, 60, 1020.0)
+        with pytest.raises(RuntimeError):
+            store.acquire("mc", 5, 1)
+    finally:
+        store.close()
+        store.unlink()
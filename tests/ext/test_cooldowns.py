@@ -0,0 +1,88 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from types import SimpleNamespace
+
+from discord.ext.commands import BucketType, CooldownMapping, DynamicCooldownMapping
+from discord.ext.commands.cooldowns import Cooldown
+
+
+def message(user_id: int) -> SimpleNamespace:
+    return SimpleNamespace(author=SimpleNamespace(id=user_id))
+
+
+def test_expired_buckets_are_dropped():
+    mapping = CooldownMapping.from_cooldown(1, 10, BucketType.user)
+    for user_id in range(100):
+        mapping.update_rate_limit(message(user_id), current=1000.0)
+    assert len(mapping._cache) == 100
+
+    # still on cooldown
+    mapping.get_bucket(message(0), current=1005.0)
+    assert len(mapping._cache) == 100
+
+    mapping.get_bucket(message(0), current=1011.0)
+    assert list(mapping._cache) == [0]
+
+
+def test_used_buckets_are_kept():
+    mapping = CooldownMapping.from_cooldown(2, 10, BucketType.user)
+    mapping.update_rate_limit(message(1), current=1000.0)
+    mapping.update_rate_limit(message(2), current=1000.0)
+    mapping.update_rate_limit(message(1), current=1008.0)
+
+    mapping.get_bucket(message(3), current=1015.0)
+    assert set(mapping._cache) == {1, 3}
+
+    mapping.get_bucket(message(3), current=1017.0)
+    assert set(mapping._cache) == {1, 3}
+
+    mapping.get_bucket(message(3), current=1030.0)
+    assert set(mapping._cache) == {3}
+
+
+def test_dynamic_cooldowns_expire_independently():
+    mapping = DynamicCooldownMapping(
+        lambda msg: Cooldown(1, msg.author.id), BucketType.user
+    )
+    mapping.update_rate_limit(message(5), current=1000.0)
+    mapping.update_rate_limit(message(50), current=1000.0)
+
+    mapping.get_bucket(message(50), current=1006.0)
+    assert set(mapping._cache) == {50}
+    assert set(mapping.copy()._cache) == {50}
+
+
+def test_get_retry_after_many():
+    mapping = CooldownMapping.from_cooldown(1, 10, BucketType.user)
+    mapping.update_rate_limit(message(1), current=1000.0)
+    mapping.update_rate_limit(message(1), current=1000.0)
+    mapping.update_rate_limit(message(2), current=1000.0)
+
+    assert mapping.get_retry_after_many([1, 2, 3], current=1004.0) == {
+        1: 6.0,
+        2: 6.0,
+        3: 0.0,
+    }
+    assert 3 not in mapping._cache
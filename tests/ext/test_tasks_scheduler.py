@@ -0,0 +1,115 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import datetime
+
+import pytest
+
+from discord.ext import tasks
+from discord.ext.tasks import LoopScheduler
+
+
+def run(coro):
+    # a private loop keeps the current event loop of other tests untouched
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_drives_many_loops():
+    scheduler = LoopScheduler(resolution=0.005)
+    counts = []
+
+    def make_loop():
+        @tasks.loop(seconds=0.02, count=3, scheduler=scheduler)
+        async def job():
+            counts.append(job.current_loop)
+
+        return job
+
+    async def main():
+        loops = [make_loop() for _ in range(200)]
+        await asyncio.gather(*(job.start() for job in loops))
+
+    run(main())
+    assert len(counts) == 600
+    assert scheduler.pending == 0
+    assert scheduler.max_drift < 1
+
+
+def test_cascades_long_sleeps():
+    # 150 ticks is further than the first level of the wheel reaches
+    scheduler = LoopScheduler(resolution=0.001)
+
+    async def main():
+        start = asyncio.get_running_loop().time()
+        when = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
+            seconds=0.15
+        )
+        job = tasks.loop(seconds=1)(asyncio.sleep)
+        await scheduler._sleep(job, when).wait()
+        return asyncio.get_running_loop().time() - start
+
+    elapsed = run(main())
+    assert 0.14 <= elapsed < 1
+
+
+def test_cancel_removes_sleep():
+    scheduler = LoopScheduler()
+
+    @tasks.loop(seconds=60, scheduler=scheduler)
+    async def job():
+        pass
+
+    async def main():
+        task = job.start()
+        await asyncio.sleep(0.05)
+        assert scheduler.pending == 1
+        job.change_interval(seconds=120)
+        assert scheduler.pending == 1
+        job.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    run(main())
+    assert scheduler.pending == 0
+
+
+def test_spread_only_applies_to_times():
+    scheduler = LoopScheduler(spread=30)
+
+    @tasks.loop(time=datetime.time(12), scheduler=scheduler)
+    async def daily():
+        pass
+
+    @tasks.loop(seconds=10, scheduler=scheduler)
+    async def periodic():
+        pass
+
+    assert 0 <= scheduler._offset_for(daily) < 30
+    assert scheduler._offset_for(daily) == scheduler._offset_for(daily)
+    assert scheduler._offset_for(periodic) == 0
@@ -0,0 +1,82 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import io
+
+from discord.sinks import ReplayBuffer, ReplaySink
+from discord.sinks.replay import OPUS_SILENCE
+
+
+def _frame(value: int) -> bytes:
+    return bytes([value]) * 3840
+
+
+def test_replay_buffer_keeps_only_capacity_frames():
+    buffer = ReplayBuffer(4)
+    nbytes = buffer.nbytes
+    for frame in range(10):
+        buffer.append(frame, _frame(frame))
+
+    clip = buffer.export("user", 0, 10)
+    assert buffer.nbytes == nbytes
+    assert clip.start == 6
+    assert clip.frames == 4
+    assert clip.tobytes() == b"".join(_frame(i) for i in range(6, 10))
+
+
+def test_replay_buffer_chunks_are_views_and_gaps_are_silence():
+    buffer = ReplayBuffer(8)
+    for frame in (0, 1, 3):
+        buffer.append(frame, _frame(frame + 1))
+
+    clip = buffer.export("user", 0, 4)
+    assert all(isinstance(chunk, memoryview) for chunk in clip.chunks)
+    assert [len(chunk) for chunk in clip.chunks] == [7680, 3840, 3840]
+    assert clip.chunks[1] == bytes(3840)
+
+    fp = io.BytesIO()
+    clip.write(fp)
+    assert fp.getvalue() == _frame(1) + _frame(2) + bytes(3840) + _frame(4)
+
+
+def test_replay_buffer_opus_frames():
+    buffer = ReplayBuffer(4, opus=True)
+    buffer.append(0, b"abc")
+    buffer.append(2, b"defg")
+
+    clip = buffer.export("user", 0, 3)
+    assert [bytes(chunk) for chunk in clip.chunks] == [b"abc", OPUS_SILENCE, b"defg"]
+
+
+def test_replay_sink_exports_aligned_windows():
+    sink = ReplaySink(duration=1)
+    sink.current_frame = lambda: 10
+    for _ in range(3):
+        sink.write(_frame(1), 1)
+    sink.write(_frame(2), 2)
+
+    clips = sink.export_frames(10, 13)
+    assert clips[1].start == clips[2].start == 10
+    assert clips[1].tobytes() == _frame(1) * 3
+    assert clips[2].tobytes() == _frame(2) + bytes(3840) * 2
@@ -0,0 +1,81 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import wave
+
+import pytest
+
+from discord.sinks import StreamingSink, StreamingSinkError, StreamingWaveSink
+from discord.sinks.streaming import BYTES_PER_SECOND
+
+FRAME = b"\x01\x00" * 1920
+
+
+def test_streaming_sink_rotates_by_size(tmp_path):
+    sink = StreamingSink(directory=str(tmp_path), max_segment_size=len(FRAME) * 3)
+    for _ in range(7):
+        sink.write(FRAME, 1)
+    sink.cleanup()
+
+    segments = sink.get_user_audio(1)
+    assert len(segments) == 3
+    assert [len(open(path, "rb").read()) for path in segments] == [
+        len(FRAME) * 3,
+        len(FRAME) * 3,
+        len(FRAME),
+    ]
+    assert sink.audio_data[1].bytes_written == len(FRAME) * 7
+
+
+def test_streaming_sink_rotates_by_duration(tmp_path):
+    sink = StreamingSink(directory=str(tmp_path), max_segment_duration=0.1)
+    frames = BYTES_PER_SECOND // len(FRAME)
+    for _ in range(frames):
+        sink.write(FRAME, 1)
+    sink.cleanup()
+
+    assert len(sink.get_user_audio(1)) == 10
+
+
+def test_streaming_wave_sink_writes_valid_header(tmp_path):
+    sink = StreamingWaveSink(directory=str(tmp_path))
+    for _ in range(5):
+        sink.write(FRAME, 1)
+        sink.write(FRAME, 2)
+    sink.cleanup()
+
+    assert len(sink.get_all_audio()) == 2
+    with wave.open(sink.get_user_audio(1)[0], "rb") as f:
+        assert f.getnchannels() == 2
+        assert f.getframerate() == 48000
+        assert f.readframes(f.getnframes()) == FRAME * 5
+
+
+def test_streaming_audio_data_rejects_writes_after_cleanup(tmp_path):
+    sink = StreamingSink(directory=str(tmp_path))
+    sink.write(FRAME, 1)
+    sink.cleanup()
+
+    with pytest.raises(StreamingSinkError):
+        sink.audio_data[1].write(FRAME)
@@ -0,0 +1,178 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import types
+
+import pytest
+
+import discord
+from discord import AutocompleteCache
+
+
+def make_ctx(value, user=1, guild=10, command="tag", group=None):
+    options = [{"name": "name", "value": value, "focused": True}]
+    if group is not None:
+        for name in reversed(group):
+            options = [{"name": name, "type": 1, "options": options}]
+    interaction = types.SimpleNamespace(
+        user=types.SimpleNamespace(id=user),
+        guild_id=guild,
+        data={"options": options},
+    )
+    return types.SimpleNamespace(
+        interaction=interaction,
+        command=types.SimpleNamespace(qualified_name=command),
+        value=value,
+    )
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_results_are_cached_per_scope():
+    calls = []
+    cache = AutocompleteCache(ttl=60, scope="guild")
+
+    @cache
+    def search(ctx):
+        calls.append(ctx.value)
+        return (f"{ctx.value}{i}" for i in range(30))
+
+    async def main():
+        first = await search(make_ctx("a", user=1))
+        assert len(first) == 25
+        assert await search(make_ctx("a", user=2)) == first
+        await search(make_ctx("a", guild=11))
+        await search(make_ctx("b"))
+
+    run(main())
+    assert calls == ["a", "a", "b"]
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert cache.hit_rate == 0.25
+
+
+def test_lru_and_ttl():
+    cache = AutocompleteCache(ttl=0, maxsize=2, scope="global")
+    calls = []
+
+    @cache
+    async def search(ctx):
+        calls.append(ctx.value)
+        return [ctx.value]
+
+    async def main():
+        for value in "abc":
+            await search(make_ctx(value))
+        await search(make_ctx("c"))
+
+    run(main())
+    # with a ttl of 0 nothing is ever served from the cache
+    assert calls == ["a", "b", "c", "c"]
+    assert len(cache) == 2
+
+
+def test_identical_requests_are_coalesced():
+    cache = AutocompleteCache(scope="global")
+    calls = []
+
+    @cache
+    async def search(ctx):
+        calls.append(ctx.value)
+        await asyncio.sleep(0.01)
+        return ["x"]
+
+    async def main():
+        return await asyncio.gather(
+            search(make_ctx("a", user=1)), search(make_ctx("a", user=2))
+        )
+
+    assert run(main()) == [["x"], ["x"]]
+    assert calls == ["a"]
+    assert cache.coalesced == 1
+
+
+def test_newer_keystroke_drops_stale_request():
+    cache = AutocompleteCache()
+    cancelled = []
+
+    @cache
+    async def search(ctx):
+        try:
+            await asyncio.sleep(0.05 if ctx.value == "a" else 0)
+        except asyncio.CancelledError:
+            cancelled.append(ctx.value)
+            raise
+        return [ctx.value]
+
+    async def main():
+        stale = asyncio.ensure_future(search(make_ctx("a")))
+        await asyncio.sleep(0)
+        fresh = await search(make_ctx("ab"))
+        with pytest.raises(asyncio.CancelledError):
+            await stale
+        await asyncio.sleep(0)
+        return fresh
+
+    assert run(main()) == ["ab"]
+    assert cancelled == ["a"]
+    assert cache.dropped == 1
+
+
+def test_instance_methods_keep_their_signature():
+    option = discord.Option(str)
+
+    class Cog:
+        @AutocompleteCache()
+        async def search(self, ctx):
+            return []
+
+    option.autocomplete = Cog.search
+    assert option._autocomplete_is_instance_method
+
+
+def test_subcommand_options_are_part_of_the_key():
+    calls = []
+    cache = AutocompleteCache(ttl=60)
+
+    @cache
+    def search(ctx):
+        calls.append(ctx.value)
+        return [ctx.value + "!"]
+
+    async def test():
+        group = ("tags", "search")
+        assert await search(make_ctx("a", group=group)) == ["a!"]
+        assert await search(make_ctx("ab", group=group)) == ["ab!"]
+        assert await search(make_ctx("ab", group=group)) == ["ab!"]
+        # the same value under another subcommand is a different request
+        assert await search(make_ctx("ab", group=("tags", "delete"))) == ["ab!"]
+
+    run(test())
+    assert calls == ["a", "ab", "ab"]
@@ -0,0 +1,100 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from discord import OptionChoice
+from discord.utils import AutocompleteIndex, basic_autocomplete
+
+VALUES = ["banana", "Apple", "apricot", "Pineapple", "grape", "Grapefruit"]
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_prefix_search_is_case_insensitive_and_sorted():
+    index = AutocompleteIndex(VALUES)
+    assert index.search("ap") == ["Apple", "apricot"]
+    assert index.search("GRAPE") == ["grape", "Grapefruit"]
+    assert index.search("") == sorted(VALUES, key=str.casefold)
+    assert index.search("a", limit=1) == ["Apple"]
+    assert index.search("x") == []
+
+
+def test_substring_matches_follow_prefix_matches():
+    index = AutocompleteIndex(VALUES, substring=True)
+    assert index.search("apple") == ["Apple", "Pineapple"]
+    assert index.search("ap") == [
+        "Apple",
+        "apricot",
+        "grape",
+        "Grapefruit",
+        "Pineapple",
+    ]
+    assert index.search("e", limit=3) == ["Apple", "grape", "Grapefruit"]
+
+
+def test_option_choices_are_searched_by_name():
+    choices = [OptionChoice("Red", 1), OptionChoice("Green", 2)]
+    index = AutocompleteIndex(choices)
+    assert index.search("gr") == [choices[1]]
+
+
+def test_incremental_updates():
+    index = AutocompleteIndex(VALUES, substring=True)
+    index.search("ap")
+    index.add("Apex")
+    index.discard("Apple", "missing")
+    assert "Apex" in index and "Apple" not in index
+    assert index.search("ap") == ["Apex", "apricot", "grape", "Grapefruit", "Pineapple"]
+
+
+def test_refresh_from_async_iterable():
+    index = AutocompleteIndex(str(i) for i in range(100))
+
+    async def values():
+        for i in range(1, 101):
+            yield str(i)
+
+    run(index.refresh(values(), chunk_size=10))
+    assert "0" not in index and "100" in index
+    assert len(index) == 100
+    assert index.search("10") == ["10", "100"]
+
+
+def test_basic_autocomplete_uses_index():
+    index = AutocompleteIndex(VALUES)
+    autocomplete = basic_autocomplete(index)
+    ctx = SimpleNamespace(value="gr")
+    assert list(run(autocomplete(ctx))) == ["grape", "Grapefruit"]
+
+    # a custom filter still sees every value
+    autocomplete = basic_autocomplete(index, filter=lambda c, v: "n" in v)
+    assert sorted(run(autocomplete(ctx))) == ["Pineapple", "banana"]
@@ -0,0 +1,187 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import json
+
+import discord
+from discord.broadcast import _BroadcastScheduler
+from discord.errors import NotFound
+
+
+class FakeHTTP:
+    def __init__(self, loop, fail=None):
+        self.loop = loop
+        self.fail = fail or {}
+        self.sent = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send_serialized_message(self, channel_id, payload):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            error = self.fail.get(channel_id)
+            if isinstance(error, list):
+                error = error.pop(0) if error else None
+            if error is not None:
+                raise error
+            self.sent.append((channel_id, payload))
+            return {"id": str(channel_id * 10)}
+        finally:
+            self.in_flight -= 1
+
+
+def run(test):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(test(loop))
+    finally:
+        loop.close()
+
+
+def scheduler(http, events=None, **kwargs):
+    def dispatch(event, broadcast):
+        if events is not None:
+            events.append((event, broadcast.id))
+
+    result = _BroadcastScheduler(http, dispatch, rate=10000, **kwargs)
+    result.retry_delay = 0.001
+    return result
+
+
+def test_broadcast_sends_by_priority():
+    async def test(loop):
+        http = FakeHTTP(loop)
+        events = []
+        sched = scheduler(http, events, concurrency=2)
+        low = sched.create(range(1, 6), "low", priority=0, retries=0)
+        high = sched.create(range(11, 16), "high", priority=5, retries=0)
+        await asyncio.gather(low.wait(), high)
+        return http, events, low, high
+
+    http, events, low, high = run(test)
+    assert [payload for _, payload in http.sent[:5]] == ["high"] * 5
+    assert http.max_in_flight == 2
+    assert low.sent == {i: i * 10 for i in range(1, 6)}
+    assert high.done() and high.progress == 1.0
+    assert events.count(("broadcast_progress", low.id)) == 5
+    assert events[-1] == ("broadcast_complete", low.id)
+
+
+def test_broadcast_retries_and_failures():
+    async def test(loop):
+        http = FakeHTTP(
+            loop,
+            fail={
+                1: [OSError(), OSError()],
+                2: [OSError()] * 5,
+                3: NotFound(type("R", (), {"status": 404, "reason": ""})(), ""),
+            },
+        )
+        return await scheduler(http).create([1, 2, 3, 4], "{}", priority=0, retries=2)
+
+    broadcast = run(test)
+    assert set(broadcast.sent) == {1, 4}
+    assert isinstance(broadcast.failed[2], OSError)
+    assert isinstance(broadcast.failed[3], NotFound)
+
+
+def test_broadcast_cancel():
+    async def test(loop):
+        http = FakeHTTP(loop)
+        sched = scheduler(http, concurrency=1)
+        broadcast = sched.create(range(100), "{}", priority=0, retries=0)
+        await asyncio.sleep(0.01)
+        broadcast.cancel()
+        await broadcast
+        return http, broadcast
+
+    http, broadcast = run(test)
+    assert broadcast.cancelled() and broadcast.done()
+    assert broadcast.pending == 0
+    assert 0 < len(broadcast.sent) == len(http.sent) < 100
+
+
+def test_closing_the_scheduler_cancels_everything():
+    async def test(loop):
+        http = FakeHTTP(loop, fail={1: [OSError()]})
+        sched = scheduler(http, concurrency=2)
+        sched.retry_delay = 10
+        broadcast = sched.create(range(1, 50), "{}", priority=0, retries=1)
+        await asyncio.sleep(0.01)
+        assert sched._retries and sched._tasks
+        await sched.close()
+        await asyncio.wait_for(broadcast.wait(), 1)
+        sent = len(http.sent)
+        await asyncio.sleep(0.02)
+        return http, sched, broadcast, sent
+
+    http, sched, broadcast, sent = run(test)
+    assert broadcast.cancelled() and broadcast.done()
+    assert 1 not in broadcast.sent and 1 not in broadcast.failed
+    assert len(http.sent) == sent < 49
+    assert not (sched._tasks or sched._retries or sched._queue or sched._active)
+    assert sched._runner.done()
+
+
+def test_client_broadcast_serializes_once():
+    async def test(loop):
+        client = discord.Client(
+            allowed_mentions=discord.AllowedMentions.none(), broadcast_rate=10000
+        )
+        http = FakeHTTP(loop)
+        client.http.send_serialized_message = http.send_serialized_message
+        channel = discord.Object(id=7)
+        broadcast = client.broadcast(
+            [channel, 8, 7], "hello", embed=discord.Embed(title="news"), silent=True
+        )
+        await broadcast
+        return http, broadcast
+
+    http, broadcast = run(test)
+    assert broadcast.total == 2
+    assert [channel_id for channel_id, _ in http.sent] == [7, 8]
+    assert http.sent[0][1] is http.sent[1][1]
+    payload = json.loads(http.sent[0][1])
+    assert payload["content"] == "hello"
+    assert payload["embeds"][0]["title"] == "news"
+    assert payload["allowed_mentions"]["parse"] == []
+    assert payload["flags"] == 1 << 12
+
+
+def test_client_close_cancels_broadcasts():
+    async def test(loop):
+        client = discord.Client(broadcast_rate=10000)
+        http = FakeHTTP(loop)
+        client.http.send_serialized_message = http.send_serialized_message
+        broadcast = client.broadcast(range(1, 1000), "hello")
+        await asyncio.sleep(0.01)
+        await client.close()
+        return broadcast
+
+    broadcast = run(test)
+    assert broadcast.done() and broadcast.cancelled()
+    assert len(broadcast.sent) < 999
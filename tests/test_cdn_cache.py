@@ -0,0 +1,279 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import io
+import os
+import tempfile
+import types
+
+import pytest
+
+from discord.asset import Asset
+from discord.errors import NotFound
+from discord.http import CDNCache, HTTPClient
+
+
+class FakeContent:
+    def __init__(self, data):
+        self.data = data
+
+    async def iter_chunked(self, size):
+        for i in range(0, len(self.data), size):
+            await asyncio.sleep(0)
+            yield self.data[i : i + size]
+
+
+class FakeResponse:
+    def __init__(self, session, url):
+        self.session = session
+        self.status = 200 if url in session.files else 404
+        self.reason = "Not Found"
+        self.content = FakeContent(session.files.get(url, b""))
+
+    async def __aenter__(self):
+        self.session.active += 1
+        self.session.peak = max(self.session.peak, self.session.active)
+        await asyncio.sleep(0.01)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.session.active -= 1
+
+    async def read(self):
+        return self.content.data
+
+
+class FakeSession:
+    def __init__(self, files):
+        self.files = files
+        self.requests = []
+        self.active = 0
+        self.peak = 0
+
+    def get(self, url):
+        self.requests.append(url)
+        return FakeResponse(self, url)
+
+
+def make_http(files, cache=None, **kwargs):
+    loop = asyncio.get_running_loop()
+    http = HTTPClient(loop=loop, cdn_cache=cache, **kwargs)
+    session = FakeSession(files)
+    http._HTTPClient__session = session  # type: ignore
+    return http, session
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+URL = "https://cdn.discordapp.com/attachments/1/2/file.bin"
+
+
+def test_cache_key_ignores_attachment_signature():
+    first = CDNCache.key(URL + "?ex=1&is=2&hm=abc&size=64")
+    second = CDNCache.key(URL + "?size=64&ex=3&is=4&hm=def")
+    assert first == second
+    assert first != CDNCache.key(URL + "?size=128")
+
+
+def test_downloads_are_served_from_disk(tmp_path):
+    data = os.urandom(200 * 1024)
+
+    async def test():
+        cache = CDNCache(str(tmp_path))
+        http, session = make_http({URL: data}, cache)
+        assert await http.get_from_cdn(URL) == data
+        assert await http.get_from_cdn(URL) == data
+        assert session.requests == [URL]
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.size == len(data)
+
+    run(test())
+
+
+def test_concurrent_downloads_are_coalesced():
+    data = os.urandom(1024)
+
+    async def test():
+        http, session = make_http({URL: data})
+        results = await asyncio.gather(*(http.get_from_cdn(URL) for _ in range(5)))
+        assert results == [data] * 5
+        assert session.requests == [URL]
+        assert not http._cdn_downloads
+
+    run(test())
+
+
+def test_download_pool_is_bounded():
+    files = {f"{URL}{i}": b"x" for i in range(10)}
+
+    async def test():
+        http, session = make_http(files, max_cdn_downloads=3)
+        await asyncio.gather(*(http.get_from_cdn(url) for url in files))
+        assert session.peak == 3
+
+    run(test())
+
+
+def test_least_recently_used_files_are_evicted(tmp_path):
+    files = {f"{URL}{i}": bytes([i]) * 100 for i in range(3)}
+    urls = list(files)
+
+    async def test():
+        cache = CDNCache(str(tmp_path), max_size=250)
+        http, session = make_http(files, cache)
+        await http.get_from_cdn(urls[0])
+        await http.get_from_cdn(urls[1])
+        # touch the first file so the second one is evicted instead
+        await http.get_from_cdn(urls[0])
+        await http.get_from_cdn(urls[2])
+        assert cache.path(urls[1]) is None
+        assert cache.path(urls[0]) is not None
+        assert cache.size == 200
+        assert len(os.listdir(tmp_path)) == 2
+
+    run(test())
+
+    # the index is rebuilt from the directory
+    cache = CDNCache(str(tmp_path), max_size=250)
+    assert len(cache) == 2
+    assert cache.size == 200
+
+
+def test_save_streams_into_file_and_cache(tmp_path):
+    data = os.urandom(300 * 1024)
+
+    async def test():
+        cache = CDNCache(str(tmp_path / "cache"))
+        http, session = make_http({URL: data}, cache)
+        fp = io.BytesIO()
+        assert await http.save_from_cdn(URL, fp) == len(data)
+        assert fp.getvalue() == data
+
+        fp = io.BytesIO()
+        assert await http.save_from_cdn(URL, fp) == len(data)
+        assert fp.getvalue() == data
+        assert session.requests == [URL]
+
+    run(test())
+
+
+def test_failed_downloads_are_not_cached(tmp_path):
+    async def test():
+        cache = CDNCache(str(tmp_path))
+        http, session = make_http({}, cache)
+        with pytest.raises(NotFound):
+            await http.get_from_cdn(URL)
+        with pytest.raises(NotFound):
+            await http.save_from_cdn(URL, io.BytesIO())
+        assert len(session.requests) == 2
+        assert os.listdir(tmp_path) == []
+        assert not http._cdn_downloads
+
+    run(test())
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_failed_saves_leave_the_target_untouched(tmp_path, cached):
+    target = tmp_path / "target.bin"
+    target.write_bytes(b"previous")
+
+    async def test():
+        cache = CDNCache(str(tmp_path / "cache")) if cached else None
+        http, _ = make_http({URL: b"data"}, cache)
+        state = types.SimpleNamespace(http=http)
+        missing = Asset(state, url=URL + "/missing", key="missing")
+        with pytest.raises(NotFound):
+            await missing.save(target)
+        with pytest.raises(NotFound):
+            await missing.save(tmp_path / "new.bin")
+        assert await Asset(state, url=URL, key="file").save(str(target)) == 4
+
+    run(test())
+    assert target.read_bytes() == b"data"
+    assert not (tmp_path / "new.bin").exists()
+
+
+def test_cancelled_caller_does_not_cancel_other_waiters():
+    data = os.urandom(1024)
+
+    async def test():
+        http, session = make_http({URL: data})
+        first = asyncio.ensure_future(http.get_from_cdn(URL))
+        second = asyncio.ensure_future(http.get_from_cdn(URL))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == data
+        assert first.cancelled()
+        assert session.requests == [URL]
+
+    run(test())
+
+
+def test_download_stops_once_every_caller_is_cancelled():
+    async def test():
+        http, session = make_http({URL: b"x"})
+        callers = [asyncio.ensure_future(http.get_from_cdn(URL)) for _ in range(2)]
+        await asyncio.sleep(0)
+        task = next(iter(http._cdn_downloads.values())).task
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert task.cancelled()
+        assert not http._cdn_downloads
+
+    run(test())
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_concurrent_saves_are_coalesced(tmp_path, monkeypatch, cached):
+    # uncached downloads are spooled to a temporary file
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    data = os.urandom(200 * 1024)
+
+    async def test():
+        cache = CDNCache(str(tmp_path)) if cached else None
+        http, session = make_http({URL: data}, cache)
+        files = [io.BytesIO() for _ in range(3)]
+        written = await asyncio.gather(
+            http.save_from_cdn(URL, files[0]),
+            http.get_from_cdn(URL),
+            http.save_from_cdn(URL, files[1]),
+            http.save_from_cdn(URL, files[2]),
+        )
+        assert written == [len(data), data, len(data), len(data)]
+        assert all(f.getvalue() == data for f in files)
+        assert session.requests == [URL]
+        assert not http._cdn_downloads
+        # only the cached file is left, no temporary ones
+        assert len(os.listdir(tmp_path)) == (1 if cached else 0)
+
+    run(test())
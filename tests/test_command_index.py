@@ -0,0 +1,117 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import types
+
+import discord
+from discord.enums import InteractionType
+
+
+def make_bot():
+    bot = discord.Bot()
+
+    @bot.slash_command(guild_ids=[1, 2])
+    async def echo(ctx):
+        pass
+
+    @bot.user_command(name="echo")
+    async def echo_user(ctx, user):
+        pass
+
+    group = bot.create_group("config")
+    sub = group.create_subgroup("roles")
+
+    @sub.command()
+    async def add(ctx):
+        pass
+
+    return bot
+
+
+def autocomplete(bot, **data):
+    dispatched = []
+    bot.dispatch = lambda event, *args: dispatched.append((event, *args))
+    interaction = types.SimpleNamespace(
+        type=InteractionType.auto_complete, data=dict(data, id="0")
+    )
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(
+            bot.process_application_commands(interaction, auto_sync=False)
+        )
+    finally:
+        loop.close()
+    return dispatched
+
+
+def test_index_is_keyed_by_name_type_and_guild():
+    bot = make_bot()
+    index = bot._command_index
+    echo = index.get("echo", 1, 1)
+    assert isinstance(echo, discord.SlashCommand)
+    assert index.get("echo", 1, 2) is echo
+    assert index.get("echo", 1, None) is None
+    assert isinstance(index.get("echo", 2, None), discord.UserCommand)
+
+    add = index.get("config roles add", 1, None)
+    assert add.qualified_name == "config roles add"
+    assert index.get("config roles add", 1, None) is add
+    assert index.get("config missing add", 1, None) is None
+
+    bot.remove_application_command(echo)
+    assert index.get("echo", 1, 1) is None
+
+
+def test_unregistered_interaction_is_resolved_through_index():
+    bot = make_bot()
+    [(event, _, command)] = autocomplete(bot, name="echo", type=1, guild_id="2")
+    assert event == "application_command_auto_complete"
+    assert command.guild_ids == [1, 2]
+
+    [(event, _, command)] = autocomplete(bot, name="echo", type=2)
+    assert isinstance(command, discord.UserCommand)
+
+    [(event, _)] = autocomplete(bot, name="echo", type=1, guild_id="3")
+    assert event == "unknown_application_command"
+
+
+def test_index_follows_guild_ids_changed_in_place():
+    bot = make_bot()
+    echo = bot._command_index.get("echo", 1, 1)
+    echo.guild_ids = [3]
+    [(event, _, command)] = autocomplete(bot, name="echo", type=1, guild_id="3")
+    assert command is echo
+    assert bot._command_index.get("echo", 1, 1) is None
+
+
+def test_get_application_command_uses_registered_commands():
+    bot = make_bot()
+    assert bot.get_application_command("config roles add") is None
+
+    config = bot._command_index.get("config", 1, None)
+    config.id = "10"
+    bot._application_commands[config.id] = config
+    add = bot.get_application_command("config roles add")
+    assert add is not None and add.name == "add"
@@ -0,0 +1,154 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import types
+
+import discord
+from discord import CommandSyncCache
+
+APP_ID = 1234
+
+
+class FakeHTTP:
+    def __init__(self):
+        self.calls = []
+        self.remote = {}
+
+    def _commands(self, guild_id):
+        return self.remote.setdefault(guild_id, [])
+
+    async def get_global_commands(self, app_id):
+        self.calls.append(("get", None))
+        return list(self._commands(None))
+
+    async def get_guild_commands(self, app_id, guild_id):
+        self.calls.append(("get", guild_id))
+        return list(self._commands(guild_id))
+
+    def _bulk(self, guild_id, payload):
+        registered = []
+        for i, data in enumerate(payload):
+            cmd = dict(data, id=str(1000 * (guild_id or 0) + i + 1))
+            cmd.setdefault("type", 1)
+            if guild_id is not None:
+                cmd["guild_id"] = str(guild_id)
+            registered.append(cmd)
+        self.remote[guild_id] = registered
+        return registered
+
+    async def _unused(self, *args, **kwargs):
+        raise NotImplementedError
+
+    upsert_global_command = edit_global_command = delete_global_command = _unused
+    upsert_guild_command = edit_guild_command = delete_guild_command = _unused
+
+    async def bulk_upsert_global_commands(self, app_id, payload):
+        self.calls.append(("bulk", None))
+        return self._bulk(None, payload)
+
+    async def bulk_upsert_guild_commands(self, app_id, guild_id, payload):
+        self.calls.append(("bulk", guild_id))
+        return self._bulk(guild_id, payload)
+
+
+def make_bot(cache):
+    bot = discord.Bot(command_sync_cache=cache)
+    bot.http = FakeHTTP()
+    bot._connection.user = types.SimpleNamespace(id=APP_ID)
+
+    @bot.slash_command()
+    async def ping(ctx):
+        pass
+
+    @bot.slash_command(guild_ids=[1, 2])
+    async def echo(ctx):
+        pass
+
+    return bot
+
+
+def sync(bot, **kwargs):
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(bot.sync_commands(**kwargs))
+    finally:
+        loop.close()
+
+
+def test_fingerprint_is_order_independent():
+    a = {"name": "a", "type": 1, "description": "x"}
+    b = {"type": 1, "name": "b", "description": "y"}
+    assert CommandSyncCache.fingerprint([a, b]) == CommandSyncCache.fingerprint([b, a])
+    assert CommandSyncCache.fingerprint([a]) != CommandSyncCache.fingerprint([b])
+
+
+def test_unchanged_commands_skip_the_api(tmp_path):
+    path = tmp_path / "commands.json"
+    bot = make_bot(path)
+    sync(bot)
+    assert ("bulk", None) in bot.http.calls
+    assert {("get", 1), ("get", 2)} <= set(bot.http.calls)
+    assert path.exists()
+
+    # a restart with the same commands only restores the ids
+    bot = make_bot(path)
+    sync(bot)
+    assert bot.http.calls == []
+    assert sorted(bot._application_commands) == ["1", "1001", "2001"]
+    assert bot.get_application_command("echo", guild_ids=[1, 2]) is not None
+
+
+def test_only_changed_guilds_are_synced(tmp_path):
+    path = tmp_path / "commands.json"
+    sync(make_bot(path))
+
+    bot = make_bot(path)
+
+    @bot.slash_command(guild_ids=[2])
+    async def new(ctx):
+        pass
+
+    sync(bot)
+    assert {call[1] for call in bot.http.calls} == {2}
+
+    bot = make_bot(path)
+    bot.http.calls.clear()
+    sync(bot, force=True)
+    assert ("bulk", 1) in bot.http.calls
+
+
+def test_unreadable_cache_is_ignored(tmp_path):
+    path = tmp_path / "commands.json"
+    path.write_text("{not json")
+    cache = CommandSyncCache(path)
+    assert cache.get(APP_ID, None, "abc") is None
+
+    cache.set(APP_ID, 5, "abc", [{"id": "9", "name": "x", "type": 1}])
+    cache.save()
+    assert CommandSyncCache(path).get(APP_ID, 5, "abc") == [
+        {"id": "9", "name": "x", "type": 1}
+    ]
+    cache.discard(APP_ID, 5)
+    assert cache.get(APP_ID, 5, "abc") is None
@@ -0,0 +1,134 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import os
+
+import aiohttp
+
+from discord.file import File
+
+
+class Writer:
+    def __init__(self):
+        self.chunks = []
+
+    async def write(self, chunk):
+        self.chunks.append(bytes(chunk))
+
+    @property
+    def body(self):
+        return b"".join(self.chunks)
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+async def upload(file, attempt=0):
+    file.reset(seek=attempt)
+    form = aiohttp.FormData(quote_fields=False)
+    form.add_field(
+        name="files[0]",
+        value=file.fp,
+        filename=file.filename,
+        content_type="application/octet-stream",
+    )
+    writer = Writer()
+    multipart = form()
+    await multipart.write(writer)
+    return multipart, writer.body
+
+
+def test_async_iterable_source_is_replayed_on_retry():
+    data = os.urandom(600 * 1024)
+
+    async def source():
+        for i in range(0, len(data), 100 * 1024):
+            await asyncio.sleep(0)
+            yield data[i : i + 100 * 1024]
+
+    async def test():
+        # spool to disk after the first 128KiB
+        file = File(source(), "stream.bin", spool_size=128 * 1024)
+        _, first = await upload(file)
+        _, second = await upload(file, attempt=1)
+        file.close()
+        return first, second
+
+    first, second = run(test())
+    assert data in first
+    assert data in second
+
+
+def test_non_seekable_file_is_streamed(tmp_path):
+    data = os.urandom(300 * 1024)
+    read_fd, write_fd = os.pipe()
+
+    def write():
+        with os.fdopen(write_fd, "wb") as fp:
+            fp.write(data)
+
+    async def test():
+        file = File(os.fdopen(read_fd, "rb"), "pipe.bin")
+        writing = asyncio.get_running_loop().run_in_executor(None, write)
+        _, body = await upload(file)
+        await writing
+        file.close()
+        return body
+
+    assert data in run(test())
+
+
+def test_mmap_upload(tmp_path):
+    data = os.urandom(700 * 1024)
+    path = tmp_path / "mapped.bin"
+    path.write_bytes(data)
+
+    async def test():
+        file = File(str(path), mmap=True)
+        multipart, body = await upload(file)
+        _, retried = await upload(file, attempt=1)
+        file.close()
+        return file, multipart, body, retried
+
+    file, multipart, body, retried = run(test())
+    assert file.filename == "mapped.bin"
+    assert data in body and data in retried
+    # the size is known up front, so no chunked encoding is needed
+    assert multipart.size == len(body)
+    assert file.fp._map.closed
+
+
+def test_mmap_empty_file(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    file = File(str(path), mmap=True)
+    assert file.fp.read() == b""
+    file.close()
+    assert file.fp.closed
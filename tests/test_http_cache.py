@@ -0,0 +1,177 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+
+from discord.errors import DiscordException
+from discord.http import HTTPClient, ResponseCache, Route
+
+
+class FakeHTTPClient(HTTPClient):
+    def __init__(self, **kwargs):
+        self.loop = None
+        self.response_cache = ResponseCache(**kwargs)
+        self.sent = []
+
+    async def _request(self, route, **kwargs):
+        self.sent.append((route.method, route.url))
+        await asyncio.sleep(0.01)
+        if route.path.endswith("missing"):
+            raise DiscordException("not found")
+        return {"url": route.url, "roles": [1, 2]}
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def roles(guild_id):
+    return Route("GET", "/guilds/{guild_id}/roles", guild_id=guild_id)
+
+
+def test_concurrent_gets_are_coalesced():
+    http = FakeHTTPClient()
+
+    async def main():
+        return await asyncio.gather(*(http.request(roles(1)) for _ in range(5)))
+
+    results = run(main())
+    assert len(http.sent) == 1
+    assert http.response_cache.coalesced == 4
+    assert all(r == results[0] for r in results)
+    # every caller may modify its own payload
+    assert len({id(r) for r in results}) == 5
+
+
+def test_errors_are_shared():
+    http = FakeHTTPClient()
+    route = Route("GET", "/missing")
+
+    async def main():
+        return await asyncio.gather(
+            http.request(route), http.request(route), return_exceptions=True
+        )
+
+    assert all(isinstance(r, DiscordException) for r in run(main()))
+    assert len(http.sent) == 1
+
+
+def test_cached_routes_and_invalidation():
+    http = FakeHTTPClient(routes={"/guilds/{guild_id}/roles": 60})
+    cache = http.response_cache
+
+    async def main():
+        first = await http.request(roles(1))
+        first["roles"].append(3)
+        second = await http.request(roles(1))
+        assert second["roles"] == [1, 2]
+        await http.request(roles(2))
+
+        # editing a role drops the cached role list of that guild only
+        await http.request(
+            Route("PATCH", "/guilds/{guild_id}/roles/{role_id}", guild_id=1, role_id=5)
+        )
+        await http.request(roles(1))
+        await http.request(roles(2))
+
+    run(main())
+    assert [url.rsplit("/", 2)[-2] for _, url in http.sent if _ == "GET"] == [
+        "1",
+        "2",
+        "1",
+    ]
+    assert (cache.hits, cache.misses) == (2, 3)
+    assert cache.hit_rate == 0.4
+
+
+def test_lru_bound_and_disable():
+    http = FakeHTTPClient(routes={"/guilds/{guild_id}/roles": 60}, maxsize=2)
+
+    async def main():
+        for guild_id in (1, 2, 3):
+            await http.request(roles(guild_id))
+        assert len(http.response_cache) == 2
+        await http.request(roles(1))
+        http.response_cache.disable("/guilds/{guild_id}/roles")
+        assert len(http.response_cache) == 0
+
+    run(main())
+    assert len(http.sent) == 4
+
+
+def test_coalescing_can_be_disabled():
+    http = FakeHTTPClient(coalesce=False)
+
+    async def main():
+        await asyncio.gather(http.request(roles(1)), http.request(roles(1)))
+
+    run(main())
+    assert len(http.sent) == 2
+
+
+def test_writes_during_a_get_keep_its_response_out_of_the_cache():
+    http = FakeHTTPClient(routes={"/guilds/{guild_id}/roles": 60})
+    cache = http.response_cache
+    edit = Route("PATCH", "/guilds/{guild_id}/roles/{role_id}", guild_id=1, role_id=5)
+
+    async def main():
+        before = asyncio.ensure_future(http.request(roles(1)))
+        await asyncio.sleep(0)
+        await http.request(edit)
+        # the GET in flight started before the edit and is not joined either
+        await http.request(roles(1))
+        await before
+        assert len(cache) == 1
+        await http.request(roles(1))
+
+    run(main())
+    assert sorted(method for method, _ in http.sent) == ["GET", "GET", "PATCH"]
+    assert cache.coalesced == 0 and cache.hits == 1
+    assert not cache._invalidated
+
+
+def test_invalidation_only_touches_related_entries():
+    http = FakeHTTPClient(
+        routes={"/guilds/{guild_id}": 60, "/guilds/{guild_id}/roles": 60}
+    )
+    cache = http.response_cache
+
+    async def main():
+        for guild_id in (1, 2):
+            await http.request(Route("GET", "/guilds/{guild_id}", guild_id=guild_id))
+            await http.request(roles(guild_id))
+        assert len(cache) == 4
+
+        # a child drops its parents, a parent drops its children
+        cache.invalidate(roles(1).url + "/5")
+        assert len(cache) == 2
+        cache.invalidate(Route("GET", "/guilds/{guild_id}", guild_id=2).url)
+        assert len(cache) == 0
+        assert not cache._index
+
+    run(main())
@@ -0,0 +1,127 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+
+import pytest
+
+from discord.errors import NoMoreItems
+from discord.iterators import _AsyncIterator
+
+
+class Source(_AsyncIterator[int]):
+    def __init__(self, count):
+        self.items = iter(range(count))
+        self.pulled = 0
+
+    async def next(self):
+        try:
+            item = next(self.items)
+        except StopIteration:
+            raise NoMoreItems() from None
+        self.pulled += 1
+        return item
+
+
+class Tracker:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, item):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # later items finish first
+        await asyncio.sleep(0.001 * (10 - item % 10))
+        self.in_flight -= 1
+        return item * 2
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_map_concurrent_keeps_order_and_limit():
+    tracker = Tracker()
+    results = run(Source(50).map_concurrent(tracker, limit=5).flatten())
+    assert results == [i * 2 for i in range(50)]
+    assert tracker.max_in_flight == 5
+
+
+def test_map_concurrent_unordered():
+    tracker = Tracker()
+    results = run(Source(10).map_concurrent(tracker, limit=10, ordered=False).flatten())
+    assert sorted(results) == [i * 2 for i in range(10)]
+    assert results != sorted(results)
+
+
+def test_map_concurrent_backpressure():
+    async def test():
+        source = Source(100)
+        iterator = source.map_concurrent(lambda item: item, limit=4)
+        first = await iterator.next()
+        return first, source.pulled
+
+    assert run(test()) == (0, 4)
+
+
+def test_map_concurrent_propagates_errors():
+    async def func(item):
+        if item == 3:
+            raise RuntimeError(item)
+        await asyncio.sleep(0.01)
+        return item
+
+    async def test():
+        iterator = Source(20).map_concurrent(func, limit=5)
+        results = []
+        with pytest.raises(RuntimeError):
+            async for result in iterator:
+                results.append(result)
+        return results, iterator._pending
+
+    results, pending = run(test())
+    assert results == [0, 1, 2]
+    assert not pending
+
+
+def test_filter_concurrent_and_map_batches():
+    async def is_even(item):
+        await asyncio.sleep(0)
+        return item % 2 == 0
+
+    assert run(Source(10).filter_concurrent(is_even, limit=3).flatten()) == [
+        0,
+        2,
+        4,
+        6,
+        8,
+    ]
+    assert run(Source(10).map_batches(sum, 4, limit=2).flatten()) == [6, 22, 17]
+    with pytest.raises(ValueError):
+        Source(1).map_concurrent(sum, limit=0)
@@ -0,0 +1,194 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import types
+
+from discord.iterators import HistoryIterator, HistoryScanIterator, MemberIterator
+from discord.object import Object
+
+
+class FakeHTTP:
+    def __init__(self, count, remaining=None):
+        self.ids = list(range(1, count + 1))
+        self.remaining = remaining
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def remaining_requests(self, route):
+        return self.remaining
+
+    async def logs_from(self, channel_id, limit, before=None, after=None, around=None):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        if after is not None:
+            page = [i for i in self.ids if i > after][:limit]
+        else:
+            page = [i for i in self.ids if before is None or i < before][-limit:]
+        return [{"id": str(i)} for i in reversed(page)]
+
+    async def get_members(self, guild_id, limit, after):
+        self.calls += 1
+        page = [i for i in self.ids if i > (after or 0)][:limit]
+        return [{"user": {"id": str(i)}} for i in page]
+
+
+class FakeChannel:
+    id = 1
+
+    def __init__(self, http):
+        self._state = types.SimpleNamespace(
+            http=http, create_message=lambda channel, data: int(data["id"])
+        )
+
+    async def _get_channel(self):
+        return self
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_history_prefetches_next_page():
+    async def test():
+        http = FakeHTTP(350)
+        iterator = HistoryIterator(FakeChannel(http), limit=None, prefetch=2)
+        first = await iterator.next()
+        await asyncio.sleep(0.05)
+        calls = http.calls
+        rest = await iterator.flatten()
+        return first, calls, rest, http
+
+    first, calls, rest, http = run(test())
+    assert first == 350
+    # the first page plus two pages ahead, the last one is a partial page
+    assert calls == 3
+    assert [first, *rest] == list(range(350, 0, -1))
+    assert http.calls == 4
+
+
+def test_history_prefetch_respects_bucket_quota():
+    async def test():
+        http = FakeHTTP(350, remaining=1)
+        iterator = HistoryIterator(FakeChannel(http), limit=None, prefetch=2)
+        await iterator.next()
+        await asyncio.sleep(0.05)
+        calls = http.calls
+        return calls, len(await iterator.flatten())
+
+    assert run(test()) == (1, 349)
+
+
+def test_history_stops_paginating_past_the_range():
+    async def test():
+        http = FakeHTTP(1000)
+        channel = FakeChannel(http)
+        messages = await HistoryIterator(
+            channel, limit=None, after=Object(id=0), before=Object(id=150)
+        ).flatten()
+        return messages, http.calls
+
+    messages, calls = run(test())
+    assert messages == list(range(1, 150))
+    assert calls == 2
+
+
+def test_scan_history_schedules_every_window_up_front():
+    async def test(oldest_first):
+        http = FakeHTTP(1000)
+        messages = await HistoryScanIterator(
+            FakeChannel(http),
+            after=Object(id=0),
+            before=Object(id=1001),
+            windows=4,
+            oldest_first=oldest_first,
+        ).flatten()
+        return messages, http.max_in_flight
+
+    messages, in_flight = run(test(True))
+    assert messages == list(range(1, 1001))
+    # the fake client has no bucket lock; the real one sends these one at a time
+    assert in_flight == 4
+
+    messages, _ = run(test(False))
+    assert messages == list(range(1000, 0, -1))
+
+
+def test_leaving_the_loop_early_stops_prefetching():
+    async def test():
+        http = FakeHTTP(1000)
+        history = HistoryIterator(FakeChannel(http), limit=None, prefetch=3)
+        scan = HistoryScanIterator(
+            FakeChannel(http), after=Object(id=0), before=Object(id=1001), prefetch=2
+        )
+        for iterator in (history, scan):
+            async for _ in iterator:
+                break
+        # the event loop closes the abandoned loops in the background
+        await asyncio.sleep(0.01)
+        calls = http.calls
+        await asyncio.sleep(0.05)
+        prefetchers = [history._prefetcher]
+        prefetchers += [window._prefetcher for window in scan.windows]
+        return calls, http.calls, prefetchers
+
+    calls, later_calls, prefetchers = run(test())
+    assert calls == later_calls
+    assert all(p.done and p.task is None for p in prefetchers)
+
+
+def test_aclose_stops_prefetching_through_wrappers():
+    async def test():
+        http = FakeHTTP(1000)
+        iterator = HistoryIterator(FakeChannel(http), limit=None, prefetch=3)
+        mapped = iterator.map(str)
+        assert await mapped.next() == "1000"
+        await mapped.aclose()
+        await asyncio.sleep(0.05)
+        return http.calls, iterator._prefetcher
+
+    calls, prefetcher = run(test())
+    assert calls <= 2
+    assert prefetcher.done and prefetcher.task is None
+
+
+def test_member_iterator_respects_limit():
+    async def test():
+        http = FakeHTTP(3000)
+        guild = types.SimpleNamespace(id=1, _state=types.SimpleNamespace(http=http))
+        iterator = MemberIterator(guild, limit=1500, prefetch=1)
+        iterator.create_member = lambda data: int(data["user"]["id"])
+        return await iterator.flatten(), http.calls
+
+    members, calls = run(test())
+    assert len(members) == 1500
+    assert calls == 2
@@ -0,0 +1,133 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import zlib
+
+import aiohttp
+import pytest
+
+from discord import utils
+from discord.errors import InvalidArgument
+from discord.gateway import DiscordWebSocket
+from discord.http import parse_response
+
+BACKENDS = [
+    name
+    for name, available in (
+        ("json", True),
+        ("orjson", utils.HAS_ORJSON),
+        ("msgspec", utils.HAS_MSGSPEC),
+    )
+    if available
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    previous = utils._json_backend
+    utils.set_json_backend(request.param)
+    yield request.param
+    utils.set_json_backend(previous)
+
+
+class FakeSocket:
+    def __init__(self):
+        self.frames = []
+
+    async def send_frame(self, data, opcode):
+        self.frames.append((data, opcode))
+
+
+class FakeResponse:
+    def __init__(self, body, content_type):
+        self.body = body
+        self.headers = {"content-type": content_type}
+
+    async def read(self):
+        return self.body
+
+    async def text(self, encoding):
+        return self.body.decode(encoding)
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_backends_round_trip_bytes(backend):
+    payload = {"content": "héllo \U0001f600", "id": 2**63 - 1, "embeds": [None]}
+    encoded = utils._to_json_bytes(payload)
+    assert isinstance(encoded, bytes)
+    assert utils._from_json(encoded) == payload
+    assert utils._from_json(encoded.decode()) == payload
+    assert utils._to_json(payload) == encoded.decode()
+    # int keys are written as strings, like the json module does
+    assert utils._from_json(utils._to_json_bytes({1: 2})) == {"1": 2}
+
+
+def test_unknown_or_missing_backend():
+    with pytest.raises(InvalidArgument):
+        utils.set_json_backend("simplejson")
+    for name in ("orjson", "msgspec"):
+        if name not in BACKENDS:
+            with pytest.raises(InvalidArgument):
+                utils.set_json_backend(name)
+    assert utils._json_backend in BACKENDS
+
+
+def test_responses_are_decoded_from_bytes(backend):
+    async def test():
+        data = await parse_response(FakeResponse(b'{"id":"1"}', "application/json"))
+        assert data == {"id": "1"}
+        assert await parse_response(FakeResponse(b"oops", "text/plain")) == "oops"
+
+    run(test())
+
+
+def test_gateway_sends_and_receives_bytes(backend):
+    async def test():
+        socket = FakeSocket()
+        ws = DiscordWebSocket(socket, loop=asyncio.get_running_loop())
+        await ws.send_as_json({"op": 1, "d": 5})
+        data, opcode = socket.frames[0]
+        assert opcode is aiohttp.WSMsgType.TEXT
+        assert utils._from_json(data) == {"op": 1, "d": 5}
+
+        received = []
+        ws._dispatch = lambda event, *args: received.append((event, *args))
+        ws.log_receive = ws.debug_log_receive
+        ws.shard_id = None
+        compressor = zlib.compressobj()
+        message = compressor.compress(b'{"op":11,"s":42,"d":null}')
+        message += compressor.flush(zlib.Z_SYNC_FLUSH)
+        await ws.received_message(message)
+        assert ws.sequence == 42
+        assert received == [("socket_raw_receive", '{"op":11,"s":42,"d":null}')]
+
+    run(test())
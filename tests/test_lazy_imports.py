@@ -0,0 +1,59 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import subprocess
+import sys
+
+import discord
+
+
+def run_python(code):
+    # a fresh interpreter, the test session may have imported anything already
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.split()
+
+
+def test_voice_stack_and_emojis_are_loaded_lazily():
+    loaded = run_python(
+        "import sys, discord\n"
+        "for name in ('discord.player', 'discord.opus', 'discord.sinks', "
+        "'discord.voice', 'numpy'):\n"
+        "    print(name in sys.modules)\n"
+        "print('EMOJIS_MAP' in vars(discord.utils))\n"
+    )
+    assert loaded == ["False"] * 6
+
+
+def test_lazy_attributes_resolve():
+    from discord.player import FFmpegPCMAudio
+    from discord.team import Team
+
+    assert discord.FFmpegPCMAudio is FFmpegPCMAudio
+    assert discord.Team is Team
+    assert discord.sinks.Sink is discord.sinks.core.Sink
+    assert "AudioQueue" in dir(discord)
+    assert {"AudioQueue", "Client", "sinks"} <= set(discord.__all__)
+    assert discord.utils.EMOJIS_MAP["thumbsup"] in discord.utils.UNICODE_EMOJIS
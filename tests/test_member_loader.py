@@ -0,0 +1,151 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import types
+
+from discord import utils
+from discord.state import MemberLoader
+
+
+class FakeState:
+    def __init__(self, loop, missing=()):
+        self.loop = loop
+        self.missing = set(missing)
+        self.queries = []
+
+    async def query_members(self, guild, query, limit, user_ids, cache, presences):
+        assert query is None and limit == len(user_ids) <= 100
+        self.queries.append((guild.id, list(user_ids)))
+        await asyncio.sleep(getattr(guild, "latency", 0))
+        if guild.id == 0:
+            raise asyncio.TimeoutError
+        return [
+            types.SimpleNamespace(id=user_id)
+            for user_id in user_ids
+            if user_id not in self.missing
+        ]
+
+
+def run(test):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(test(loop))
+    finally:
+        loop.close()
+
+
+def guild(guild_id):
+    return types.SimpleNamespace(id=guild_id)
+
+
+def test_concurrent_lookups_are_batched_per_guild():
+    async def test(loop):
+        state = FakeState(loop, missing={7})
+        loader = MemberLoader(state)
+        lookups = [loader.load(guild(1), i, cache=True) for i in range(250)]
+        lookups += [loader.load(guild(2), i, cache=True) for i in range(3)]
+        # the same id is only requested once per batch
+        lookups.append(loader.load(guild(1), 203, cache=True))
+        results = await asyncio.gather(*lookups)
+        return state, loader, results
+
+    state, loader, results = run(test)
+    assert sorted(len(ids) for _, ids in state.queries) == [3, 50, 100, 100]
+    assert loader.requests == 4
+    assert results[7] is None
+    assert results[203].id == 203 and results[-1] is results[203]
+
+
+def test_lookups_in_later_windows_are_separate():
+    async def test(loop):
+        state = FakeState(loop)
+        loader = MemberLoader(state, delay=0)
+        await loader.load(guild(1), 1, cache=True)
+        await loader.load(guild(1), 2, cache=True)
+        return state
+
+    assert run(test).queries == [(1, [1]), (1, [2])]
+
+
+def test_errors_reach_every_waiter():
+    async def test(loop):
+        loader = MemberLoader(FakeState(loop))
+        return await asyncio.gather(
+            loader.load(guild(0), 1, cache=True),
+            loader.load(guild(0), 2, cache=True),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(r, asyncio.TimeoutError) for r in run(test))
+
+
+def test_timed_out_lookups_leave_the_batch_running():
+    async def test(loop):
+        loader = MemberLoader(FakeState(loop))
+        slow = types.SimpleNamespace(id=1, latency=0.2)
+        return await asyncio.gather(
+            loader.load(slow, 1, cache=True, timeout=0.05),
+            loader.load(slow, 2, cache=True),
+            return_exceptions=True,
+        )
+
+    impatient, patient = run(test)
+    assert isinstance(impatient, asyncio.TimeoutError)
+    assert patient.id == 2
+
+
+def test_get_or_fetch_falls_back_to_http_quickly(monkeypatch):
+    monkeypatch.setattr(utils, "_MEMBER_LOOKUP_TIMEOUT", 0.05)
+
+    async def test(loop):
+        state = FakeState(loop)
+        loader = MemberLoader(state)
+        ws = types.SimpleNamespace(is_ratelimited=lambda: False)
+        state._get_websocket = lambda guild_id: ws
+        state._intents = types.SimpleNamespace(members=True)
+        state.member_cache_flags = types.SimpleNamespace(joined=True)
+
+        async def fetch_member(member_id):
+            return ("http", member_id)
+
+        slow = types.SimpleNamespace(
+            id=1,
+            latency=0.5,
+            _state=state,
+            load_member=lambda user_id, *, cache, timeout: loader.load(
+                slow, user_id, cache=cache, timeout=timeout
+            ),
+            fetch_member=fetch_member,
+        )
+        start = loop.time()
+        member = await utils._fetch_member(slow, 5)
+        elapsed = loop.time() - start
+        # let the abandoned chunk request finish before the loop closes
+        await asyncio.gather(*asyncio.all_tasks() - {asyncio.current_task()})
+        return member, elapsed
+
+    member, elapsed = run(test)
+    assert member == ("http", 5)
+    assert elapsed < 0.4
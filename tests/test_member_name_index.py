@@ -0,0 +1,150 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import types
+
+import discord
+from discord.guild import Guild
+from discord.member import Member
+from discord.state import ConnectionState
+
+
+def make_state():
+    state = types.SimpleNamespace(
+        member_cache_flags=discord.MemberCacheFlags.all(),
+        self_id=99,
+        shard_count=1,
+        _users={},
+        _guilds={},
+        dispatched=[],
+    )
+
+    def store_user(data):
+        user_id = int(data["id"])
+        if user_id not in state._users:
+            state._users[user_id] = discord.User(state=state, data=data)
+        return state._users[user_id]
+
+    state.store_user = store_user
+    state._get_guild = state._guilds.get
+    state.dispatch = lambda *args: state.dispatched.append(args)
+    state._update_member_names = lambda user_id: (
+        ConnectionState._update_member_names(state, user_id)
+    )
+    return state
+
+
+def user_data(user_id, username, global_name=None, discriminator="0"):
+    return {
+        "id": str(user_id),
+        "username": username,
+        "discriminator": discriminator,
+        "avatar": None,
+        "global_name": global_name,
+    }
+
+
+def add_member(guild, user_id, username, global_name=None, nick=None):
+    data = {
+        "user": user_data(user_id, username, global_name),
+        "roles": [],
+        "nick": nick,
+        "joined_at": None,
+    }
+    member = Member(data=data, guild=guild, state=guild._state)
+    guild._add_member(member)
+    return member
+
+
+def make_guild(state, guild_id=1):
+    guild = Guild(data={"id": str(guild_id), "name": "guild"}, state=state)
+    state._guilds[guild.id] = guild
+    return guild
+
+
+def test_exact_lookup_is_case_sensitive():
+    guild = make_guild(make_state())
+    alice = add_member(guild, 1, "alice", "Alice", nick="Ally")
+    add_member(guild, 2, "ALICE")
+
+    assert guild.get_member_named("alice") is alice
+    assert guild.get_member_named("Alice") is alice
+    assert guild.get_member_named("Ally") is alice
+    assert guild.get_member_named("ally") is None
+    assert guild.get_member_named("ALICE").id == 2
+
+    carl = Member(
+        data={"user": user_data(3, "carl", discriminator="1234"), "roles": []},
+        guild=guild,
+        state=guild._state,
+    )
+    guild._add_member(carl)
+    assert guild.get_member_named("carl#1234") is carl
+    assert guild.get_member_named("carl#4321") is None
+    assert {m.id for m in guild.get_members_named("alice")} == {1, 2}
+
+
+def test_prefix_lookup():
+    guild = make_guild(make_state())
+    for i, name in enumerate(["bob", "bobby", "Boris", "carol"]):
+        add_member(guild, i, name)
+
+    assert [m.name for m in guild.get_members_named("bo", prefix=True)] == [
+        "bob",
+        "bobby",
+        "Boris",
+    ]
+    assert len(guild.get_members_named("bo", prefix=True, limit=2)) == 2
+
+    # the sorted names are kept up to date once built
+    add_member(guild, 10, "bonnie")
+    guild._remove_member(guild.get_member(0))
+    assert [m.name for m in guild.get_members_named("bo", prefix=True)] == [
+        "bobby",
+        "bonnie",
+        "Boris",
+    ]
+
+
+def test_member_and_user_updates_are_indexed():
+    state = make_state()
+    first, second = make_guild(state, 1), make_guild(state, 2)
+    add_member(first, 5, "dave", nick="D")
+    add_member(second, 5, "dave")
+
+    ConnectionState.parse_guild_member_update(
+        state,
+        {
+            "guild_id": "1",
+            "user": user_data(5, "david"),
+            "roles": [],
+            "nick": "Davy",
+        },
+    )
+    assert first.get_member_named("Davy").id == 5
+    assert first.get_member_named("D") is None
+    # the username is shared with the other guild
+    assert second.get_member_named("david").id == 5
+    assert second.get_member_named("dave") is None
+    assert first.get_members_named("dave", prefix=True) == []
@@ -0,0 +1,156 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import datetime
+import types
+
+import pytest
+
+from discord import PurgeProgress, utils
+from discord.abc import _purge_messages_helper
+from discord.iterators import HistoryIterator
+
+
+class FakeMessage:
+    def __init__(self, channel, id):
+        self.channel = channel
+        self.id = id
+
+    async def delete(self, *, reason=None):
+        await self.channel.delete_messages([self], reason=reason)
+
+
+class FakeChannel:
+    id = 1
+
+    def __init__(self, ids, fail_on=None):
+        self.ids = sorted(ids)
+        self.fail_on = fail_on
+        self.requests = []
+        self.deletes_in_flight = 0
+        self.max_deletes_in_flight = 0
+        self.fetched_while_deleting = False
+        self._state = types.SimpleNamespace(
+            http=self,
+            create_message=lambda channel, data: FakeMessage(self, int(data["id"])),
+        )
+
+    def remaining_requests(self, route):
+        return None
+
+    async def _get_channel(self):
+        return self
+
+    def history(self, **kwargs):
+        return HistoryIterator(self, **kwargs)
+
+    async def logs_from(self, channel_id, limit, before=None, after=None, around=None):
+        if self.deletes_in_flight:
+            self.fetched_while_deleting = True
+        await asyncio.sleep(0.001)
+        if after is not None:
+            page = [i for i in self.ids if i > after][:limit]
+        else:
+            page = [i for i in self.ids if before is None or i < before][-limit:]
+        return [{"id": str(i)} for i in reversed(page)]
+
+    async def delete_messages(self, messages, *, reason=None):
+        ids = [m.id for m in messages]
+        if self.fail_on is not None and self.fail_on in ids:
+            self.fail_on = None
+            raise RuntimeError("delete failed")
+        self.deletes_in_flight += 1
+        self.max_deletes_in_flight = max(
+            self.max_deletes_in_flight, self.deletes_in_flight
+        )
+        await asyncio.sleep(0.005)
+        self.deletes_in_flight -= 1
+        self.requests.append(ids)
+        self.ids = [i for i in self.ids if i not in ids]
+
+
+def snowflake(days_ago, offset):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return utils.time_snowflake(now - datetime.timedelta(days=days_ago)) + offset
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_purge_pipelines_bulk_deletes():
+    ids = [snowflake(1, i) for i in range(250)]
+    channel = FakeChannel(ids)
+    updates = []
+
+    deleted = run(
+        _purge_messages_helper(
+            channel, limit=None, progress=lambda p: updates.append(p.deleted)
+        )
+    )
+
+    assert [m.id for m in deleted] == ids[::-1]
+    assert sorted(len(r) for r in channel.requests) == [50, 100, 100]
+    assert channel.fetched_while_deleting
+    assert updates == [100, 200, 250]
+    assert not channel.ids
+
+
+def test_purge_deletes_old_messages_concurrently():
+    ids = [snowflake(20, i) for i in range(10)] + [snowflake(1, i) for i in range(5)]
+    channel = FakeChannel(ids)
+    progress = PurgeProgress()
+
+    async def test():
+        return await _purge_messages_helper(
+            channel, limit=None, concurrency=3, resume=progress
+        )
+
+    run(test())
+    assert [len(r) for r in channel.requests].count(1) == 10
+    assert channel.max_deletes_in_flight == 3
+    assert progress.bulk_requests == 1 and progress.single_requests == 10
+    assert progress.deleted == 15 and progress.checkpoint == ids[0]
+
+
+def test_purge_resumes_from_checkpoint():
+    ids = [snowflake(1, i) for i in range(300)]
+    channel = FakeChannel(ids, fail_on=ids[150])
+    progress = PurgeProgress()
+
+    with pytest.raises(RuntimeError):
+        run(_purge_messages_helper(channel, limit=None, resume=progress))
+
+    # only the first batch finished before the failure
+    assert progress.checkpoint == ids[200]
+    assert set(ids[100:200]) <= set(channel.ids)
+
+    deleted = run(_purge_messages_helper(channel, limit=None, resume=progress))
+    assert not channel.ids
+    assert progress.deleted == 300
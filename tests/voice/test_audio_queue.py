@@ -0,0 +1,134 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import time
+
+import pytest
+
+from discord import ClientException
+from discord.player import AudioQueue, AudioSource
+
+
+class CountingSource(AudioSource):
+    def __init__(self, name: str, frames: int = 3, opus: bool = False) -> None:
+        self.name = name
+        self.frames = frames
+        self.opus = opus
+        self.cleaned_up = False
+
+    def read(self) -> bytes:
+        if not self.frames:
+            return b""
+        self.frames -= 1
+        return self.name.encode()
+
+    def is_opus(self) -> bool:
+        return self.opus
+
+    def cleanup(self) -> None:
+        self.cleaned_up = True
+
+
+def _wait_preloaded(queue: AudioQueue) -> None:
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        entries = queue.entries
+        if entries and entries[0]._ready.is_set():
+            return
+        time.sleep(0.01)
+    raise AssertionError("next entry was not preloaded")
+
+
+def test_plays_back_to_back():
+    queue = AudioQueue(preload=2)
+    first, second = CountingSource("a"), CountingSource("b", opus=True)
+    finished = []
+    queue.add(first, after=lambda exc: finished.append(("a", exc)))
+    queue.add(lambda: second, after=lambda exc: finished.append(("b", exc)))
+
+    assert queue.read() == b"a"
+    assert not queue.is_opus()
+    _wait_preloaded(queue)
+    assert queue.depth == 1
+    assert queue.entries[0].preload_latency is not None
+
+    frames = [queue.read(), queue.read(), queue.read()]
+    # the switch happens within a single read, there is no empty frame
+    assert frames == [b"a", b"a", b"b"]
+    assert queue.is_opus()
+    assert first.cleaned_up
+    assert finished == [("a", None)]
+    assert queue.preload_misses == 0
+
+    assert queue.read() == b"b"
+    assert queue.read() == b"b"
+    assert queue.read() == b""
+    assert finished == [("a", None), ("b", None)]
+
+    with pytest.raises(ClientException):
+        queue.add(CountingSource("c"))
+
+
+def test_skip_and_remove():
+    queue = AudioQueue()
+    queue.add(CountingSource("a"))
+    removed = queue.add(CountingSource("b"))
+    queue.add(CountingSource("c"))
+
+    assert queue.read() == b"a"
+    queue.remove(removed)
+    queue.skip()
+    assert queue.read() == b"c"
+    assert queue.depth == 0
+    queue.cleanup()
+
+
+def test_failing_factory_is_reported():
+    def factory():
+        raise RuntimeError("boom")
+
+    errors = []
+    queue = AudioQueue()
+    queue.add(factory, after=errors.append)
+    queue.add(CountingSource("b", frames=1))
+
+    assert queue.read() == b"b"
+    assert len(errors) == 1 and isinstance(errors[0], RuntimeError)
+
+
+def test_cleanup_finishes_pending_entries():
+    queue = AudioQueue()
+    sources = [CountingSource(str(i)) for i in range(3)]
+    finished = []
+    for source in sources:
+        queue.add(source, after=finished.append)
+
+    queue.read()
+    queue.cleanup()
+    # an entry that was being preloaded is finished by the preloader
+    deadline = time.monotonic() + 5
+    while len(finished) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert finished == [None, None, None]
+    assert all(source.cleaned_up for source in sources)
@@ -0,0 +1,142 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import io
+import queue
+import sys
+import threading
+import time
+
+import pytest
+
+from discord.player import FFmpegPCMAudio, FFmpegProcessPool
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="uses a shell script as fake ffmpeg"
+)
+
+FRAME_SIZE = 3840
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path):
+    # ignores the ffmpeg arguments, waits for stdin to be closed and writes 10
+    # frames of silence
+    path = tmp_path / "ffmpeg"
+    path.write_text(
+        f"#!/bin/sh\ncat > /dev/null\nhead -c {FRAME_SIZE * 10} /dev/zero\n"
+    )
+    path.chmod(0o755)
+    return str(path)
+
+
+def _read_all(source) -> list[bytes]:
+    frames = []
+    while frame := source.read():
+        frames.append(frame)
+    return frames
+
+
+def test_read_ahead_buffers_frames(fake_ffmpeg):
+    source = FFmpegPCMAudio("input", executable=fake_ffmpeg, read_ahead=4)
+    deadline = time.monotonic() + 5
+    while source.buffered_frames < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert source.buffered_frames == 4
+    assert len(_read_all(source)) == 10
+    assert source.read() == b""
+    assert source.time_to_first_frame is not None
+    source.cleanup()
+
+
+def test_without_read_ahead_reads_directly(fake_ffmpeg):
+    source = FFmpegPCMAudio("input", executable=fake_ffmpeg)
+    assert source.buffered_frames == 0
+    assert len(_read_all(source)) == 10
+    assert source.time_to_first_frame is not None
+    source.cleanup()
+
+
+def test_process_pool_hands_out_prespawned_processes(fake_ffmpeg):
+    pool = FFmpegProcessPool(size=1)
+    try:
+        first = FFmpegPCMAudio(
+            io.BytesIO(b"input"), executable=fake_ffmpeg, pipe=True, pool=pool
+        )
+        assert (pool.hits, pool.misses) == (0, 1)
+
+        deadline = time.monotonic() + 5
+        while pool.idle_count < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pool.idle_count == 1
+
+        second = FFmpegPCMAudio(
+            io.BytesIO(b"input"), executable=fake_ffmpeg, pipe=True, pool=pool
+        )
+        assert (pool.hits, pool.misses) == (1, 1)
+        assert len(_read_all(second)) == 10
+
+        first.cleanup()
+        second.cleanup()
+    finally:
+        pool.close()
+    assert pool.idle_count == 0
+
+
+def test_read_returns_once_read_ahead_is_stopped(tmp_path):
+    # never writes anything, so the reader waits for the first frame
+    path = tmp_path / "ffmpeg"
+    path.write_text("#!/bin/sh\nsleep 30\n")
+    path.chmod(0o755)
+    source = FFmpegPCMAudio("input", executable=str(path), read_ahead=4)
+
+    result = []
+    reader = threading.Thread(target=lambda: result.append(source.read()))
+    reader.start()
+    time.sleep(0.2)
+    source.cleanup()
+    reader.join(timeout=5)
+    assert not reader.is_alive()
+    assert result == [b""]
+
+
+def test_end_of_stream_survives_a_refilled_queue(fake_ffmpeg):
+    class RefilledQueue(queue.Queue):
+        def get_nowait(self):
+            frame = super().get_nowait()
+            # the exiting worker takes the free slot before the reader re-signals
+            self.put_nowait(b"")
+            return frame
+
+    source = FFmpegPCMAudio("input", executable=fake_ffmpeg, read_ahead=1)
+    assert len(_read_all(source)) == 10
+    source._read_ahead_thread.join(timeout=5)
+
+    frames = RefilledQueue(maxsize=1)
+    frames.put_nowait(b"")
+    source._frame_queue = frames
+    assert source.read() == b""
+    assert source.read() == b""
+    source.cleanup()
@@ -0,0 +1,156 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import array
+import threading
+import time
+
+import pytest
+
+from discord import ClientException
+from discord.player import (
+    HAS_NUMPY,
+    AudioSource,
+    PCMMixer,
+    _mix_numpy,
+    _mix_python,
+)
+
+FRAME_SIZE = 3840
+SAMPLES = FRAME_SIZE // 2
+
+
+class ConstantSource(AudioSource):
+    def __init__(self, value: int, frames: int = 1000) -> None:
+        self.frame = array.array("h", [value] * SAMPLES).tobytes()
+        self.frames = frames
+        self.cleaned_up = False
+
+    def read(self) -> bytes:
+        if not self.frames:
+            return b""
+        self.frames -= 1
+        return self.frame
+
+    def cleanup(self) -> None:
+        self.cleaned_up = True
+
+
+class OpusSource(AudioSource):
+    def read(self) -> bytes:
+        return b""
+
+    def is_opus(self) -> bool:
+        return True
+
+
+backends = [_mix_python]
+if HAS_NUMPY:
+    backends.append(_mix_numpy)
+
+
+@pytest.fixture(params=backends, ids=lambda f: f.__name__)
+def mixer(request):
+    mixer = PCMMixer(read_ahead=0)
+    mixer._mix = request.param
+    yield mixer
+    mixer.cleanup()
+
+
+def samples(frame: bytes) -> array.array:
+    return array.array("h", frame)
+
+
+def test_sums_and_clips(mixer):
+    mixer.add(ConstantSource(1000))
+    mixer.add(ConstantSource(2000))
+    assert set(samples(mixer.read())) == {3000}
+
+    mixer.add(ConstantSource(30000))
+    assert set(samples(mixer.read())) == {0x7FFF}
+
+
+def test_gain(mixer):
+    mixer.add(ConstantSource(1000), gain=0.5)
+    assert set(samples(mixer.read())) == {500}
+
+
+def test_fade_in_and_out(mixer):
+    source = ConstantSource(10000)
+    mixer_input = mixer.add(source, fade_in=0.1)
+
+    first = samples(mixer.read())
+    assert first[0] == 0
+    assert first[0] < first[-1] < 10000
+    for _ in range(4):
+        mixer.read()
+    assert mixer_input.gain == 1.0
+    assert set(samples(mixer.read())) == {10000}
+
+    mixer_input.remove(fade_out=0.04)
+    mixer.read()
+    assert mixer.inputs == [mixer_input]
+    mixer.read()
+    assert mixer.inputs == []
+    assert source.cleaned_up
+    assert set(samples(mixer.read())) == {0}
+
+
+def test_finished_inputs_are_removed(mixer):
+    mixer.stop_when_empty = True
+    mixer.add(ConstantSource(1000, frames=2))
+    assert mixer.read()
+    assert mixer.read()
+    assert mixer.read() == b""
+
+
+def test_rejects_opus():
+    with pytest.raises(ClientException):
+        PCMMixer().add(OpusSource())
+
+
+def test_slow_input_is_skipped():
+    class BlockingSource(ConstantSource):
+        def __init__(self) -> None:
+            super().__init__(2000)
+            self.unblock = threading.Event()
+
+        def read(self) -> bytes:
+            self.unblock.wait()
+            return super().read()
+
+    mixer = PCMMixer(read_ahead=2)
+    fast = mixer.add(ConstantSource(1000), read_ahead=0)
+    slow = BlockingSource()
+    mixer.add(slow)
+
+    assert set(samples(mixer.read())) == {1000}
+    assert fast.underruns == 0
+
+    slow.unblock.set()
+    deadline = time.monotonic() + 5
+    while not mixer.inputs[1]._frames.full() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert set(samples(mixer.read())) == {3000}
+    mixer.cleanup()
@@ -0,0 +1,110 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import io
+import struct
+
+import pytest
+
+from discord.oggparse import OggError, OggStream
+from discord.player import OggOpusAudio
+
+
+def _build_stream(packets: list[bytes]) -> bytes:
+    segments: list[int] = []
+    for packet in packets:
+        size = len(packet)
+        segments.extend([255] * (size // 255))
+        segments.append(size % 255)
+
+    body = b"".join(packets)
+    out = bytearray()
+    pagenum = offset = 0
+    for i in range(0, len(segments), 255):
+        table = segments[i : i + 255]
+        size = sum(table)
+        out += b"OggS" + struct.pack("<BBQIIIB", 0, 0, 0, 0, pagenum, 0, len(table))
+        out += bytes(table) + body[offset : offset + size]
+        offset += size
+        pagenum += 1
+    return bytes(out)
+
+
+PACKETS = [bytes([i]) * size for i, size in enumerate((3, 255, 600, 70000, 1, 120))]
+
+
+def test_ogg_stream_parses_packets_spanning_pages():
+    data = _build_stream(PACKETS)
+    assert list(OggStream(io.BytesIO(data), buffer_size=64).iter_packets()) == PACKETS
+
+
+def test_ogg_stream_rejects_bad_magic():
+    with pytest.raises(OggError):
+        list(OggStream(io.BytesIO(b"NotS" + bytes(64))).iter_packets())
+
+
+def test_ogg_stream_from_file_yields_views(tmp_path):
+    path = tmp_path / "test.opus"
+    path.write_bytes(_build_stream(PACKETS))
+
+    stream = OggStream.from_file(path)
+    views = list(stream.iter_packet_views())
+    assert all(isinstance(view, memoryview) for view in views)
+    assert [view.tobytes() for view in views] == PACKETS
+    del views
+    stream.close()
+
+
+def test_ogg_stream_pages_match_packets():
+    stream = OggStream(io.BytesIO(_build_stream(PACKETS)), buffer_size=64)
+    pagenums, data = [], bytearray()
+    # pages point into the read buffer, so they are consumed one at a time
+    for page in stream._iter_pages():
+        pagenums.append(page.pagenum)
+        for packet, _ in page.iter_packets():
+            data += packet
+    assert pagenums == list(range(len(pagenums)))
+    assert data == b"".join(PACKETS)
+
+
+def test_ogg_stream_from_empty_file(tmp_path):
+    path = tmp_path / "empty.opus"
+    path.write_bytes(b"")
+
+    stream = OggStream.from_file(path)
+    assert list(stream.iter_packets()) == []
+    stream.close()
+
+
+def test_ogg_opus_audio_skips_headers(tmp_path):
+    path = tmp_path / "test.opus"
+    path.write_bytes(_build_stream([b"OpusHead" + bytes(11), b"OpusTags"] + PACKETS))
+
+    source = OggOpusAudio(path)
+    frames = []
+    while frame := source.read():
+        frames.append(bytes(frame))
+    source.cleanup()
+
+    assert frames == PACKETS
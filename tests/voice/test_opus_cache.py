@@ -0,0 +1,157 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import os
+import subprocess
+import sys
+
+import discord.player as player_module
+from discord.oggparse import OggStream
+from discord.player import FFmpegOpusAudio, OggOpusAudio, OpusCache
+
+from .test_oggparse import _build_stream
+
+PACKETS = [b"OpusHead" + bytes(11), b"OpusTags", b"\x01" * 40, b"\x02" * 60]
+
+
+def _store(cache: OpusCache, key: str, data: bytes) -> None:
+    path = os.path.join(cache.directory, f"{key}.tmp")
+    with open(path, "wb") as f:
+        f.write(data)
+    cache._commit(key, path)
+
+
+def test_opus_cache_evicts_least_recently_used(tmp_path):
+    cache = OpusCache(tmp_path, max_size=250)
+    for key in "abc":
+        _store(cache, key, bytes(100))
+
+    assert "a" not in cache
+    assert cache.size == 200
+
+    assert cache.get("b") is not None
+    _store(cache, "d", bytes(100))
+    assert list(cache._entries) == ["b", "d"]
+    assert cache.hits == 1
+
+    reloaded = OpusCache(tmp_path, max_size=250)
+    assert set(reloaded._entries) == {"b", "d"}
+
+
+def test_opus_cache_records_successful_process_output(tmp_path):
+    cache = OpusCache(tmp_path)
+    data = _build_stream(PACKETS)
+    process = subprocess.Popen(
+        [sys.executable, "-c", f"import sys; sys.stdout.buffer.write({data!r})"],
+        stdout=subprocess.PIPE,
+    )
+    recorder = cache._record("key", process.stdout, process)
+    assert list(OggStream(recorder).iter_packets()) == PACKETS
+    process.stdout.close()
+
+    source = cache.open("key")
+    assert isinstance(source, OggOpusAudio)
+    assert [bytes(source.read()) for _ in range(3)] == [*PACKETS[2:], b""]
+    source.cleanup()
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_opus_cache_discards_failed_process_output(tmp_path):
+    cache = OpusCache(tmp_path)
+    process = subprocess.Popen(
+        [sys.executable, "-c", "import sys; sys.exit(1)"], stdout=subprocess.PIPE
+    )
+    recorder = cache._record("key", process.stdout, process)
+    assert list(OggStream(recorder).iter_packets()) == []
+    process.stdout.close()
+
+    assert "key" not in cache
+    assert os.listdir(tmp_path) == []
+
+
+async def test_from_probe_shares_the_constructor_cache_key(tmp_path, monkeypatch):
+    cache = OpusCache(tmp_path)
+    make_key = FFmpegOpusAudio._cache_key
+    options = dict(before_options=None, options="-vn")
+    # what FFmpegOpusAudio("song.webm", codec="opus", cache=cache) stores under
+    _store(
+        cache,
+        make_key(cache, "song.webm", **options, codec="opus", bitrate=None),
+        _build_stream(PACKETS),
+    )
+    # what FFmpegOpusAudio("song.ogg", cache=cache) stores under
+    _store(
+        cache,
+        make_key(cache, "song.ogg", **options, codec=None, bitrate=None),
+        _build_stream(PACKETS),
+    )
+
+    probed = {"song.webm": ("opus", 160), "song.ogg": ("vorbis", 128)}
+
+    async def probe(source, **kwargs):
+        return probed[source]
+
+    def spawn(*args, **kwargs):
+        raise AssertionError("should not run ffmpeg")
+
+    monkeypatch.setattr(player_module.FFmpegOpusAudio, "probe", probe)
+    monkeypatch.setattr(player_module.FFmpegOpusAudio, "_spawn_process", spawn)
+    for name in probed:
+        source = await FFmpegOpusAudio.from_probe(name, cache=cache, options="-vn")
+        assert isinstance(source, OggOpusAudio)
+        source.cleanup()
+
+
+async def test_from_probe_replays_without_probing(tmp_path, monkeypatch):
+    cache = OpusCache(tmp_path)
+    probes = []
+
+    async def probe(source, **kwargs):
+        probes.append(source)
+        return "vorbis", 96
+
+    def spawn(*args, **kwargs):
+        raise AssertionError("should not run ffmpeg")
+
+    monkeypatch.setattr(player_module.FFmpegOpusAudio, "probe", probe)
+    monkeypatch.setattr(player_module.FFmpegOpusAudio, "_spawn_process", spawn)
+    # what the first from_probe call leaves behind once ffmpeg finishes
+    key = FFmpegOpusAudio._cache_key(
+        cache, "song.ogg", before_options=None, options=None, codec=None, bitrate=96
+    )
+    _store(cache, key, _build_stream(PACKETS))
+    source = await FFmpegOpusAudio.from_probe("song.ogg", cache=cache)
+    source.cleanup()
+    assert probes == ["song.ogg"]
+
+    for reopened in (cache, OpusCache(tmp_path)):
+        source = await FFmpegOpusAudio.from_probe("song.ogg", cache=reopened)
+        assert isinstance(source, OggOpusAudio)
+        source.cleanup()
+    assert probes == ["song.ogg"]
+
+    # the remembered format goes away with its audio
+    cache.remove(key)
+    assert os.listdir(tmp_path) == []
+    assert not cache._formats